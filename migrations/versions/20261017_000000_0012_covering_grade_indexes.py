@@ -0,0 +1,47 @@
+"""Make the grades exam composite indexes covering.
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0012"
+down_revision: Union[str, None] = "0011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Recreate the exam composite indexes with INCLUDE columns.
+
+    The statistics, weighted average and per-competitor reads select only
+    score plus the other id column, so they become index-only scans.
+    Uniqueness stays with the partial indexes from migration 0010.
+    """
+    op.drop_index("ix_grades_exam_competitor", table_name="grades")
+    op.create_index(
+        "ix_grades_exam_competitor",
+        "grades",
+        ["exam_id", "competitor_id"],
+        postgresql_include=["score", "competence_id"],
+    )
+    op.drop_index("ix_grades_exam_competence", table_name="grades")
+    op.create_index(
+        "ix_grades_exam_competence",
+        "grades",
+        ["exam_id", "competence_id"],
+        postgresql_include=["score", "competitor_id"],
+    )
+
+
+def downgrade() -> None:
+    """Restore the plain composite indexes."""
+    op.drop_index("ix_grades_exam_competence", table_name="grades")
+    op.create_index("ix_grades_exam_competence", "grades", ["exam_id", "competence_id"])
+    op.drop_index("ix_grades_exam_competitor", table_name="grades")
+    op.create_index("ix_grades_exam_competitor", "grades", ["exam_id", "competitor_id"])
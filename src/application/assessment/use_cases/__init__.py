@@ -4,7 +4,10 @@ from src.application.assessment.use_cases.calculate_average import CalculateAver
 from src.application.assessment.use_cases.create_exam import CreateExamUseCase
 from src.application.assessment.use_cases.get_competitor_grades import GetCompetitorGradesUseCase
 from src.application.assessment.use_cases.get_exam import GetExamUseCase
-from src.application.assessment.use_cases.get_exam_statistics import GetExamStatisticsUseCase
+from src.application.assessment.use_cases.get_exam_statistics import (
+    GetExamStatisticsUseCase,
+    invalidate_exam_statistics,
+)
 from src.application.assessment.use_cases.get_grade_history import GetGradeHistoryUseCase
 from src.application.assessment.use_cases.list_exams import ListExamsUseCase
 from src.application.assessment.use_cases.register_grade import RegisterGradeUseCase
@@ -22,4 +25,5 @@ __all__ = [
     "CalculateAverageUseCase",
     "GetGradeHistoryUseCase",
     "GetExamStatisticsUseCase",
+    "invalidate_exam_statistics",
 ]
@@ -9,7 +9,26 @@ from src.application.assessment.dtos.statistics_dto import (
 from src.domain.assessment.exceptions import ExamNotFoundException
 from src.domain.assessment.repositories.exam_repository import ExamRepository
 from src.domain.assessment.repositories.grade_repository import GradeRepository
-from src.domain.assessment.services.grade_calculation_service import GradeCalculationService
+from src.domain.assessment.services.grade_calculation_service import (
+    ExamStatistics,
+    GradeCalculationService,
+)
+from src.shared.utils.cache import TTLCache
+
+# Shared across requests. The grade and exam write endpoints and the user and
+# competitor deletes (which cascade to grades) invalidate entries after
+# committing. Any other path that changes grades, and writes in other worker
+# processes, are only bounded by the 60s TTL.
+_exam_statistics_cache: TTLCache[UUID, ExamStatistics] = TTLCache(maxsize=1024, ttl=60)
+
+
+def invalidate_exam_statistics(exam_id: UUID) -> None:
+    """Drop cached statistics for an exam after its grades change.
+
+    Args:
+        exam_id: ID of the exam whose grades or competences changed.
+    """
+    _exam_statistics_cache.invalidate(exam_id)
 
 
 class GetExamStatisticsUseCase:
@@ -28,6 +47,7 @@ class GetExamStatisticsUseCase:
         self._calculation_service = GradeCalculationService(
             grade_repository=grade_repository,
             exam_repository=exam_repository,
+            cache=_exam_statistics_cache,
         )
 
     async def execute(
@@ -1,7 +1,9 @@
 """Badge and Achievement DTOs."""
 
+from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Any
 from uuid import UUID
 
 from src.domain.extras.entities.badge import Achievement, Badge, UserPoints
@@ -32,7 +34,7 @@ class BadgeDTO:
     rarity: str
     icon_url: str | None
     points: int
-    criteria: dict
+    criteria: Mapping[str, Any]
     is_active: bool
     created_at: datetime
 
@@ -63,7 +65,7 @@ class AchievementDTO:
     earned_at: datetime
     progress: float
     is_complete: bool
-    metadata: dict
+    metadata: Mapping[str, Any]
     badge: BadgeDTO | None = None
 
     @classmethod
@@ -77,7 +77,7 @@ class EventDTO:
             created_by=entity.created_by,
             created_at=entity.created_at,
             updated_at=entity.updated_at,
-            participants=entity.participants,
+            participants=list(entity.participants),
             duration_minutes=entity.duration_minutes,
         )
 
@@ -73,3 +73,4 @@ class FeedbackListDTO:
     feedbacks: list[FeedbackDTO]
     total: int
     unread_count: int
+    next_cursor: str | None = None
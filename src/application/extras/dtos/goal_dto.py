@@ -33,7 +33,7 @@ class MilestoneDTO:
     is_overdue: bool
 
     @classmethod
-    def from_entity(cls, entity: Milestone) -> "MilestoneDTO":
+    def from_entity(cls, entity: Milestone, today: date | None = None) -> "MilestoneDTO":
         return cls(
             id=entity.id,
             goal_id=entity.goal_id,
@@ -44,7 +44,7 @@ class MilestoneDTO:
             is_completed=entity.is_completed,
             completed_at=entity.completed_at,
             progress_percentage=entity.progress_percentage,
-            is_overdue=entity.is_overdue,
+            is_overdue=entity.is_overdue_on(today or date.today()),
         )
 
 
@@ -104,7 +104,8 @@ class GoalDTO:
     updated_at: datetime
 
     @classmethod
-    def from_entity(cls, entity: Goal) -> "GoalDTO":
+    def from_entity(cls, entity: Goal, today: date | None = None) -> "GoalDTO":
+        today = today or date.today()
         return cls(
             id=entity.id,
             title=entity.title,
@@ -120,10 +121,10 @@ class GoalDTO:
             modality_id=entity.modality_id,
             competence_id=entity.competence_id,
             progress_percentage=entity.progress_percentage,
-            is_overdue=entity.is_overdue,
-            days_remaining=entity.days_remaining,
-            needs_alert=entity.needs_alert(),
-            milestones=[MilestoneDTO.from_entity(m) for m in entity.milestones],
+            is_overdue=entity.is_overdue_on(today),
+            days_remaining=entity.days_remaining_on(today),
+            needs_alert=entity.needs_alert(today=today),
+            milestones=[MilestoneDTO.from_entity(m, today) for m in entity.milestones],
             completed_milestones=entity.completed_milestones,
             created_by=entity.created_by,
             created_at=entity.created_at,
@@ -138,3 +139,4 @@ class GoalListDTO:
     goals: list[GoalDTO]
     total: int
     overdue_count: int
+    next_cursor: str | None = None
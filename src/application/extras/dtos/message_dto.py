@@ -107,6 +107,7 @@ class ConversationListDTO:
     conversations: list[ConversationDTO]
     total: int
     total_unread: int
+    next_cursor: str | None = None
 
 
 @dataclass
@@ -116,3 +117,4 @@ class MessageListDTO:
     messages: list[MessageDTO]
     total: int
     has_more: bool
+    next_cursor: str | None = None
@@ -68,3 +68,4 @@ class NotificationListDTO:
     notifications: list[NotificationDTO]
     total: int
     unread_count: int
+    next_cursor: str | None = None
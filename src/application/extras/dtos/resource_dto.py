@@ -69,7 +69,7 @@ class ResourceDTO:
             mime_type=entity.mime_type,
             modality_id=entity.modality_id,
             access_level=entity.access_level.value,
-            tags=entity.tags,
+            tags=list(entity.tags),
             is_active=entity.is_active,
             view_count=entity.view_count,
             download_count=entity.download_count,
@@ -85,3 +85,4 @@ class ResourceListDTO:
 
     resources: list[ResourceDTO]
     total: int
+    next_cursor: str | None = None
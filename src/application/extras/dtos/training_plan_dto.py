@@ -42,7 +42,7 @@ class PlanItemDTO:
     is_overdue: bool
 
     @classmethod
-    def from_entity(cls, entity: PlanItem) -> "PlanItemDTO":
+    def from_entity(cls, entity: PlanItem, today: date | None = None) -> "PlanItemDTO":
         return cls(
             id=entity.id,
             plan_id=entity.plan_id,
@@ -56,8 +56,8 @@ class PlanItemDTO:
             completed_at=entity.completed_at,
             due_date=entity.due_date,
             notes=entity.notes,
-            resource_ids=entity.resource_ids,
-            is_overdue=entity.is_overdue,
+            resource_ids=list(entity.resource_ids),
+            is_overdue=entity.is_overdue_on(today or date.today()),
         )
 
 
@@ -115,7 +115,8 @@ class TrainingPlanDTO:
     updated_at: datetime
 
     @classmethod
-    def from_entity(cls, entity: TrainingPlan) -> "TrainingPlanDTO":
+    def from_entity(cls, entity: TrainingPlan, today: date | None = None) -> "TrainingPlanDTO":
+        today = today or date.today()
         return cls(
             id=entity.id,
             title=entity.title,
@@ -132,9 +133,9 @@ class TrainingPlanDTO:
             completed_hours=entity.completed_hours,
             progress_percentage=entity.progress_percentage,
             required_items_completed=entity.required_items_completed,
-            is_overdue=entity.is_overdue,
-            items=[PlanItemDTO.from_entity(item) for item in entity.items],
-            overdue_items_count=len(entity.get_overdue_items()),
+            is_overdue=entity.is_overdue_on(today),
+            items=[PlanItemDTO.from_entity(item, today) for item in entity.items],
+            overdue_items_count=len(entity.get_overdue_items(today)),
             created_by=entity.created_by,
             created_at=entity.created_at,
             updated_at=entity.updated_at,
@@ -148,3 +149,4 @@ class TrainingPlanListDTO:
     plans: list[TrainingPlanDTO]
     total: int
     active_count: int
+    next_cursor: str | None = None
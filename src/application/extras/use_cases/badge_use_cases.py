@@ -10,15 +10,13 @@ from src.application.extras.dtos.badge_dto import (
     UserPointsDTO,
 )
 from src.domain.extras.entities.badge import Achievement, UserPoints
-from src.domain.extras.exceptions import (
-    BadgeAlreadyEarnedException,
-    BadgeNotFoundException,
-)
+from src.domain.extras.exceptions import BadgeAlreadyEarnedException, BadgeNotFoundException
 from src.domain.extras.repositories.badge_repository import (
     AchievementRepository,
     BadgeRepository,
 )
 from src.shared.constants.enums import BadgeCategory, BadgeRarity
+from src.shared.domain.pagination import paginated
 
 
 class AwardBadgeUseCase:
@@ -55,9 +53,7 @@ class AwardBadgeUseCase:
             BadgeAlreadyEarnedException: If user already has badge.
         """
         # Check badge exists
-        badge = await self._badge_repository.get_by_id(badge_id)
-        if not badge:
-            raise BadgeNotFoundException(str(badge_id))
+        badge = await self._badge_repository.get_or_raise(badge_id)
 
         # Check if already earned
         if await self._achievement_repository.has_badge(user_id, badge_id):
@@ -84,6 +80,53 @@ class AwardBadgeUseCase:
 
         return AchievementDTO.from_entity(saved, badge)
 
+    async def award_many(
+        self,
+        user_id: UUID,
+        badge_ids: list[UUID],
+        competitor_id: UUID | None = None,
+    ) -> list[AchievementDTO]:
+        """Award every badge the user has not earned yet.
+
+        Args:
+            user_id: User UUID.
+            badge_ids: Candidate badge UUIDs.
+            competitor_id: Optional competitor UUID.
+
+        Returns:
+            DTOs of the newly created achievements.
+
+        Raises:
+            BadgeNotFoundException: If a badge does not exist.
+        """
+        candidates = list(dict.fromkeys(badge_ids))
+        badges = await self._badge_repository.get_by_ids(candidates)
+        for badge_id in candidates:
+            if badge_id not in badges:
+                raise BadgeNotFoundException(str(badge_id))
+
+        earned = await self._achievement_repository.has_badges(user_id, candidates)
+        new_badges = [badges[b] for b in candidates if b not in earned]
+        if not new_badges:
+            return []
+
+        saved = await self._achievement_repository.save_many(
+            [
+                Achievement(badge_id=b.id, user_id=user_id, competitor_id=competitor_id)
+                for b in new_badges
+            ]
+        )
+
+        user_points = await self._achievement_repository.get_user_points(user_id)
+        if not user_points:
+            user_points = UserPoints(user_id=user_id)
+        for badge in new_badges:
+            user_points.add_points(badge.points)
+            user_points.increment_badges()
+        await self._achievement_repository.save_user_points(user_points)
+
+        return [AchievementDTO.from_entity(a, badges[a.badge_id]) for a in saved]
+
 
 class ListBadgesUseCase:
     """Use case for listing badges."""
@@ -137,12 +180,11 @@ class ListBadgesUseCase:
         )
 
         # Get badges for achievements
-        result = []
-        for achievement in achievements:
-            badge = await self._badge_repository.get_by_id(achievement.badge_id)
-            result.append(AchievementDTO.from_entity(achievement, badge))
+        badges = await self._badge_repository.get_by_ids(
+            list({a.badge_id: None for a in achievements})
+        )
 
-        return result
+        return [AchievementDTO.from_entity(a, badges.get(a.badge_id)) for a in achievements]
 
     async def get_user_points(self, user_id: UUID) -> UserPointsDTO:
         """Get user points.
@@ -169,6 +211,7 @@ class GetLeaderboardUseCase:
     ) -> None:
         self._achievement_repository = achievement_repository
 
+    @paginated()
     async def execute(
         self,
         modality_id: UUID | None = None,
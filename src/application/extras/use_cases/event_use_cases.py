@@ -10,8 +10,8 @@ from src.application.extras.dtos.event_dto import (
     UpdateEventDTO,
 )
 from src.domain.extras.entities.event import Event
-from src.domain.extras.exceptions import EventNotFoundException
 from src.domain.extras.repositories.event_repository import EventRepository
+from src.shared.domain.pagination import paginated
 
 
 class CreateEventUseCase:
@@ -93,6 +93,7 @@ class ListEventsUseCase:
             total=len(events),
         )
 
+    @paginated()
     async def get_upcoming(
         self,
         user_id: UUID | None = None,
@@ -144,9 +145,7 @@ class UpdateEventUseCase:
         Raises:
             EventNotFoundException: If event not found.
         """
-        event = await self._event_repository.get_by_id(event_id)
-        if not event:
-            raise EventNotFoundException(str(event_id))
+        event = await self._event_repository.get_or_raise(event_id)
 
         event.update(
             title=dto.title,
@@ -169,9 +168,7 @@ class UpdateEventUseCase:
         Returns:
             Updated event DTO.
         """
-        event = await self._event_repository.get_by_id(event_id)
-        if not event:
-            raise EventNotFoundException(str(event_id))
+        event = await self._event_repository.get_or_raise(event_id)
 
         event.cancel()
         saved = await self._event_repository.update(event)
@@ -179,8 +176,32 @@ class UpdateEventUseCase:
 
     async def add_participant(self, event_id: UUID, user_id: UUID) -> bool:
         """Add a participant to an event."""
-        return await self._event_repository.add_participant(event_id, user_id)
+        return await self._event_repository.add_participants(event_id, [user_id]) > 0
+
+    async def add_participants(self, event_id: UUID, user_ids: list[UUID]) -> int:
+        """Add several participants to an event.
+
+        Args:
+            event_id: Event UUID.
+            user_ids: Users to add; current participants are skipped.
+
+        Returns:
+            Number of participants added.
+        """
+        return await self._event_repository.add_participants(event_id, user_ids)
 
     async def remove_participant(self, event_id: UUID, user_id: UUID) -> bool:
         """Remove a participant from an event."""
-        return await self._event_repository.remove_participant(event_id, user_id)
+        return await self._event_repository.remove_participants(event_id, [user_id]) > 0
+
+    async def remove_participants(self, event_id: UUID, user_ids: list[UUID]) -> int:
+        """Remove several participants from an event.
+
+        Args:
+            event_id: Event UUID.
+            user_ids: Users to remove.
+
+        Returns:
+            Number of participants removed.
+        """
+        return await self._event_repository.remove_participants(event_id, user_ids)
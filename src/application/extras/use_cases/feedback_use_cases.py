@@ -12,6 +12,8 @@ from src.domain.extras.entities.feedback import Feedback
 from src.domain.extras.exceptions import FeedbackNotFoundException
 from src.domain.extras.repositories.feedback_repository import FeedbackRepository
 from src.shared.constants.enums import FeedbackType
+from src.shared.constants.pagination import UNREAD_COUNT_CAP
+from src.shared.domain.pagination import paginated
 
 
 class CreateFeedbackUseCase:
@@ -89,12 +91,13 @@ class ListFeedbackUseCase:
     def __init__(self, feedback_repository: FeedbackRepository) -> None:
         self._feedback_repository = feedback_repository
 
+    @paginated()
     async def execute(
         self,
         competitor_id: UUID,
         feedback_type: FeedbackType | None = None,
         is_read: bool | None = None,
-        skip: int = 0,
+        cursor: str | None = None,
         limit: int = 50,
     ) -> FeedbackListDTO:
         """List feedback for a competitor.
@@ -103,53 +106,57 @@ class ListFeedbackUseCase:
             competitor_id: Competitor UUID.
             feedback_type: Optional feedback type filter.
             is_read: Optional read status filter.
-            skip: Number of items to skip.
+            cursor: Cursor returned with the previous page.
             limit: Maximum items to return.
 
         Returns:
             Feedback list DTO.
         """
-        feedbacks = await self._feedback_repository.get_by_competitor(
+        page = await self._feedback_repository.get_by_competitor(
             competitor_id=competitor_id,
             feedback_type=feedback_type,
             is_read=is_read,
-            skip=skip,
+            cursor=cursor,
             limit=limit,
         )
 
-        unread_count = await self._feedback_repository.get_unread_count(competitor_id)
+        unread_count = await self._feedback_repository.get_unread_count(
+            competitor_id, cap=UNREAD_COUNT_CAP
+        )
 
         return FeedbackListDTO(
-            feedbacks=[FeedbackDTO.from_entity(f) for f in feedbacks],
-            total=len(feedbacks),
+            feedbacks=[FeedbackDTO.from_entity(f) for f in page.items],
+            total=len(page.items),
             unread_count=unread_count,
+            next_cursor=page.next_cursor,
         )
 
+    @paginated()
     async def get_by_evaluator(
         self,
         evaluator_id: UUID,
         competitor_id: UUID | None = None,
-        skip: int = 0,
+        cursor: str | None = None,
         limit: int = 50,
     ) -> FeedbackListDTO:
         """List feedback given by an evaluator."""
-        feedbacks = await self._feedback_repository.get_by_evaluator(
+        page = await self._feedback_repository.get_by_evaluator(
             evaluator_id=evaluator_id,
             competitor_id=competitor_id,
-            skip=skip,
+            cursor=cursor,
             limit=limit,
         )
 
         return FeedbackListDTO(
-            feedbacks=[FeedbackDTO.from_entity(f) for f in feedbacks],
-            total=len(feedbacks),
+            feedbacks=[FeedbackDTO.from_entity(f) for f in page.items],
+            total=len(page.items),
             unread_count=0,
+            next_cursor=page.next_cursor,
         )
 
     async def mark_as_read(self, feedback_id: UUID) -> bool:
         """Mark feedback as read."""
-        feedback = await self._feedback_repository.get_by_id(feedback_id)
-        if not feedback:
+        if not await self._feedback_repository.mark_as_read(feedback_id):
             raise FeedbackNotFoundException(str(feedback_id))
 
-        return await self._feedback_repository.mark_as_read(feedback_id)
+        return True
@@ -1,5 +1,6 @@
 """Goal use cases."""
 
+from datetime import date
 from uuid import UUID
 
 from src.application.extras.dtos.goal_dto import (
@@ -9,9 +10,12 @@ from src.application.extras.dtos.goal_dto import (
     MilestoneDTO,
 )
 from src.domain.extras.entities.goal import Goal, Milestone
-from src.domain.extras.exceptions import GoalNotFoundException, MilestoneNotFoundException
+from src.domain.extras.exceptions import MilestoneNotFoundException
 from src.domain.extras.repositories.goal_repository import GoalRepository
 from src.shared.constants.enums import GoalStatus
+from src.shared.domain.pagination import paginated
+
+_WITH_MILESTONES = frozenset({"milestones"})
 
 
 class CreateGoalUseCase:
@@ -69,12 +73,13 @@ class ListGoalsUseCase:
     def __init__(self, goal_repository: GoalRepository) -> None:
         self._goal_repository = goal_repository
 
+    @paginated()
     async def execute(
         self,
         competitor_id: UUID,
         status: GoalStatus | None = None,
         modality_id: UUID | None = None,
-        skip: int = 0,
+        cursor: str | None = None,
         limit: int = 50,
     ) -> GoalListDTO:
         """List goals for a competitor.
@@ -83,18 +88,19 @@ class ListGoalsUseCase:
             competitor_id: Competitor UUID.
             status: Optional status filter.
             modality_id: Optional modality filter.
-            skip: Number of items to skip.
+            cursor: Cursor returned with the previous page.
             limit: Maximum items to return.
 
         Returns:
             Goal list DTO.
         """
-        goals = await self._goal_repository.get_by_competitor(
+        page = await self._goal_repository.get_by_competitor(
             competitor_id=competitor_id,
             status=status,
             modality_id=modality_id,
-            skip=skip,
+            cursor=cursor,
             limit=limit,
+            include=_WITH_MILESTONES,
         )
 
         overdue = await self._goal_repository.get_overdue(
@@ -102,10 +108,12 @@ class ListGoalsUseCase:
             modality_id=modality_id,
         )
 
+        today = date.today()
         return GoalListDTO(
-            goals=[GoalDTO.from_entity(g) for g in goals],
-            total=len(goals),
+            goals=[GoalDTO.from_entity(g, today) for g in page.items],
+            total=len(page.items),
             overdue_count=len(overdue),
+            next_cursor=page.next_cursor,
         )
 
 
@@ -132,9 +140,7 @@ class UpdateGoalProgressUseCase:
         Raises:
             GoalNotFoundException: If goal not found.
         """
-        goal = await self._goal_repository.get_by_id(goal_id)
-        if not goal:
-            raise GoalNotFoundException(str(goal_id))
+        goal = await self._goal_repository.get_or_raise(goal_id)
 
         goal.update_progress(current_value)
         saved = await self._goal_repository.update(goal)
@@ -164,9 +170,7 @@ class UpdateGoalProgressUseCase:
 
     async def complete_goal(self, goal_id: UUID) -> GoalDTO:
         """Mark goal as completed."""
-        goal = await self._goal_repository.get_by_id(goal_id)
-        if not goal:
-            raise GoalNotFoundException(str(goal_id))
+        goal = await self._goal_repository.get_or_raise(goal_id)
 
         goal.complete()
         saved = await self._goal_repository.update(goal)
@@ -192,7 +196,8 @@ class CheckGoalAlertsUseCase:
             days_threshold=days_threshold,
         )
 
-        return [GoalDTO.from_entity(g) for g in goals]
+        today = date.today()
+        return [GoalDTO.from_entity(g, today) for g in goals]
 
     async def get_overdue(
         self,
@@ -205,4 +210,5 @@ class CheckGoalAlertsUseCase:
             modality_id=modality_id,
         )
 
-        return [GoalDTO.from_entity(g) for g in goals]
+        today = date.today()
+        return [GoalDTO.from_entity(g, today) for g in goals]
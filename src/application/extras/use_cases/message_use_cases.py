@@ -11,14 +11,12 @@ from src.application.extras.dtos.message_dto import (
     MessageListDTO,
 )
 from src.domain.extras.entities.message import Conversation, Message
-from src.domain.extras.exceptions import (
-    ConversationNotFoundException,
-    NotConversationParticipantException,
-)
+from src.domain.extras.exceptions import NotConversationParticipantException
 from src.domain.extras.repositories.message_repository import (
     ConversationRepository,
     MessageRepository,
 )
+from src.shared.domain.pagination import paginated
 
 
 class SendMessageUseCase:
@@ -51,9 +49,7 @@ class SendMessageUseCase:
             NotConversationParticipantException: If sender not a participant.
         """
         # Get conversation
-        conversation = await self._conversation_repository.get_by_id(dto.conversation_id)
-        if not conversation:
-            raise ConversationNotFoundException(str(dto.conversation_id))
+        conversation = await self._conversation_repository.get_or_raise(dto.conversation_id)
 
         # Check if sender is a participant
         if not conversation.is_participant(sender_id):
@@ -138,39 +134,41 @@ class ListConversationsUseCase:
         self._conversation_repository = conversation_repository
         self._message_repository = message_repository
 
+    @paginated()
     async def execute(
         self,
         user_id: UUID,
-        skip: int = 0,
+        cursor: str | None = None,
         limit: int = 50,
     ) -> ConversationListDTO:
         """List conversations for a user.
 
         Args:
             user_id: User UUID.
-            skip: Number of items to skip.
+            cursor: Cursor returned with the previous page.
             limit: Maximum items to return.
 
         Returns:
             Conversation list DTO.
         """
-        conversations = await self._conversation_repository.get_by_user(
+        page = await self._conversation_repository.get_by_user(
             user_id=user_id,
-            skip=skip,
+            cursor=cursor,
             limit=limit,
         )
 
         total_unread = 0
         result = []
-        for conv in conversations:
+        for conv in page.items:
             unread = conv.get_unread_count(user_id)
             total_unread += unread
             result.append(ConversationDTO.from_entity(conv, user_id))
 
         return ConversationListDTO(
             conversations=result,
-            total=len(conversations),
+            total=len(result),
             total_unread=total_unread,
+            next_cursor=page.next_cursor,
         )
 
 
@@ -185,22 +183,21 @@ class ListMessagesUseCase:
         self._conversation_repository = conversation_repository
         self._message_repository = message_repository
 
+    @paginated()
     async def execute(
         self,
         user_id: UUID,
         conversation_id: UUID,
-        skip: int = 0,
+        cursor: str | None = None,
         limit: int = 50,
-        before_id: UUID | None = None,
     ) -> MessageListDTO:
         """List messages in a conversation.
 
         Args:
             user_id: User UUID (for validation).
             conversation_id: Conversation UUID.
-            skip: Number of items to skip.
+            cursor: Cursor returned with the previous page.
             limit: Maximum items to return.
-            before_id: Get messages before this ID.
 
         Returns:
             Message list DTO.
@@ -210,26 +207,19 @@ class ListMessagesUseCase:
             NotConversationParticipantException: If user not a participant.
         """
         # Get conversation
-        conversation = await self._conversation_repository.get_by_id(conversation_id)
-        if not conversation:
-            raise ConversationNotFoundException(str(conversation_id))
+        conversation = await self._conversation_repository.get_or_raise(conversation_id)
 
         # Check if user is a participant
         if not conversation.is_participant(user_id):
             raise NotConversationParticipantException(str(user_id), str(conversation_id))
 
         # Get messages
-        messages = await self._message_repository.get_by_conversation(
+        page = await self._message_repository.get_by_conversation(
             conversation_id=conversation_id,
-            skip=skip,
-            limit=limit + 1,  # Get one extra to check if there's more
-            before_id=before_id,
+            cursor=cursor,
+            limit=limit,
         )
 
-        has_more = len(messages) > limit
-        if has_more:
-            messages = messages[:limit]
-
         # Mark as read
         await self._message_repository.mark_conversation_as_read(
             conversation_id=conversation_id,
@@ -241,7 +231,8 @@ class ListMessagesUseCase:
         await self._conversation_repository.update(conversation)
 
         return MessageListDTO(
-            messages=[MessageDTO.from_entity(m) for m in messages],
-            total=len(messages),
-            has_more=has_more,
+            messages=[MessageDTO.from_entity(m) for m in page.items],
+            total=len(page.items),
+            has_more=page.next_cursor is not None,
+            next_cursor=page.next_cursor,
         )
@@ -11,6 +11,26 @@ from src.domain.extras.entities.notification import Notification
 from src.domain.extras.exceptions import NotificationNotFoundException
 from src.domain.extras.repositories.notification_repository import NotificationRepository
 from src.shared.constants.enums import NotificationStatus, NotificationType
+from src.shared.constants.pagination import UNREAD_COUNT_CAP
+from src.shared.domain.pagination import paginated
+
+
+def _build_notification(dto: CreateNotificationDTO) -> Notification:
+    """Create a sent notification entity from its DTO."""
+    notification = Notification(
+        user_id=dto.user_id,
+        title=dto.title,
+        message=dto.message,
+        notification_type=dto.notification_type,
+        channel=dto.channel,
+        related_entity_type=dto.related_entity_type,
+        related_entity_id=dto.related_entity_id,
+        action_url=dto.action_url,
+    )
+
+    # Mark as sent for in-app notifications
+    notification.mark_as_sent()
+    return notification
 
 
 class SendNotificationUseCase:
@@ -28,22 +48,21 @@ class SendNotificationUseCase:
         Returns:
             Created notification DTO.
         """
-        notification = Notification(
-            user_id=dto.user_id,
-            title=dto.title,
-            message=dto.message,
-            notification_type=dto.notification_type,
-            channel=dto.channel,
-            related_entity_type=dto.related_entity_type,
-            related_entity_id=dto.related_entity_id,
-            action_url=dto.action_url,
-        )
+        saved = await self._notification_repository.save(_build_notification(dto))
+        return NotificationDTO.from_entity(saved)
 
-        # Mark as sent for in-app notifications
-        notification.mark_as_sent()
+    async def execute_many(self, dtos: list[CreateNotificationDTO]) -> list[NotificationDTO]:
+        """Send a batch of notifications, e.g. fanning out one event to many users.
 
-        saved = await self._notification_repository.save(notification)
-        return NotificationDTO.from_entity(saved)
+        Args:
+            dtos: Notification data, one per recipient.
+
+        Returns:
+            Created notification DTOs.
+        """
+        notifications = [_build_notification(d) for d in dtos]
+        saved = await self._notification_repository.save_many(notifications)
+        return [NotificationDTO.from_entity(n) for n in saved]
 
     async def send_info(
         self,
@@ -103,11 +122,12 @@ class ListNotificationsUseCase:
     def __init__(self, notification_repository: NotificationRepository) -> None:
         self._notification_repository = notification_repository
 
+    @paginated()
     async def execute(
         self,
         user_id: UUID,
         status: NotificationStatus | None = None,
-        skip: int = 0,
+        cursor: str | None = None,
         limit: int = 50,
     ) -> NotificationListDTO:
         """List notifications for a user.
@@ -115,25 +135,28 @@ class ListNotificationsUseCase:
         Args:
             user_id: User UUID.
             status: Optional status filter.
-            skip: Number of items to skip.
+            cursor: Cursor returned with the previous page.
             limit: Maximum items to return.
 
         Returns:
             Notification list DTO.
         """
-        notifications = await self._notification_repository.get_by_user(
+        page = await self._notification_repository.get_by_user(
             user_id=user_id,
             status=status,
-            skip=skip,
+            cursor=cursor,
             limit=limit,
         )
 
-        unread_count = await self._notification_repository.count_unread(user_id)
+        unread_count = await self._notification_repository.count_unread(
+            user_id, cap=UNREAD_COUNT_CAP
+        )
 
         return NotificationListDTO(
-            notifications=[NotificationDTO.from_entity(n) for n in notifications],
-            total=len(notifications),
+            notifications=[NotificationDTO.from_entity(n) for n in page.items],
+            total=len(page.items),
             unread_count=unread_count,
+            next_cursor=page.next_cursor,
         )
 
 
@@ -155,11 +178,10 @@ class MarkNotificationReadUseCase:
         Raises:
             NotificationNotFoundException: If notification not found.
         """
-        notification = await self._notification_repository.get_by_id(notification_id)
-        if not notification:
+        if not await self._notification_repository.mark_as_read(notification_id):
             raise NotificationNotFoundException(str(notification_id))
 
-        return await self._notification_repository.mark_as_read(notification_id)
+        return True
 
     async def mark_all_read(self, user_id: UUID) -> int:
         """Mark all notifications as read for a user.
@@ -8,9 +8,10 @@ from src.application.extras.dtos.resource_dto import (
     ResourceListDTO,
 )
 from src.domain.extras.entities.resource import Resource
-from src.domain.extras.exceptions import ResourceAccessDeniedException, ResourceNotFoundException
+from src.domain.extras.exceptions import ResourceAccessDeniedException
 from src.domain.extras.repositories.resource_repository import ResourceRepository
 from src.shared.constants.enums import ResourceType
+from src.shared.domain.pagination import paginated
 
 
 class CreateResourceUseCase:
@@ -57,11 +58,12 @@ class ListResourcesUseCase:
     def __init__(self, resource_repository: ResourceRepository) -> None:
         self._resource_repository = resource_repository
 
+    @paginated()
     async def execute(
         self,
         modality_id: UUID | None = None,
         resource_type: ResourceType | None = None,
-        skip: int = 0,
+        cursor: str | None = None,
         limit: int = 50,
     ) -> ResourceListDTO:
         """List resources.
@@ -69,55 +71,59 @@ class ListResourcesUseCase:
         Args:
             modality_id: Optional modality filter.
             resource_type: Optional resource type filter.
-            skip: Number of items to skip.
+            cursor: Cursor returned with the previous page.
             limit: Maximum items to return.
 
         Returns:
             Resource list DTO.
         """
         if modality_id:
-            resources = await self._resource_repository.get_by_modality(
+            page = await self._resource_repository.get_by_modality(
                 modality_id=modality_id,
                 resource_type=resource_type,
-                skip=skip,
+                cursor=cursor,
                 limit=limit,
             )
         else:
-            resources = await self._resource_repository.get_public(
+            page = await self._resource_repository.get_public(
                 resource_type=resource_type,
-                skip=skip,
+                cursor=cursor,
                 limit=limit,
             )
 
         return ResourceListDTO(
-            resources=[ResourceDTO.from_entity(r) for r in resources],
-            total=len(resources),
+            resources=[ResourceDTO.from_entity(r) for r in page.items],
+            total=len(page.items),
+            next_cursor=page.next_cursor,
         )
 
+    @paginated()
     async def search(
         self,
         query: str,
         modality_id: UUID | None = None,
         resource_type: ResourceType | None = None,
         tags: list[str] | None = None,
-        skip: int = 0,
+        cursor: str | None = None,
         limit: int = 50,
     ) -> ResourceListDTO:
         """Search resources."""
-        resources = await self._resource_repository.search(
+        page = await self._resource_repository.search(
             query=query,
             modality_id=modality_id,
             resource_type=resource_type,
             tags=tags,
-            skip=skip,
+            cursor=cursor,
             limit=limit,
         )
 
         return ResourceListDTO(
-            resources=[ResourceDTO.from_entity(r) for r in resources],
-            total=len(resources),
+            resources=[ResourceDTO.from_entity(r) for r in page.items],
+            total=len(page.items),
+            next_cursor=page.next_cursor,
         )
 
+    @paginated()
     async def get_popular(
         self,
         modality_id: UUID | None = None,
@@ -163,9 +169,7 @@ class GetResourceUseCase:
             ResourceNotFoundException: If resource not found.
             ResourceAccessDeniedException: If access denied.
         """
-        resource = await self._resource_repository.get_by_id(resource_id)
-        if not resource:
-            raise ResourceNotFoundException(str(resource_id))
+        resource = await self._resource_repository.get_or_raise(resource_id)
 
         # Check access
         if not resource.can_access(user_modality_id, is_admin):
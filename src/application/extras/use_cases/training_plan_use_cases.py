@@ -1,5 +1,6 @@
 """Training Plan use cases."""
 
+from datetime import date
 from uuid import UUID
 
 from src.application.extras.dtos.training_plan_dto import (
@@ -9,12 +10,12 @@ from src.application.extras.dtos.training_plan_dto import (
     TrainingPlanListDTO,
 )
 from src.domain.extras.entities.training_plan import PlanItem, TrainingPlan
-from src.domain.extras.exceptions import (
-    PlanItemNotFoundException,
-    TrainingPlanNotFoundException,
-)
+from src.domain.extras.exceptions import PlanItemNotFoundException
 from src.domain.extras.repositories.training_plan_repository import TrainingPlanRepository
 from src.shared.constants.enums import TrainingPlanStatus
+from src.shared.domain.pagination import paginated
+
+_WITH_ITEMS = frozenset({"items"})
 
 
 class CreateTrainingPlanUseCase:
@@ -96,12 +97,13 @@ class ListTrainingPlansUseCase:
     def __init__(self, plan_repository: TrainingPlanRepository) -> None:
         self._plan_repository = plan_repository
 
+    @paginated()
     async def execute(
         self,
         competitor_id: UUID,
         status: TrainingPlanStatus | None = None,
         modality_id: UUID | None = None,
-        skip: int = 0,
+        cursor: str | None = None,
         limit: int = 50,
     ) -> TrainingPlanListDTO:
         """List training plans for a competitor.
@@ -110,18 +112,19 @@ class ListTrainingPlansUseCase:
             competitor_id: Competitor UUID.
             status: Optional status filter.
             modality_id: Optional modality filter.
-            skip: Number of items to skip.
+            cursor: Cursor returned with the previous page.
             limit: Maximum items to return.
 
         Returns:
             Training plan list DTO.
         """
-        plans = await self._plan_repository.get_by_competitor(
+        page = await self._plan_repository.get_by_competitor(
             competitor_id=competitor_id,
             status=status,
             modality_id=modality_id,
-            skip=skip,
+            cursor=cursor,
             limit=limit,
+            include=_WITH_ITEMS,
         )
 
         active_plans = await self._plan_repository.get_active(
@@ -129,10 +132,12 @@ class ListTrainingPlansUseCase:
             modality_id=modality_id,
         )
 
+        today = date.today()
         return TrainingPlanListDTO(
-            plans=[TrainingPlanDTO.from_entity(p) for p in plans],
-            total=len(plans),
+            plans=[TrainingPlanDTO.from_entity(p, today) for p in page.items],
+            total=len(page.items),
             active_count=len(active_plans),
+            next_cursor=page.next_cursor,
         )
 
     async def get_suggested(
@@ -146,7 +151,8 @@ class ListTrainingPlansUseCase:
             modality_id=modality_id,
         )
 
-        return [TrainingPlanDTO.from_entity(p) for p in plans]
+        today = date.today()
+        return [TrainingPlanDTO.from_entity(p, today) for p in plans]
 
 
 class UpdatePlanProgressUseCase:
@@ -187,9 +193,7 @@ class UpdatePlanProgressUseCase:
         Returns:
             Updated plan DTO.
         """
-        plan = await self._plan_repository.get_by_id(plan_id)
-        if not plan:
-            raise TrainingPlanNotFoundException(str(plan_id))
+        plan = await self._plan_repository.get_or_raise(plan_id)
 
         plan.activate()
         saved = await self._plan_repository.update(plan)
@@ -204,9 +208,7 @@ class UpdatePlanProgressUseCase:
         Returns:
             Updated plan DTO.
         """
-        plan = await self._plan_repository.get_by_id(plan_id)
-        if not plan:
-            raise TrainingPlanNotFoundException(str(plan_id))
+        plan = await self._plan_repository.get_or_raise(plan_id)
 
         plan.complete()
         saved = await self._plan_repository.update(plan)
@@ -234,9 +236,7 @@ class UpdatePlanProgressUseCase:
         Returns:
             Updated plan DTO.
         """
-        plan = await self._plan_repository.get_by_id(plan_id)
-        if not plan:
-            raise TrainingPlanNotFoundException(str(plan_id))
+        plan = await self._plan_repository.get_or_raise(plan_id)
 
         item = PlanItem(
             plan_id=plan_id,
@@ -265,14 +265,10 @@ class UpdatePlanProgressUseCase:
         Returns:
             Updated plan DTO.
         """
-        plan = await self._plan_repository.get_by_id(plan_id)
-        if not plan:
-            raise TrainingPlanNotFoundException(str(plan_id))
+        plan = await self._plan_repository.get_or_raise(plan_id)
 
         await self._plan_repository.reorder_items(plan_id, item_ids)
 
         # Reload plan
-        plan = await self._plan_repository.get_by_id(plan_id)
-        if not plan:
-            raise TrainingPlanNotFoundException(str(plan_id))
+        plan = await self._plan_repository.get_or_raise(plan_id)
         return TrainingPlanDTO.from_entity(plan)
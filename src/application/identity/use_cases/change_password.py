@@ -1,5 +1,6 @@
 """Change password use case."""
 
+import asyncio
 from uuid import UUID
 
 from src.application.identity.dtos.auth_dto import ChangePasswordDTO
@@ -43,8 +44,10 @@ class ChangePasswordUseCase:
             raise UserNotFoundException(identifier=str(user_id), field="id")
 
         # Verify current password
-        if not self._password_service.verify_password(
-            dto.current_password, user.password.hashed_value
+        if not await asyncio.to_thread(
+            self._password_service.verify_password,
+            dto.current_password,
+            user.password.hashed_value,
         ):
             raise AuthenticationException(
                 message="Current password is incorrect",
@@ -55,7 +58,9 @@ class ChangePasswordUseCase:
         Password.validate_raw(dto.new_password)
 
         # Hash new password
-        hashed_password = self._password_service.hash_password(dto.new_password)
+        hashed_password = await asyncio.to_thread(
+            self._password_service.hash_password, dto.new_password
+        )
         new_password = Password(hashed_password)
 
         # Update password (this also clears must_change_password flag)
@@ -32,10 +32,10 @@ class ListUsersUseCase:
         """
         if role:
             users = await self._user_repository.get_by_role(role, skip=skip, limit=limit)
+            total = await self._user_repository.count_by_role(role)
         else:
             users = await self._user_repository.get_all(skip=skip, limit=limit)
-
-        total = await self._user_repository.count()
+            total = await self._user_repository.count()
 
         return UserListDTO(
             users=[UserDTO.from_entity(user) for user in users],
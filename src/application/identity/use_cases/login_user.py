@@ -1,5 +1,6 @@
 """Login user use case."""
 
+import asyncio
 
 from src.application.identity.dtos.auth_dto import LoginDTO
 from src.application.identity.dtos.token_dto import TokenPairDTO, TokenResponseDTO
@@ -57,8 +58,9 @@ class LoginUserUseCase:
                 code=ErrorCode.INVALID_CREDENTIALS,
             )
 
-        # Verify password
-        if not self._password_service.verify_password(
+        # Verify password off the event loop; key derivation is deliberately slow
+        if not await asyncio.to_thread(
+            self._password_service.verify_password,
             dto.password,
             user.password.hashed_value,
         ):
@@ -1,5 +1,7 @@
 """Register user use case."""
 
+import asyncio
+
 from src.application.identity.dtos.auth_dto import RegisterUserDTO
 from src.application.identity.dtos.user_dto import UserDTO
 from src.domain.identity.entities.user import User
@@ -45,7 +47,9 @@ class RegisterUserUseCase:
         email = Email(dto.email)
 
         # Hash password
-        hashed_password = self._password_service.hash_password(dto.password)
+        hashed_password = await asyncio.to_thread(
+            self._password_service.hash_password, dto.password
+        )
         password = Password(hashed_password)
 
         # Create user entity
@@ -7,7 +7,7 @@ from src.shared.domain.value_object import ValueObject
 from src.shared.exceptions import InvalidValueException
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DateRange(ValueObject):
     """Date range value object for filtering analytics data.
 
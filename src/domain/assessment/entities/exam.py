@@ -1,6 +1,7 @@
 """Exam entity for assessment management."""
 
 from datetime import date, datetime
+from typing import cast
 from uuid import UUID
 
 from src.shared.constants.enums import AssessmentType
@@ -14,6 +15,18 @@ class Exam(AggregateRoot[UUID]):
     Grades are linked to exams but managed as separate aggregates.
     """
 
+    __slots__ = (
+        "_name",
+        "_modality_id",
+        "_assessment_type",
+        "_exam_date",
+        "_created_by",
+        "_description",
+        "_competence_ids",
+        "_is_active",
+        "_time_limit_minutes",
+    )
+
     def __init__(
         self,
         name: str,
@@ -181,6 +194,16 @@ class Exam(AggregateRoot[UUID]):
             self._is_active = False
             self._touch()
 
+    def __eq__(self, other: object) -> bool:
+        """Check equality by ID against another Exam only."""
+        if type(other) is not type(self):
+            return False
+        return self._id == cast(Exam, other)._id
+
+    def __hash__(self) -> int:
+        """Hash based on the exam ID."""
+        return hash(self._id)
+
     def __repr__(self) -> str:
         return (
             f"Exam(id={self._id}, name={self._name}, "
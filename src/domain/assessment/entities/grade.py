@@ -1,6 +1,7 @@
 """Grade entity for assessment management."""
 
 from datetime import datetime
+from typing import cast
 from uuid import UUID
 
 from src.domain.assessment.value_objects.score import Score
@@ -15,6 +16,17 @@ class Grade(AggregateRoot[UUID]):
     Includes audit fields for tracking who created/updated the grade.
     """
 
+    __slots__ = (
+        "_exam_id",
+        "_competitor_id",
+        "_competence_id",
+        "_sub_competence_id",
+        "_score",
+        "_created_by",
+        "_notes",
+        "_updated_by",
+    )
+
     def __init__(
         self,
         exam_id: UUID,
@@ -136,6 +148,16 @@ class Grade(AggregateRoot[UUID]):
         """
         return self._score.to_absolute(max_score)
 
+    def __eq__(self, other: object) -> bool:
+        """Check equality by ID against another Grade only."""
+        if type(other) is not type(self):
+            return False
+        return self._id == cast(Grade, other)._id
+
+    def __hash__(self) -> int:
+        """Hash based on the grade ID."""
+        return hash(self._id)
+
     def __repr__(self) -> str:
         return (
             f"Grade(id={self._id}, exam_id={self._exam_id}, "
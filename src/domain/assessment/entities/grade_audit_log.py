@@ -11,9 +11,23 @@ class GradeAuditLog(Entity[UUID]):
     """Audit log entity for tracking grade modifications.
 
     Records all changes made to grades including who made the change,
-    what was changed (old/new values), and when.
+    what was changed (old/new values), and when. Audit records are
+    write-once: no method mutates them after construction.
     """
 
+    __slots__ = (
+        "_grade_id",
+        "_action",
+        "_changed_by",
+        "_old_score",
+        "_new_score",
+        "_old_notes",
+        "_new_notes",
+        "_ip_address",
+        "_user_agent",
+        "_changed_at",
+    )
+
     ACTION_CREATED = "created"
     ACTION_UPDATED = "updated"
     ACTION_DELETED = "deleted"
@@ -47,11 +61,8 @@ class GradeAuditLog(Entity[UUID]):
             id: Optional ID (auto-generated if not provided).
             changed_at: Timestamp of the change.
         """
-        super().__init__(
-            id=id,
-            created_at=changed_at or utc_now(),
-            updated_at=changed_at or utc_now(),
-        )
+        changed_at = changed_at or utc_now()
+        super().__init__(id=id, created_at=changed_at, updated_at=changed_at)
         self._grade_id = grade_id
         self._action = action
         self._changed_by = changed_by
@@ -61,7 +72,7 @@ class GradeAuditLog(Entity[UUID]):
         self._new_notes = new_notes
         self._ip_address = ip_address
         self._user_agent = user_agent
-        self._changed_at = changed_at or utc_now()
+        self._changed_at = changed_at
 
     @property
     def grade_id(self) -> UUID:
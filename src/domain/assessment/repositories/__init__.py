@@ -2,6 +2,9 @@
 
 from src.domain.assessment.repositories.exam_repository import ExamRepository
 from src.domain.assessment.repositories.grade_audit_repository import GradeAuditLogRepository
-from src.domain.assessment.repositories.grade_repository import GradeRepository
+from src.domain.assessment.repositories.grade_repository import (
+    ExamStatisticsBundle,
+    GradeRepository,
+)
 
-__all__ = ["ExamRepository", "GradeRepository", "GradeAuditLogRepository"]
+__all__ = ["ExamRepository", "GradeRepository", "GradeAuditLogRepository", "ExamStatisticsBundle"]
@@ -1,13 +1,30 @@
 """Grade repository interface."""
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from uuid import UUID
 
 from src.domain.assessment.entities.grade import Grade
 
 
+@dataclass(frozen=True)
+class ExamStatisticsBundle:
+    """Aggregated grade data for an exam, fetched in one query."""
+
+    scores_by_competence: dict[UUID, list[float]]
+    total_competitors: int
+    total_grades: int
+    overall_average: float | None
+
+
 class GradeRepository(ABC):
-    """Abstract repository interface for Grade aggregate."""
+    """Abstract repository interface for Grade aggregate.
+
+    Implementations work on the request-scoped session handed to them by the
+    unit of work, which draws its connection from the shared pooled engine.
+    Methods must not open connections of their own, and must not be awaited
+    concurrently on the same session; batch reads into one query instead.
+    """
 
     @abstractmethod
     async def get_by_id(self, grade_id: UUID) -> Grade | None:
@@ -204,6 +221,20 @@ class GradeRepository(ABC):
         """
         ...
 
+    @abstractmethod
+    async def get_exam_statistics_bundle(self, exam_id: UUID) -> ExamStatisticsBundle:
+        """Get everything needed to compute an exam's statistics.
+
+        Implementations must answer with a single database round-trip.
+
+        Args:
+            exam_id: Exam UUID.
+
+        Returns:
+            ExamStatisticsBundle with per-competence scores and exam totals.
+        """
+        ...
+
     @abstractmethod
     async def count(
         self,
@@ -241,3 +272,25 @@ class GradeRepository(ABC):
             Average score or None if no grades.
         """
         ...
+
+    @abstractmethod
+    async def get_weighted_average(
+        self,
+        exam_id: UUID,
+        competitor_id: UUID,
+        competence_weights: dict[UUID, float],
+    ) -> float | None:
+        """Calculate a competitor's weighted average in an exam.
+
+        The weighting is done by the database, so grades are not loaded.
+        Competences missing from ``competence_weights`` weigh 1.0.
+
+        Args:
+            exam_id: Exam UUID.
+            competitor_id: Competitor UUID.
+            competence_weights: Dictionary mapping competence_id to weight.
+
+        Returns:
+            Weighted average, or None if no grades or total weight is zero.
+        """
+        ...
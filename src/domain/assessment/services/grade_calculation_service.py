@@ -1,6 +1,6 @@
 """Grade calculation service for statistics."""
 
-import statistics
+import math
 from dataclasses import dataclass
 from uuid import UUID
 
@@ -10,9 +10,10 @@ from src.domain.assessment.exceptions import (
 )
 from src.domain.assessment.repositories.exam_repository import ExamRepository
 from src.domain.assessment.repositories.grade_repository import GradeRepository
+from src.shared.utils.cache import TTLCache
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GradeStatistics:
     """Statistics for a set of grades."""
 
@@ -35,7 +36,7 @@ class GradeStatistics:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExamStatistics:
     """Statistics for an entire exam."""
 
@@ -69,15 +70,27 @@ class GradeCalculationService:
         self,
         grade_repository: GradeRepository,
         exam_repository: ExamRepository,
+        cache: TTLCache[UUID, ExamStatistics] | None = None,
     ) -> None:
         """Initialize the service.
 
         Args:
             grade_repository: Grade repository instance.
             exam_repository: Exam repository instance.
+            cache: Optional cache for exam statistics, keyed by exam ID.
         """
         self._grade_repository = grade_repository
         self._exam_repository = exam_repository
+        self._cache = cache
+
+    def invalidate_exam(self, exam_id: UUID) -> None:
+        """Drop cached statistics for an exam after its grades change.
+
+        Args:
+            exam_id: Exam UUID.
+        """
+        if self._cache is not None:
+            self._cache.invalidate(exam_id)
 
     def _calculate_statistics(self, scores: list[float]) -> GradeStatistics:
         """Calculate statistics from a list of scores.
@@ -97,22 +110,27 @@ class GradeCalculationService:
                 actual=len(scores),
             )
 
-        avg = round(statistics.mean(scores), 2)
-        med = round(statistics.median(scores), 2)
+        # One sort yields median, min and max; fsum keeps the mean exact enough
+        # for two-decimal rounding without statistics.mean's Fraction arithmetic.
+        count = len(scores)
+        ordered = sorted(scores)
+        mid = count // 2
+        median = ordered[mid] if count % 2 else (ordered[mid - 1] + ordered[mid]) / 2
+        mean = math.fsum(ordered) / count
 
         # Standard deviation requires at least 2 values
-        if len(scores) >= 2:
-            std = round(statistics.stdev(scores), 2)
+        if count >= 2:
+            std = round(math.sqrt(math.fsum((x - mean) ** 2 for x in ordered) / (count - 1)), 2)
         else:
             std = 0.0
 
         return GradeStatistics(
-            average=avg,
-            median=med,
+            average=round(mean, 2),
+            median=round(median, 2),
             std_deviation=std,
-            min_score=min(scores),
-            max_score=max(scores),
-            count=len(scores),
+            min_score=ordered[0],
+            max_score=ordered[-1],
+            count=count,
         )
 
     async def calculate_exam_average(
@@ -195,42 +213,39 @@ class GradeCalculationService:
         Raises:
             ExamNotFoundException: If exam not found.
         """
+        if self._cache is not None:
+            cached = self._cache.get(exam_id)
+            if cached is not None:
+                return cached
+
         exam = await self._exam_repository.get_by_id(exam_id)
         if not exam:
             raise ExamNotFoundException(str(exam_id))
 
-        # Get all scores for the exam
-        all_scores = await self._grade_repository.get_scores_for_statistics(
-            exam_id=exam_id,
-        )
-
-        # Calculate overall average
-        overall_avg = round(statistics.mean(all_scores), 2) if all_scores else 0.0
-
-        # Count unique competitors
-        grades = await self._grade_repository.get_by_exam(exam_id)
-        competitor_ids = {g.competitor_id for g in grades}
+        # Scores, competitor count and overall average in one round-trip
+        bundle = await self._grade_repository.get_exam_statistics_bundle(exam_id)
 
         # Calculate per-competence statistics
         competence_stats: dict[UUID, GradeStatistics] = {}
         for competence_id in exam.competence_ids:
             try:
-                stats = await self.calculate_competence_statistics(
-                    exam_id=exam_id,
-                    competence_id=competence_id,
+                competence_stats[competence_id] = self._calculate_statistics(
+                    bundle.scores_by_competence.get(competence_id, [])
                 )
-                competence_stats[competence_id] = stats
             except InsufficientGradesForStatisticsException:
                 # No grades for this competence yet
                 pass
 
-        return ExamStatistics(
+        result = ExamStatistics(
             exam_id=exam_id,
-            total_competitors=len(competitor_ids),
-            total_grades=len(all_scores),
-            overall_average=overall_avg,
+            total_competitors=bundle.total_competitors,
+            total_grades=bundle.total_grades,
+            overall_average=bundle.overall_average if bundle.overall_average is not None else 0.0,
             competence_stats=competence_stats,
         )
+        if self._cache is not None:
+            self._cache.set(exam_id, result)
+        return result
 
     async def calculate_weighted_average(
         self,
@@ -248,23 +263,8 @@ class GradeCalculationService:
         Returns:
             Weighted average or None if no grades.
         """
-        grades = await self._grade_repository.get_by_exam_and_competitor(
+        return await self._grade_repository.get_weighted_average(
             exam_id=exam_id,
             competitor_id=competitor_id,
+            competence_weights=competence_weights,
         )
-
-        if not grades:
-            return None
-
-        total_weight = 0.0
-        weighted_sum = 0.0
-
-        for grade in grades:
-            weight = competence_weights.get(grade.competence_id, 1.0)
-            weighted_sum += grade.score.value * weight
-            total_weight += weight
-
-        if total_weight == 0:
-            return None
-
-        return round(weighted_sum / total_weight, 2)
@@ -1,9 +1,22 @@
 """Score value object for assessment grades."""
 
+from functools import lru_cache
+from typing import ClassVar
+
 from src.shared.domain.value_object import ValueObject
 from src.shared.exceptions import InvalidValueException
 
 
+@lru_cache(maxsize=8192)
+def _to_absolute(value: float, max_score: float) -> float:
+    """Convert a normalized score to an absolute value.
+
+    Competence max scores come from a small fixed set, so repeated
+    conversions during an exam scoring run are served from the cache.
+    """
+    return round((value / 100.0) * max_score, 2)
+
+
 class Score(ValueObject):
     """Score value object representing a grade.
 
@@ -11,11 +24,21 @@ class Score(ValueObject):
     to accommodate WorldSkills sub-criteria grading.
     """
 
+    __slots__ = ("_value", "_hash")
+
+    _value: float
+    _hash: int
+
     MIN_SCORE = 0.0
     MAX_SCORE = 10000.0
 
-    def __init__(self, value: float) -> None:
-        """Initialize Score value object.
+    # Percentage scores (0.00-100.00) are interned, so hydrating many grades
+    # with the same value reuses one instance. Capped at 10001 entries.
+    _INTERN_MAX = 100.0
+    _interned: ClassVar[dict[float, "Score"]] = {}
+
+    def __new__(cls, value: float) -> "Score":
+        """Create or reuse a Score value object.
 
         Args:
             value: Score value (0-100).
@@ -23,23 +46,32 @@ class Score(ValueObject):
         Raises:
             InvalidValueException: If score is out of valid range.
         """
-        self._validate(value)
-        self._value = round(float(value), 2)
+        cls._validate(value)
+        rounded = round(float(value), 2)
+        intern = cls is Score and rounded <= cls._INTERN_MAX
+        if intern and (cached := cls._interned.get(rounded)) is not None:
+            return cached
+        instance = super().__new__(cls)
+        instance._value = rounded
+        instance._hash = hash(rounded)
+        if intern:
+            cls._interned[rounded] = instance
+        return instance
+
+    def __reduce__(self) -> tuple[type["Score"], tuple[float]]:
+        """Pickle through the constructor so unpickling reuses interned scores."""
+        return (self.__class__, (self._value,))
 
-    def _validate(self, value: float) -> None:
+    @classmethod
+    def _validate(cls, value: float) -> None:
         """Validate score value."""
-        if value < self.MIN_SCORE:
-            raise InvalidValueException(
-                field="score",
-                value=value,
-                reason=f"Score must be at least {self.MIN_SCORE}",
-            )
-        if value > self.MAX_SCORE:
-            raise InvalidValueException(
-                field="score",
-                value=value,
-                reason=f"Score cannot exceed {self.MAX_SCORE}",
-            )
+        if cls.MIN_SCORE <= value <= cls.MAX_SCORE:
+            return
+        if value < cls.MIN_SCORE:
+            reason = f"Score must be at least {cls.MIN_SCORE}"
+        else:
+            reason = f"Score cannot exceed {cls.MAX_SCORE}"
+        raise InvalidValueException(field="score", value=value, reason=reason)
 
     @property
     def value(self) -> float:
@@ -55,7 +87,7 @@ class Score(ValueObject):
         Returns:
             Absolute score value.
         """
-        return round((self._value / 100.0) * max_score, 2)
+        return _to_absolute(self._value, max_score)
 
     @classmethod
     def from_absolute(cls, score: float, max_score: float) -> "Score":
@@ -84,6 +116,16 @@ class Score(ValueObject):
         """Get the components used for equality comparison."""
         return (self._value,)
 
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, self.__class__):
+            return False
+        return self._value == other._value
+
+    def __hash__(self) -> int:
+        return self._hash
+
     def __str__(self) -> str:
         return f"{self._value}%"
 
@@ -1,16 +1,32 @@
 """Badge and Achievement entities for gamification."""
 
+from collections.abc import Mapping
 from datetime import datetime
+from types import MappingProxyType
+from typing import Any
 from uuid import UUID, uuid4
 
 from src.shared.constants.enums import BadgeCategory, BadgeRarity
 from src.shared.domain.aggregate_root import AggregateRoot
 from src.shared.domain.entity import Entity
+from src.shared.utils.date_utils import utc_now
 
 
 class Badge(AggregateRoot[UUID]):
     """Badge entity for gamification rewards."""
 
+    __slots__ = (
+        "_name",
+        "_description",
+        "_category",
+        "_rarity",
+        "_icon_url",
+        "_points",
+        "_criteria",
+        "_criteria_view",
+        "_is_active",
+    )
+
     def __init__(
         self,
         name: str,
@@ -32,8 +48,9 @@ class Badge(AggregateRoot[UUID]):
         self._icon_url = icon_url
         self._points = points
         self._criteria = criteria or {}
+        self._criteria_view = MappingProxyType(self._criteria)
         self._is_active = is_active
-        self._created_at = created_at or datetime.utcnow()
+        self._created_at = created_at or utc_now()
 
     @property
     def name(self) -> str:
@@ -60,8 +77,9 @@ class Badge(AggregateRoot[UUID]):
         return self._points
 
     @property
-    def criteria(self) -> dict:
-        return self._criteria.copy()
+    def criteria(self) -> Mapping[str, Any]:
+        """Read-only view of the award criteria."""
+        return self._criteria_view
 
     @property
     def is_active(self) -> bool:
@@ -154,6 +172,16 @@ class Badge(AggregateRoot[UUID]):
 class Achievement(Entity[UUID]):
     """Achievement entity - badge awarded to a user."""
 
+    __slots__ = (
+        "_badge_id",
+        "_user_id",
+        "_competitor_id",
+        "_earned_at",
+        "_progress",
+        "_metadata",
+        "_metadata_view",
+    )
+
     def __init__(
         self,
         badge_id: UUID,
@@ -168,9 +196,10 @@ class Achievement(Entity[UUID]):
         self._badge_id = badge_id
         self._user_id = user_id
         self._competitor_id = competitor_id
-        self._earned_at = earned_at or datetime.utcnow()
+        self._earned_at = earned_at or utc_now()
         self._progress = progress
         self._metadata = metadata or {}
+        self._metadata_view = MappingProxyType(self._metadata)
 
     @property
     def badge_id(self) -> UUID:
@@ -193,8 +222,9 @@ class Achievement(Entity[UUID]):
         return self._progress
 
     @property
-    def metadata(self) -> dict:
-        return self._metadata.copy()
+    def metadata(self) -> Mapping[str, Any]:
+        """Read-only view of the achievement metadata."""
+        return self._metadata_view
 
     @property
     def is_complete(self) -> bool:
@@ -205,12 +235,20 @@ class Achievement(Entity[UUID]):
         """Update achievement progress."""
         self._progress = min(100.0, progress)
         if self._progress >= 100.0:
-            self._earned_at = datetime.utcnow()
+            self._earned_at = utc_now()
 
 
 class UserPoints(Entity[UUID]):
     """User points tracking for gamification."""
 
+    __slots__ = (
+        "_user_id",
+        "_total_points",
+        "_level",
+        "_badges_count",
+        "_points_to_next_level",
+    )
+
     def __init__(
         self,
         user_id: UUID,
@@ -224,6 +262,7 @@ class UserPoints(Entity[UUID]):
         self._total_points = total_points
         self._level = level
         self._badges_count = badges_count
+        self._points_to_next_level = self._compute_points_to_next_level()
 
     @property
     def user_id(self) -> UUID:
@@ -243,16 +282,19 @@ class UserPoints(Entity[UUID]):
 
     @property
     def points_to_next_level(self) -> int:
-        """Calculate points needed for next level."""
-        # Level formula: level * 100 points per level
-        next_level_threshold = self._level * 100
-        return max(0, next_level_threshold - (self._total_points % 100))
+        """Points needed to reach the next level."""
+        return self._points_to_next_level
+
+    def _compute_points_to_next_level(self) -> int:
+        # Level formula: level N spans [(N - 1) * 100, N * 100) points
+        return max(0, self._level * 100 - self._total_points)
 
     def add_points(self, points: int) -> bool:
         """Add points and return True if leveled up."""
         old_level = self._level
         self._total_points += points
         self._level = (self._total_points // 100) + 1
+        self._points_to_next_level = self._compute_points_to_next_level()
         return self._level > old_level
 
     def increment_badges(self) -> None:
@@ -1,6 +1,6 @@
 """Event and Schedule entities."""
 
-from datetime import datetime, time
+from datetime import UTC, datetime, time
 from uuid import UUID, uuid4
 
 from src.shared.constants.enums import EventStatus, EventType
@@ -8,9 +8,36 @@ from src.shared.domain.aggregate_root import AggregateRoot
 from src.shared.domain.entity import Entity
 
 
+def _posix_seconds(value: datetime) -> float:
+    """Convert to POSIX seconds, reading naive datetimes as UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value.timestamp()
+
+
 class Event(AggregateRoot[UUID]):
     """Event entity for scheduling."""
 
+    __slots__ = (
+        "_title",
+        "_description",
+        "_event_type",
+        "_start_datetime",
+        "_end_datetime",
+        "_location",
+        "_modality_id",
+        "_is_all_day",
+        "_status",
+        "_recurrence_rule",
+        "_reminder_minutes",
+        "_created_by",
+        "_participants",
+        "_start_ts",
+        "_end_ts",
+        "_duration_minutes",
+        "_reminder_ts",
+    )
+
     def __init__(
         self,
         title: str,
@@ -42,9 +69,16 @@ class Event(AggregateRoot[UUID]):
         self._recurrence_rule = recurrence_rule
         self._reminder_minutes = reminder_minutes
         self._created_by = created_by
-        self._created_at = created_at or datetime.utcnow()
-        self._updated_at = updated_at or datetime.utcnow()
-        self._participants: list[UUID] = []
+        if created_at is None or updated_at is None:
+            now = datetime.utcnow()
+            created_at = created_at or now
+            updated_at = updated_at or now
+        self._created_at = created_at
+        self._updated_at = updated_at
+        # Insertion-ordered set: O(1) membership while keeping join order
+        # Allocated on first participant; most events never get any
+        self._participants: dict[UUID, None] | None = None
+        self._refresh_schedule()
 
     @property
     def title(self) -> str:
@@ -103,14 +137,35 @@ class Event(AggregateRoot[UUID]):
         return self._updated_at
 
     @property
-    def participants(self) -> list[UUID]:
-        return self._participants.copy()
+    def participants(self) -> tuple[UUID, ...]:
+        return () if self._participants is None else tuple(self._participants)
 
     @property
     def duration_minutes(self) -> int:
         """Get event duration in minutes."""
+        return self._duration_minutes
+
+    @property
+    def start_ts(self) -> float:
+        """Event start as POSIX seconds."""
+        return self._start_ts
+
+    @property
+    def end_ts(self) -> float:
+        """Event end as POSIX seconds."""
+        return self._end_ts
+
+    def _refresh_schedule(self) -> None:
+        """Recompute values derived from the start, end and reminder settings."""
+        self._start_ts = _posix_seconds(self._start_datetime)
+        self._end_ts = _posix_seconds(self._end_datetime)
         delta = self._end_datetime - self._start_datetime
-        return int(delta.total_seconds() / 60)
+        self._duration_minutes = int(delta.total_seconds() / 60)
+        self._reminder_ts = (
+            self._start_ts - self._reminder_minutes * 60
+            if self._reminder_minutes is not None
+            else None
+        )
 
     def update(
         self,
@@ -130,25 +185,44 @@ class Event(AggregateRoot[UUID]):
             self._start_datetime = start_datetime
         if end_datetime is not None:
             self._end_datetime = end_datetime
+        if start_datetime is not None or end_datetime is not None:
+            self._refresh_schedule()
         if location is not None:
             self._location = location
         if event_type is not None:
             self._event_type = event_type
         self._updated_at = datetime.utcnow()
 
+    def overlaps(self, other: "Event") -> bool:
+        """Check if this event's time span intersects another's.
+
+        Events that only touch at an endpoint do not overlap.
+        """
+        return self._start_ts < other._end_ts and other._start_ts < self._end_ts
+
+    def hour_buckets(self) -> range:
+        """Get the hour buckets (POSIX seconds // 3600) the event spans.
+
+        Storage can index these as a multi-value key so overlap queries
+        become bucket lookups instead of two-sided range scans.
+        """
+        return range(int(self._start_ts // 3600), int(self._end_ts // 3600) + 1)
+
     def add_participant(self, user_id: UUID) -> bool:
         """Add a participant to the event."""
-        if user_id not in self._participants:
-            self._participants.append(user_id)
-            return True
-        return False
+        if self._participants is None:
+            self._participants = {}
+        elif user_id in self._participants:
+            return False
+        self._participants[user_id] = None
+        return True
 
     def remove_participant(self, user_id: UUID) -> bool:
         """Remove a participant from the event."""
-        if user_id in self._participants:
-            self._participants.remove(user_id)
-            return True
-        return False
+        if self._participants is None or user_id not in self._participants:
+            return False
+        del self._participants[user_id]
+        return True
 
     def start(self) -> None:
         """Mark event as in progress."""
@@ -171,17 +245,26 @@ class Event(AggregateRoot[UUID]):
 
     def needs_reminder(self) -> bool:
         """Check if event needs a reminder sent."""
-        if self._reminder_minutes is None:
-            return False
-        if self._status != EventStatus.SCHEDULED:
+        if self._reminder_ts is None or self._status != EventStatus.SCHEDULED:
             return False
-        reminder_time = self._start_datetime.timestamp() - (self._reminder_minutes * 60)
-        return datetime.utcnow().timestamp() >= reminder_time
+        return datetime.now(UTC).timestamp() >= self._reminder_ts
 
 
 class Schedule(Entity[UUID]):
     """Schedule entity for recurring patterns."""
 
+    __slots__ = (
+        "_name",
+        "_user_id",
+        "_day_of_week",
+        "_start_time",
+        "_end_time",
+        "_start_minute",
+        "_end_minute",
+        "_modality_id",
+        "_is_active",
+    )
+
     def __init__(
         self,
         name: str,
@@ -199,6 +282,9 @@ class Schedule(Entity[UUID]):
         self._day_of_week = day_of_week
         self._start_time = start_time
         self._end_time = end_time
+        # Minutes since midnight, for integer comparisons when filtering
+        self._start_minute = start_time.hour * 60 + start_time.minute
+        self._end_minute = end_time.hour * 60 + end_time.minute
         self._modality_id = modality_id
         self._is_active = is_active
 
@@ -230,6 +316,22 @@ class Schedule(Entity[UUID]):
     def is_active(self) -> bool:
         return self._is_active
 
+    def is_active_at(self, day_of_week: int, minute_of_day: int) -> bool:
+        """Check if the schedule is running at a given weekly moment.
+
+        Args:
+            day_of_week: Day of week (0=Monday, 6=Sunday).
+            minute_of_day: Minutes since midnight.
+
+        Returns:
+            True if active on that day with the minute inside [start, end).
+        """
+        return (
+            self._is_active
+            and self._day_of_week == day_of_week
+            and self._start_minute <= minute_of_day < self._end_minute
+        )
+
     def deactivate(self) -> None:
         """Deactivate the schedule."""
         self._is_active = False
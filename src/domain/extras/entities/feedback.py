@@ -4,13 +4,31 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID, uuid4
 
-from src.shared.constants.enums import FeedbackType
+from src.shared.constants.enums import FeedbackContext, FeedbackType
 from src.shared.domain.aggregate_root import AggregateRoot
 
+_CONTEXT_LABELS = tuple(context.name.lower() for context in FeedbackContext)
+
 
 class Feedback(AggregateRoot[UUID]):
     """Feedback entity for evaluator-competitor communication."""
 
+    __slots__ = (
+        "_competitor_id",
+        "_evaluator_id",
+        "_content",
+        "_feedback_type",
+        "_exam_id",
+        "_competence_id",
+        "_grade_id",
+        "_training_id",
+        "_rating",
+        "_is_private",
+        "_is_read",
+        "_read_at",
+        "_context",
+    )
+
     def __init__(
         self,
         competitor_id: UUID,
@@ -37,6 +55,8 @@ class Feedback(AggregateRoot[UUID]):
         self._competence_id = competence_id
         self._grade_id = grade_id
         self._training_id = training_id
+        # Context ids have no mutators, so the context is fixed at creation
+        self._context = self._resolve_context()
         self._rating = self._validate_rating(rating)
         self._is_private = is_private
         self._is_read = is_read
@@ -47,7 +67,7 @@ class Feedback(AggregateRoot[UUID]):
         """Validate rating is between 1 and 5."""
         if rating is None:
             return None
-        return max(1, min(5, rating))
+        return 1 if rating < 1 else 5 if rating > 5 else rating
 
     @property
     def competitor_id(self) -> UUID:
@@ -101,18 +121,27 @@ class Feedback(AggregateRoot[UUID]):
     def created_at(self) -> datetime:
         return self._created_at
 
+    @property
+    def context(self) -> FeedbackContext:
+        """Get the context the feedback is attached to."""
+        return self._context
+
     @property
     def related_context(self) -> str:
-        """Get the context of the feedback."""
+        """Get the context of the feedback as its API label."""
+        return _CONTEXT_LABELS[self._context]
+
+    def _resolve_context(self) -> FeedbackContext:
+        """Resolve the most specific context the feedback is attached to."""
         if self._grade_id:
-            return "grade"
+            return FeedbackContext.GRADE
         if self._exam_id:
-            return "exam"
+            return FeedbackContext.EXAM
         if self._training_id:
-            return "training"
+            return FeedbackContext.TRAINING
         if self._competence_id:
-            return "competence"
-        return "general"
+            return FeedbackContext.COMPETENCE
+        return FeedbackContext.GENERAL
 
     def mark_as_read(self) -> None:
         """Mark feedback as read."""
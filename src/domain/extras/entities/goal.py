@@ -1,5 +1,6 @@
 """Goal and Milestone entities."""
 
+from collections.abc import Callable, Iterable
 from datetime import date, datetime
 from uuid import UUID, uuid4
 
@@ -11,6 +12,17 @@ from src.shared.domain.entity import Entity
 class Milestone(Entity[UUID]):
     """Milestone entity for goal tracking."""
 
+    __slots__ = (
+        "_goal_id",
+        "_title",
+        "_target_value",
+        "_current_value",
+        "_due_date",
+        "_is_completed",
+        "_completed_at",
+        "_on_complete",
+    )
+
     def __init__(
         self,
         goal_id: UUID,
@@ -30,6 +42,8 @@ class Milestone(Entity[UUID]):
         self._due_date = due_date
         self._is_completed = is_completed
         self._completed_at = completed_at
+        # Set by the owning Goal to keep its completed count current
+        self._on_complete: Callable[[], None] | None = None
 
     @property
     def goal_id(self) -> UUID:
@@ -69,9 +83,13 @@ class Milestone(Entity[UUID]):
     @property
     def is_overdue(self) -> bool:
         """Check if milestone is overdue."""
+        return self.is_overdue_on(date.today())
+
+    def is_overdue_on(self, today: date) -> bool:
+        """Check if milestone is overdue as of the given date."""
         if self._is_completed or self._due_date is None:
             return False
-        return date.today() > self._due_date
+        return today > self._due_date
 
     def update_progress(self, value: float) -> None:
         """Update current progress value."""
@@ -81,13 +99,38 @@ class Milestone(Entity[UUID]):
 
     def complete(self) -> None:
         """Mark milestone as completed."""
+        newly_completed = not self._is_completed
         self._is_completed = True
         self._completed_at = datetime.utcnow()
+        if newly_completed and self._on_complete is not None:
+            self._on_complete()
 
 
 class Goal(AggregateRoot[UUID]):
     """Goal entity for tracking objectives (RN10)."""
 
+    __slots__ = (
+        "_title",
+        "_description",
+        "_competitor_id",
+        "_target_value",
+        "_current_value",
+        "_unit",
+        "_priority",
+        "_status",
+        "_start_date",
+        "_due_date",
+        "_modality_id",
+        "_competence_id",
+        "_created_by",
+        "_milestones",
+        "_completed_count",
+        "_start_ordinal",
+        "_due_ordinal",
+        "_total_days",
+        "_progress_pct",
+    )
+
     def __init__(
         self,
         title: str,
@@ -121,9 +164,18 @@ class Goal(AggregateRoot[UUID]):
         self._modality_id = modality_id
         self._competence_id = competence_id
         self._created_by = created_by
-        self._created_at = created_at or datetime.utcnow()
-        self._updated_at = updated_at or datetime.utcnow()
-        self._milestones: list[Milestone] = []
+        if created_at is None or updated_at is None:
+            now = datetime.utcnow()
+            created_at = created_at or now
+            updated_at = updated_at or now
+        self._created_at = created_at
+        self._updated_at = updated_at
+        # Keyed by id (insertion ordered) so removal is a single lookup;
+        # allocated on first milestone
+        self._milestones: dict[UUID, Milestone] | None = None
+        self._refresh_schedule()
+        self._refresh_progress()
+        self._completed_count = 0
 
     @property
     def title(self) -> str:
@@ -186,37 +238,59 @@ class Goal(AggregateRoot[UUID]):
         return self._updated_at
 
     @property
-    def milestones(self) -> list[Milestone]:
-        return self._milestones.copy()
+    def milestones(self) -> tuple[Milestone, ...]:
+        return () if self._milestones is None else tuple(self._milestones.values())
 
     @property
     def progress_percentage(self) -> float:
-        """Calculate goal progress percentage."""
+        """Goal progress percentage, refreshed whenever progress or status changes."""
+        return self._progress_pct
+
+    def _refresh_progress(self) -> None:
+        """Recompute the cached progress percentage."""
         if self._target_value == 0:
-            return 100.0 if self._status == GoalStatus.COMPLETED else 0.0
-        return min(100.0, round((self._current_value / self._target_value) * 100, 2))
+            self._progress_pct = 100.0 if self._status == GoalStatus.COMPLETED else 0.0
+        else:
+            self._progress_pct = min(
+                100.0, round((self._current_value / self._target_value) * 100, 2)
+            )
+
+    def _refresh_schedule(self) -> None:
+        """Recompute the date ordinals and scheduled length of the goal."""
+        self._start_ordinal = self._start_date.toordinal()
+        if self._due_date is None:
+            self._due_ordinal = None
+            self._total_days = None
+        else:
+            self._due_ordinal = self._due_date.toordinal()
+            self._total_days = self._due_ordinal - self._start_ordinal
 
     @property
     def is_overdue(self) -> bool:
         """Check if goal is overdue (RN10 - automatic alerts)."""
-        if self._status == GoalStatus.COMPLETED:
-            return False
-        if self._due_date is None:
+        return self.is_overdue_on(date.today())
+
+    def is_overdue_on(self, today: date) -> bool:
+        """Check if goal is overdue as of the given date."""
+        if self._status == GoalStatus.COMPLETED or self._due_ordinal is None:
             return False
-        return date.today() > self._due_date
+        return today.toordinal() > self._due_ordinal
 
     @property
     def days_remaining(self) -> int | None:
         """Get days remaining until due date."""
-        if self._due_date is None:
+        return self.days_remaining_on(date.today())
+
+    def days_remaining_on(self, today: date) -> int | None:
+        """Get days remaining until due date as of the given date."""
+        if self._due_ordinal is None:
             return None
-        delta = self._due_date - date.today()
-        return delta.days
+        return self._due_ordinal - today.toordinal()
 
     @property
     def completed_milestones(self) -> int:
         """Count completed milestones."""
-        return sum(1 for m in self._milestones if m.is_completed)
+        return self._completed_count
 
     def update(
         self,
@@ -237,6 +311,8 @@ class Goal(AggregateRoot[UUID]):
             self._priority = priority
         if due_date is not None:
             self._due_date = due_date
+            self._refresh_schedule()
+        self._refresh_progress()
         self._updated_at = datetime.utcnow()
 
     def update_progress(self, value: float) -> None:
@@ -253,64 +329,114 @@ class Goal(AggregateRoot[UUID]):
         # Check for overdue
         if self.is_overdue and self._status != GoalStatus.COMPLETED:
             self._status = GoalStatus.OVERDUE
+        self._refresh_progress()
 
     def start(self) -> None:
         """Start working on the goal."""
         self._status = GoalStatus.IN_PROGRESS
+        self._refresh_progress()
         self._updated_at = datetime.utcnow()
 
     def complete(self) -> None:
         """Mark goal as completed."""
         self._status = GoalStatus.COMPLETED
         self._current_value = self._target_value
+        self._refresh_progress()
         self._updated_at = datetime.utcnow()
 
     def cancel(self) -> None:
         """Cancel the goal."""
         self._status = GoalStatus.CANCELLED
+        self._refresh_progress()
         self._updated_at = datetime.utcnow()
 
     def add_milestone(self, milestone: Milestone) -> None:
         """Add a milestone to the goal."""
-        self._milestones.append(milestone)
+        if self._milestones is None:
+            self._milestones = {}
+        else:
+            previous = self._milestones.get(milestone.id)
+            if previous is not None:
+                self._detach_milestone(previous)
+        self._milestones[milestone.id] = milestone
+        milestone._on_complete = self._on_milestone_completed
+        if milestone.is_completed:
+            self._completed_count += 1
         self._updated_at = datetime.utcnow()
 
     def remove_milestone(self, milestone_id: UUID) -> bool:
         """Remove a milestone from the goal."""
-        for i, m in enumerate(self._milestones):
-            if m.id == milestone_id:
-                self._milestones.pop(i)
-                self._updated_at = datetime.utcnow()
-                return True
-        return False
+        if self._milestones is None:
+            return False
+        milestone = self._milestones.pop(milestone_id, None)
+        if milestone is None:
+            return False
+        self._detach_milestone(milestone)
+        self._updated_at = datetime.utcnow()
+        return True
+
+    def _detach_milestone(self, milestone: Milestone) -> None:
+        """Stop tracking a milestone that is no longer part of the goal."""
+        milestone._on_complete = None
+        if milestone.is_completed:
+            self._completed_count -= 1
 
-    def needs_alert(self, days_threshold: int = 7) -> bool:
+    def _on_milestone_completed(self) -> None:
+        """Count a milestone that just transitioned to completed."""
+        self._completed_count += 1
+
+    def needs_alert(self, days_threshold: int = 7, today: date | None = None) -> bool:
         """Check if goal needs an alert (RN10).
 
         Returns True if:
         - Goal is overdue
         - Goal is approaching deadline (within threshold days)
         - Progress is significantly behind schedule
+
+        Args:
+            days_threshold: Days before the due date that trigger an alert.
+            today: Reference date, defaults to today.
         """
-        if self._status == GoalStatus.COMPLETED:
+        return self._needs_alert_on(today or date.today(), days_threshold)
+
+    def _needs_alert_on(self, today: date, days_threshold: int) -> bool:
+        """Evaluate the RN10 alert rules against a fixed current date."""
+        due_ordinal = self._due_ordinal
+        if self._status == GoalStatus.COMPLETED or due_ordinal is None:
             return False
 
-        # Already overdue
-        if self.is_overdue:
+        # Overdue or approaching deadline
+        today_ordinal = today.toordinal()
+        if due_ordinal - today_ordinal <= days_threshold:
             return True
 
-        # Approaching deadline
-        if self._due_date and self.days_remaining is not None:
-            if self.days_remaining <= days_threshold:
-                return True
-
         # Behind schedule (less than 50% progress with less than 50% time remaining)
-        if self._due_date:
-            total_days = (self._due_date - self._start_date).days
-            if total_days > 0:
-                elapsed_days = (date.today() - self._start_date).days
-                time_progress = elapsed_days / total_days
-                if time_progress > 0.5 and self.progress_percentage < 50:
-                    return True
+        total_days = self._total_days
+        if total_days is not None and total_days > 0 and self._progress_pct < 50:
+            elapsed = today_ordinal - self._start_ordinal
+            if elapsed / total_days > 0.5:
+                return True
 
         return False
+
+
+def goals_needing_alert(
+    goals: Iterable[Goal],
+    days_threshold: int = 7,
+    today: date | None = None,
+) -> list[Goal]:
+    """Select the goals that need an RN10 alert.
+
+    Bulk counterpart of Goal.needs_alert for the alert sweep: the current
+    date is read once for the whole batch instead of per goal.
+
+    Args:
+        goals: Goals to check.
+        days_threshold: Days before the due date that trigger an alert.
+        today: Reference date, defaults to today.
+
+    Returns:
+        Goals needing an alert, in input order.
+    """
+    today = today or date.today()
+    return [goal for goal in goals if goal._needs_alert_on(today, days_threshold)]
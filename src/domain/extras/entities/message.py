@@ -7,10 +7,24 @@ from src.shared.constants.enums import MessageType
 from src.shared.domain.aggregate_root import AggregateRoot
 from src.shared.domain.entity import Entity
 
+# Sender of system messages (the nil UUID), built once from its int form
+_SYSTEM_USER_ID = UUID(int=0)
+
 
 class Message(Entity[UUID]):
     """Message entity for chat."""
 
+    __slots__ = (
+        "_conversation_id",
+        "_sender_id",
+        "_content",
+        "_message_type",
+        "_file_url",
+        "_is_read",
+        "_read_at",
+        "_is_deleted",
+    )
+
     def __init__(
         self,
         conversation_id: UUID,
@@ -90,7 +104,7 @@ class Message(Entity[UUID]):
         """Create a system message."""
         return cls(
             conversation_id=conversation_id,
-            sender_id=UUID("00000000-0000-0000-0000-000000000000"),  # System user
+            sender_id=_SYSTEM_USER_ID,
             content=content,
             message_type=MessageType.SYSTEM,
         )
@@ -99,6 +113,17 @@ class Message(Entity[UUID]):
 class Conversation(AggregateRoot[UUID]):
     """Conversation entity for 1-on-1 chat."""
 
+    __slots__ = (
+        "_participant_1",
+        "_participant_2",
+        "_title",
+        "_modality_id",
+        "_is_active",
+        "_last_message_at",
+        "_index",
+        "_unread",
+    )
+
     def __init__(
         self,
         participant_1: UUID,
@@ -116,11 +141,17 @@ class Conversation(AggregateRoot[UUID]):
         self._title = title
         self._modality_id = modality_id
         self._is_active = is_active
-        self._created_at = created_at or datetime.utcnow()
-        self._updated_at = updated_at or datetime.utcnow()
+        if created_at is None or updated_at is None:
+            now = datetime.utcnow()
+            created_at = created_at or now
+            updated_at = updated_at or now
+        self._created_at = created_at
+        self._updated_at = updated_at
         self._last_message_at: datetime | None = None
-        self._unread_count_1 = 0  # Unread for participant 1
-        self._unread_count_2 = 0  # Unread for participant 2
+        # Participant -> position, so each lookup is one hash probe.
+        # Built in reverse so participant 1 wins if both ids are equal.
+        self._index = {participant_2: 1, participant_1: 0}
+        self._unread = [0, 0]  # Unread count per participant position
 
     @property
     def participant_1(self) -> UUID:
@@ -160,41 +191,34 @@ class Conversation(AggregateRoot[UUID]):
 
     def get_unread_count(self, user_id: UUID) -> int:
         """Get unread message count for a user."""
-        if user_id == self._participant_1:
-            return self._unread_count_1
-        elif user_id == self._participant_2:
-            return self._unread_count_2
-        return 0
+        index = self._index.get(user_id)
+        return 0 if index is None else self._unread[index]
 
     def is_participant(self, user_id: UUID) -> bool:
         """Check if user is a participant."""
-        return user_id in (self._participant_1, self._participant_2)
+        return user_id in self._index
 
     def get_other_participant(self, user_id: UUID) -> UUID | None:
         """Get the other participant in the conversation."""
-        if user_id == self._participant_1:
-            return self._participant_2
-        elif user_id == self._participant_2:
-            return self._participant_1
-        return None
+        index = self._index.get(user_id)
+        if index is None:
+            return None
+        return self._participant_1 if index else self._participant_2
 
     def add_message(self, sender_id: UUID) -> None:
         """Register that a new message was added."""
-        self._last_message_at = datetime.utcnow()
-        self._updated_at = datetime.utcnow()
+        self._last_message_at = self._updated_at = datetime.utcnow()
 
         # Increment unread for the other participant
-        if sender_id == self._participant_1:
-            self._unread_count_2 += 1
-        elif sender_id == self._participant_2:
-            self._unread_count_1 += 1
+        index = self._index.get(sender_id)
+        if index is not None:
+            self._unread[1 - index] += 1
 
     def mark_as_read(self, user_id: UUID) -> None:
         """Mark all messages as read for a user."""
-        if user_id == self._participant_1:
-            self._unread_count_1 = 0
-        elif user_id == self._participant_2:
-            self._unread_count_2 = 0
+        index = self._index.get(user_id)
+        if index is not None:
+            self._unread[index] = 0
 
     def close(self) -> None:
         """Close the conversation."""
@@ -10,10 +10,35 @@ from src.shared.constants.enums import (
 )
 from src.shared.domain.entity import Entity
 
+# Bound once: mutators stamp naive UTC times on every call
+_utcnow = datetime.utcnow
+
+# Enum members bound once; member lookup on the class is comparatively slow
+_SENT = NotificationStatus.SENT
+_READ = NotificationStatus.READ
+_FAILED = NotificationStatus.FAILED
+_INFO = NotificationType.INFO
+_WARNING = NotificationType.WARNING
+_ALERT = NotificationType.ALERT
+
 
 class Notification(Entity[UUID]):
     """Notification entity for user communications."""
 
+    __slots__ = (
+        "_user_id",
+        "_title",
+        "_message",
+        "_notification_type",
+        "_channel",
+        "_status",
+        "_related_entity_type",
+        "_related_entity_id",
+        "_action_url",
+        "_read_at",
+        "_sent_at",
+    )
+
     def __init__(
         self,
         user_id: UUID,
@@ -42,7 +67,7 @@ class Notification(Entity[UUID]):
         self._action_url = action_url
         self._read_at = read_at
         self._sent_at = sent_at
-        self._created_at = created_at or datetime.utcnow()
+        self._created_at = created_at or _utcnow()
 
     @property
     def user_id(self) -> UUID:
@@ -98,17 +123,17 @@ class Notification(Entity[UUID]):
 
     def mark_as_sent(self) -> None:
         """Mark notification as sent."""
-        self._status = NotificationStatus.SENT
-        self._sent_at = datetime.utcnow()
+        self._status = _SENT
+        self._sent_at = _utcnow()
 
     def mark_as_read(self) -> None:
         """Mark notification as read."""
-        self._status = NotificationStatus.READ
-        self._read_at = datetime.utcnow()
+        self._status = _READ
+        self._read_at = _utcnow()
 
     def mark_as_failed(self) -> None:
         """Mark notification as failed."""
-        self._status = NotificationStatus.FAILED
+        self._status = _FAILED
 
     @classmethod
     def create_info(
@@ -123,7 +148,7 @@ class Notification(Entity[UUID]):
             user_id=user_id,
             title=title,
             message=message,
-            notification_type=NotificationType.INFO,
+            notification_type=_INFO,
             channel=channel,
         )
 
@@ -140,7 +165,7 @@ class Notification(Entity[UUID]):
             user_id=user_id,
             title=title,
             message=message,
-            notification_type=NotificationType.WARNING,
+            notification_type=_WARNING,
             channel=channel,
         )
 
@@ -157,6 +182,6 @@ class Notification(Entity[UUID]):
             user_id=user_id,
             title=title,
             message=message,
-            notification_type=NotificationType.ALERT,
+            notification_type=_ALERT,
             channel=channel,
         )
@@ -1,15 +1,47 @@
 """Resource entity for library management."""
 
+import sys
 from datetime import datetime
 from uuid import UUID, uuid4
 
 from src.shared.constants.enums import ResourceAccessLevel, ResourceType
 from src.shared.domain.aggregate_root import AggregateRoot
 
+# Bound once: mutators stamp naive UTC times on every call
+_utcnow = datetime.utcnow
+
+# Enum members bound once; member lookup on the class is comparatively slow
+_PUBLIC = ResourceAccessLevel.PUBLIC
+_MODALITY = ResourceAccessLevel.MODALITY
+
+
+def _normalize_tag(tag: str) -> str:
+    """Lower-case and trim a tag, skipping the copy when it is already normalized."""
+    tag = tag.strip()
+    return tag if tag.islower() else tag.lower()
+
 
 class Resource(AggregateRoot[UUID]):
     """Resource entity for training materials library."""
 
+    __slots__ = (
+        "_title",
+        "_description",
+        "_resource_type",
+        "_url",
+        "_file_path",
+        "_file_size",
+        "_mime_type",
+        "_modality_id",
+        "_access_level",
+        "_tags",
+        "_tags_view",
+        "_is_active",
+        "_created_by",
+        "_view_count",
+        "_download_count",
+    )
+
     def __init__(
         self,
         title: str,
@@ -38,11 +70,18 @@ class Resource(AggregateRoot[UUID]):
         self._mime_type = mime_type
         self._modality_id = modality_id
         self._access_level = access_level
-        self._tags = tags or []
+        # Ordered set: O(1) membership while keeping insertion order. Left
+        # unallocated (with a shared empty view) until the first tag
+        self._tags: dict[str, None] | None = dict.fromkeys(tags) if tags else None
+        self._tags_view: tuple[str, ...] | None = None if tags else ()
         self._is_active = is_active
         self._created_by = created_by
-        self._created_at = created_at or datetime.utcnow()
-        self._updated_at = updated_at or datetime.utcnow()
+        if created_at is None or updated_at is None:
+            now = _utcnow()
+            created_at = created_at or now
+            updated_at = updated_at or now
+        self._created_at = created_at
+        self._updated_at = updated_at
         self._view_count = 0
         self._download_count = 0
 
@@ -83,8 +122,11 @@ class Resource(AggregateRoot[UUID]):
         return self._access_level
 
     @property
-    def tags(self) -> list[str]:
-        return self._tags.copy()
+    def tags(self) -> tuple[str, ...]:
+        # Built on first read after a change and shared until the next one
+        if self._tags_view is None:
+            self._tags_view = tuple(self._tags or ())
+        return self._tags_view
 
     @property
     def is_active(self) -> bool:
@@ -127,32 +169,48 @@ class Resource(AggregateRoot[UUID]):
         url: str | None = None,
         access_level: ResourceAccessLevel | None = None,
     ) -> None:
-        """Update resource details."""
-        if title is not None:
+        """Update resource details.
+
+        The update timestamp is left alone when no field actually changes.
+        """
+        changed = False
+        if title is not None and title != self._title:
             self._title = title
-        if description is not None:
+            changed = True
+        if description is not None and description != self._description:
             self._description = description
-        if url is not None:
+            changed = True
+        if url is not None and url != self._url:
             self._url = url
-        if access_level is not None:
+            changed = True
+        if access_level is not None and access_level != self._access_level:
             self._access_level = access_level
-        self._updated_at = datetime.utcnow()
+            changed = True
+        if changed:
+            self._updated_at = _utcnow()
 
     def add_tag(self, tag: str) -> bool:
         """Add a tag to the resource."""
-        tag = tag.lower().strip()
-        if tag and tag not in self._tags:
-            self._tags.append(tag)
-            self._updated_at = datetime.utcnow()
-            return True
-        return False
+        tag = _normalize_tag(tag)
+        if not tag:
+            return False
+        if self._tags is None:
+            self._tags = {}
+        elif tag in self._tags:
+            return False
+        # Interned so the same tag shared across resources is stored once
+        self._tags[sys.intern(tag)] = None
+        self._tags_view = None
+        self._updated_at = _utcnow()
+        return True
 
     def remove_tag(self, tag: str) -> bool:
         """Remove a tag from the resource."""
-        tag = tag.lower().strip()
-        if tag in self._tags:
-            self._tags.remove(tag)
-            self._updated_at = datetime.utcnow()
+        tag = _normalize_tag(tag)
+        if self._tags is not None and tag in self._tags:
+            del self._tags[tag]
+            self._tags_view = None
+            self._updated_at = _utcnow()
             return True
         return False
 
@@ -167,19 +225,19 @@ class Resource(AggregateRoot[UUID]):
     def deactivate(self) -> None:
         """Deactivate the resource."""
         self._is_active = False
-        self._updated_at = datetime.utcnow()
+        self._updated_at = _utcnow()
 
     def activate(self) -> None:
         """Activate the resource."""
         self._is_active = True
-        self._updated_at = datetime.utcnow()
+        self._updated_at = _utcnow()
 
     def can_access(self, user_modality_id: UUID | None, is_admin: bool = False) -> bool:
         """Check if user can access this resource."""
         if is_admin:
             return True
-        if self._access_level == ResourceAccessLevel.PUBLIC:
+        if self._access_level == _PUBLIC:
             return True
-        if self._access_level == ResourceAccessLevel.MODALITY:
+        if self._access_level == _MODALITY:
             return self._modality_id == user_modality_id
         return False
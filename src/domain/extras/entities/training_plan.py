@@ -1,5 +1,8 @@
 """Training Plan entities."""
 
+import bisect
+import math
+from collections.abc import Callable
 from datetime import date, datetime
 from uuid import UUID, uuid4
 
@@ -7,10 +10,40 @@ from src.shared.constants.enums import GoalPriority, TrainingPlanStatus
 from src.shared.domain.aggregate_root import AggregateRoot
 from src.shared.domain.entity import Entity
 
+# Bound once: mutators stamp naive UTC times on every call
+_utcnow = datetime.utcnow
+
+# Enum members bound once; member lookup on the class is comparatively slow
+_ACTIVE = TrainingPlanStatus.ACTIVE
+_COMPLETED = TrainingPlanStatus.COMPLETED
+_ARCHIVED = TrainingPlanStatus.ARCHIVED
+_DRAFT = TrainingPlanStatus.DRAFT
+
+
+def _item_order(item: "PlanItem") -> int:
+    return item._order
+
 
 class PlanItem(Entity[UUID]):
     """Individual item in a training plan."""
 
+    __slots__ = (
+        "_plan_id",
+        "_title",
+        "_description",
+        "_competence_id",
+        "_order",
+        "_duration_hours",
+        "_is_required",
+        "_is_completed",
+        "_completed_at",
+        "_due_date",
+        "_notes",
+        "_resource_ids",
+        "_resource_ids_view",
+        "_on_change",
+    )
+
     def __init__(
         self,
         plan_id: UUID,
@@ -39,7 +72,14 @@ class PlanItem(Entity[UUID]):
         self._completed_at = completed_at
         self._due_date = due_date
         self._notes = notes
-        self._resource_ids = resource_ids or []
+        # Ordered set: O(1) membership while keeping insertion order. Left
+        # unallocated (with a shared empty view) until the first resource
+        self._resource_ids: dict[UUID, None] | None = (
+            dict.fromkeys(resource_ids) if resource_ids else None
+        )
+        self._resource_ids_view: tuple[UUID, ...] | None = None if resource_ids else ()
+        # Set by the owning plan so it can keep its aggregates current
+        self._on_change: Callable[[PlanItem, int], None] | None = None
 
     @property
     def plan_id(self) -> UUID:
@@ -86,37 +126,57 @@ class PlanItem(Entity[UUID]):
         return self._notes
 
     @property
-    def resource_ids(self) -> list[UUID]:
-        return self._resource_ids.copy()
+    def resource_ids(self) -> tuple[UUID, ...]:
+        # Built on first read after a change and shared until the next one
+        if self._resource_ids_view is None:
+            self._resource_ids_view = tuple(self._resource_ids or ())
+        return self._resource_ids_view
 
     @property
     def is_overdue(self) -> bool:
         """Check if item is overdue."""
+        return self.is_overdue_on(date.today())
+
+    def is_overdue_on(self, today: date) -> bool:
+        """Check if item is overdue as of the given date."""
         if self._is_completed or self._due_date is None:
             return False
-        return date.today() > self._due_date
+        return today > self._due_date
 
     def complete(self) -> None:
         """Mark item as completed."""
+        self._notify(-1)
         self._is_completed = True
-        self._completed_at = datetime.utcnow()
+        self._completed_at = _utcnow()
+        self._notify(1)
 
     def uncomplete(self) -> None:
         """Mark item as not completed."""
+        self._notify(-1)
         self._is_completed = False
         self._completed_at = None
+        self._notify(1)
+
+    def _notify(self, sign: int) -> None:
+        """Withdraw (-1) or re-apply (1) this item's share of the owning plan's totals."""
+        if self._on_change is not None:
+            self._on_change(self, sign)
 
     def add_resource(self, resource_id: UUID) -> bool:
         """Add a resource to the item."""
-        if resource_id not in self._resource_ids:
-            self._resource_ids.append(resource_id)
-            return True
-        return False
+        if self._resource_ids is None:
+            self._resource_ids = {}
+        elif resource_id in self._resource_ids:
+            return False
+        self._resource_ids[resource_id] = None
+        self._resource_ids_view = None
+        return True
 
     def remove_resource(self, resource_id: UUID) -> bool:
         """Remove a resource from the item."""
-        if resource_id in self._resource_ids:
-            self._resource_ids.remove(resource_id)
+        if self._resource_ids is not None and resource_id in self._resource_ids:
+            del self._resource_ids[resource_id]
+            self._resource_ids_view = None
             return True
         return False
 
@@ -133,8 +193,10 @@ class PlanItem(Entity[UUID]):
             self._title = title
         if description is not None:
             self._description = description
-        if duration_hours is not None:
+        if duration_hours is not None and duration_hours != self._duration_hours:
+            self._notify(-1)
             self._duration_hours = duration_hours
+            self._notify(1)
         if due_date is not None:
             self._due_date = due_date
         if notes is not None:
@@ -144,6 +206,25 @@ class PlanItem(Entity[UUID]):
 class TrainingPlan(AggregateRoot[UUID]):
     """Training plan entity with personalized suggestions."""
 
+    __slots__ = (
+        "_title",
+        "_description",
+        "_competitor_id",
+        "_modality_id",
+        "_status",
+        "_priority",
+        "_start_date",
+        "_end_date",
+        "_target_hours",
+        "_is_suggested",
+        "_created_by",
+        "_items",
+        "_sorted_items",
+        "_completed_count",
+        "_required_count",
+        "_required_completed_count",
+    )
+
     def __init__(
         self,
         title: str,
@@ -173,9 +254,21 @@ class TrainingPlan(AggregateRoot[UUID]):
         self._target_hours = target_hours
         self._is_suggested = is_suggested
         self._created_by = created_by
-        self._created_at = created_at or datetime.utcnow()
-        self._updated_at = updated_at or datetime.utcnow()
-        self._items: list[PlanItem] = []
+        if created_at is None or updated_at is None:
+            now = _utcnow()
+            created_at = created_at or now
+            updated_at = updated_at or now
+        self._created_at = created_at
+        self._updated_at = updated_at
+        # Keyed by the id's integer value (insertion ordered) so lookup and removal
+        # are a single probe; int hashing is much cheaper than UUID.__hash__
+        self._items: dict[int, PlanItem] = {}
+        # Same items kept sorted by order as they are added, removed or reordered
+        self._sorted_items: list[PlanItem] = []
+        # Running aggregates maintained by _track as items change
+        self._completed_count = 0
+        self._required_count = 0
+        self._required_completed_count = 0
 
     @property
     def title(self) -> str:
@@ -231,42 +324,40 @@ class TrainingPlan(AggregateRoot[UUID]):
 
     @property
     def items(self) -> list[PlanItem]:
-        return sorted(self._items, key=lambda x: x.order)
+        return self._sorted_items.copy()
 
     @property
     def total_hours(self) -> float:
-        """Calculate total hours from all items."""
-        return sum(item.duration_hours for item in self._items)
+        """Total hours from all items."""
+        return math.fsum(i._duration_hours for i in self._items.values())
 
     @property
     def completed_hours(self) -> float:
-        """Calculate completed hours."""
-        return sum(item.duration_hours for item in self._items if item.is_completed)
+        """Hours from completed items."""
+        return math.fsum(i._duration_hours for i in self._items.values() if i._is_completed)
 
     @property
     def progress_percentage(self) -> float:
         """Calculate plan progress percentage."""
         if not self._items:
             return 0.0
-        completed = sum(1 for item in self._items if item.is_completed)
-        return round((completed / len(self._items)) * 100, 2)
+        return round((self._completed_count / len(self._items)) * 100, 2)
 
     @property
     def required_items_completed(self) -> bool:
         """Check if all required items are completed."""
-        required = [item for item in self._items if item.is_required]
-        if not required:
-            return True
-        return all(item.is_completed for item in required)
+        return self._required_completed_count == self._required_count
 
     @property
     def is_overdue(self) -> bool:
         """Check if plan is overdue."""
-        if self._status == TrainingPlanStatus.COMPLETED:
-            return False
-        if self._end_date is None:
+        return self.is_overdue_on(date.today())
+
+    def is_overdue_on(self, today: date) -> bool:
+        """Check if plan is overdue as of the given date."""
+        if self._status == _COMPLETED or self._end_date is None:
             return False
-        return date.today() > self._end_date
+        return today > self._end_date
 
     def update(
         self,
@@ -277,76 +368,135 @@ class TrainingPlan(AggregateRoot[UUID]):
         end_date: date | None = None,
         target_hours: float | None = None,
     ) -> None:
-        """Update plan details."""
-        if title is not None:
+        """Update plan details.
+
+        The update timestamp is left alone when no field actually changes.
+        """
+        changed = False
+        if title is not None and title != self._title:
             self._title = title
-        if description is not None:
+            changed = True
+        if description is not None and description != self._description:
             self._description = description
-        if priority is not None:
+            changed = True
+        if priority is not None and priority != self._priority:
             self._priority = priority
-        if start_date is not None:
+            changed = True
+        if start_date is not None and start_date != self._start_date:
             self._start_date = start_date
-        if end_date is not None:
+            changed = True
+        if end_date is not None and end_date != self._end_date:
             self._end_date = end_date
-        if target_hours is not None:
+            changed = True
+        if target_hours is not None and target_hours != self._target_hours:
             self._target_hours = target_hours
-        self._updated_at = datetime.utcnow()
+            changed = True
+        if changed:
+            self._updated_at = _utcnow()
 
     def add_item(self, item: PlanItem) -> None:
         """Add an item to the plan."""
-        if not item.order:
+        key = item.id.int
+        previous = self._items.pop(key, None)
+        if previous is not None:
+            self._unlink_sorted(previous)
+            self._detach_item(previous)
+        if not item._order:
             item._order = len(self._items) + 1
-        self._items.append(item)
-        self._updated_at = datetime.utcnow()
+        self._items[key] = item
+        bisect.insort(self._sorted_items, item, key=_item_order)
+        item._on_change = self._track
+        self._track(item, 1)
+        self._updated_at = _utcnow()
 
     def remove_item(self, item_id: UUID) -> bool:
         """Remove an item from the plan."""
-        for i, item in enumerate(self._items):
-            if item.id == item_id:
-                self._items.pop(i)
-                self._updated_at = datetime.utcnow()
-                return True
-        return False
+        item = self._items.pop(item_id.int, None)
+        if item is None:
+            return False
+        self._unlink_sorted(item)
+        self._detach_item(item)
+        self._updated_at = _utcnow()
+        return True
 
     def reorder_items(self, item_ids: list[UUID]) -> None:
         """Reorder items based on provided ID list."""
-        id_to_item = {item.id: item for item in self._items}
-        new_order = []
-        for i, item_id in enumerate(item_ids):
-            if item_id in id_to_item:
-                item = id_to_item[item_id]
-                item._order = i + 1
-                new_order.append(item)
+        new_order: dict[int, PlanItem] = {}
+        take = self._items.pop
+        for position, item_id in enumerate(item_ids, 1):
+            key = item_id.int
+            item = take(key, None)
+            if item is not None:
+                item._order = position
+                new_order[key] = item
+        # Whatever was not listed is dropped from the plan
+        for dropped in self._items.values():
+            self._detach_item(dropped)
         self._items = new_order
-        self._updated_at = datetime.utcnow()
+        # Orders were assigned by position, so insertion order is already sorted
+        self._sorted_items = list(new_order.values())
+        self._updated_at = _utcnow()
+
+    def _unlink_sorted(self, item: PlanItem) -> None:
+        """Drop an item from the sorted list, locating it by order rather than equality."""
+        sorted_items = self._sorted_items
+        i = bisect.bisect_left(sorted_items, item._order, key=_item_order)
+        while sorted_items[i] is not item:
+            i += 1
+        del sorted_items[i]
+
+    def _detach_item(self, item: PlanItem) -> None:
+        """Stop tracking an item that is no longer part of the plan."""
+        item._on_change = None
+        self._track(item, -1)
+
+    def _track(self, item: PlanItem, sign: int) -> None:
+        """Add (1) or subtract (-1) an item's contribution to the running counts.
+
+        Hour totals are summed on read instead, so float rounding never
+        depends on the order items were added, removed or completed.
+        """
+        completed = item._is_completed
+        if completed:
+            self._completed_count += sign
+        if item._is_required:
+            self._required_count += sign
+            if completed:
+                self._required_completed_count += sign
 
     def activate(self) -> None:
         """Activate the plan."""
-        self._status = TrainingPlanStatus.ACTIVE
+        self._status = _ACTIVE
         if self._start_date is None:
             self._start_date = date.today()
-        self._updated_at = datetime.utcnow()
+        self._updated_at = _utcnow()
 
     def complete(self) -> None:
         """Mark plan as completed."""
-        self._status = TrainingPlanStatus.COMPLETED
-        self._updated_at = datetime.utcnow()
+        self._status = _COMPLETED
+        self._updated_at = _utcnow()
 
     def archive(self) -> None:
         """Archive the plan."""
-        self._status = TrainingPlanStatus.ARCHIVED
-        self._updated_at = datetime.utcnow()
+        self._status = _ARCHIVED
+        self._updated_at = _utcnow()
 
     def get_next_item(self) -> PlanItem | None:
         """Get the next incomplete item."""
-        for item in self.items:
-            if not item.is_completed:
-                return item
-        return None
+        return next((item for item in self._sorted_items if not item._is_completed), None)
+
+    def get_overdue_items(self, today: date | None = None) -> list[PlanItem]:
+        """Get all overdue items.
 
-    def get_overdue_items(self) -> list[PlanItem]:
-        """Get all overdue items."""
-        return [item for item in self._items if item.is_overdue]
+        Args:
+            today: Reference date, defaults to today.
+        """
+        today = today or date.today()
+        return [
+            item
+            for item in self._items.values()
+            if not item._is_completed and item._due_date is not None and today > item._due_date
+        ]
 
     @classmethod
     def create_suggested_plan(
@@ -365,5 +515,5 @@ class TrainingPlan(AggregateRoot[UUID]):
             modality_id=modality_id,
             description=description,
             is_suggested=True,
-            status=TrainingPlanStatus.DRAFT,
+            status=_DRAFT,
         )
@@ -1,16 +1,44 @@
-"""Extra features repository interfaces."""
-
-from src.domain.extras.repositories.badge_repository import AchievementRepository, BadgeRepository
-from src.domain.extras.repositories.event_repository import EventRepository, ScheduleRepository
-from src.domain.extras.repositories.feedback_repository import FeedbackRepository
-from src.domain.extras.repositories.goal_repository import GoalRepository
-from src.domain.extras.repositories.message_repository import (
-    ConversationRepository,
-    MessageRepository,
-)
-from src.domain.extras.repositories.notification_repository import NotificationRepository
-from src.domain.extras.repositories.resource_repository import ResourceRepository
-from src.domain.extras.repositories.training_plan_repository import TrainingPlanRepository
+"""Extra features repository interfaces.
+
+Interfaces are imported on first attribute access so that importing one
+repository module does not load all of the others.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.domain.extras.repositories.badge_repository import (
+        AchievementRepository,
+        BadgeRepository,
+    )
+    from src.domain.extras.repositories.event_repository import (
+        EventRepository,
+        ScheduleRepository,
+    )
+    from src.domain.extras.repositories.feedback_repository import FeedbackRepository
+    from src.domain.extras.repositories.goal_repository import GoalRepository
+    from src.domain.extras.repositories.message_repository import (
+        ConversationRepository,
+        MessageRepository,
+    )
+    from src.domain.extras.repositories.notification_repository import NotificationRepository
+    from src.domain.extras.repositories.resource_repository import ResourceRepository
+    from src.domain.extras.repositories.training_plan_repository import TrainingPlanRepository
+
+_MODULES = {
+    "NotificationRepository": "notification_repository",
+    "EventRepository": "event_repository",
+    "ScheduleRepository": "event_repository",
+    "ResourceRepository": "resource_repository",
+    "GoalRepository": "goal_repository",
+    "BadgeRepository": "badge_repository",
+    "AchievementRepository": "badge_repository",
+    "ConversationRepository": "message_repository",
+    "MessageRepository": "message_repository",
+    "FeedbackRepository": "feedback_repository",
+    "TrainingPlanRepository": "training_plan_repository",
+}
 
 __all__ = [
     "NotificationRepository",
@@ -25,3 +53,16 @@ __all__ = [
     "FeedbackRepository",
     "TrainingPlanRepository",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -1,9 +1,11 @@
 """Badge and Achievement repository interfaces."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from uuid import UUID
 
 from src.domain.extras.entities.badge import Achievement, Badge, UserPoints
+from src.domain.extras.exceptions import AchievementNotFoundException, BadgeNotFoundException
 from src.shared.constants.enums import BadgeCategory, BadgeRarity
 
 
@@ -20,6 +22,22 @@ class BadgeRepository(ABC):
         """Get badge by ID."""
         ...
 
+    @abstractmethod
+    async def get_by_ids(self, badge_ids: Sequence[UUID]) -> dict[UUID, Badge]:
+        """Get badges by ID in one query, keyed by ID."""
+        ...
+
+    async def get_or_raise(self, badge_id: UUID) -> Badge:
+        """Get badge by ID, failing if it does not exist.
+
+        Raises:
+            BadgeNotFoundException: If no badge has the ID.
+        """
+        badge = await self.get_by_id(badge_id)
+        if badge is None:
+            raise BadgeNotFoundException(str(badge_id))
+        return badge
+
     @abstractmethod
     async def get_all(
         self,
@@ -58,11 +76,32 @@ class AchievementRepository(ABC):
         """Save an achievement."""
         ...
 
+    @abstractmethod
+    async def save_many(self, achievements: Sequence[Achievement]) -> list[Achievement]:
+        """Save several achievements with a single multi-row insert."""
+        ...
+
     @abstractmethod
     async def get_by_id(self, achievement_id: UUID) -> Achievement | None:
         """Get achievement by ID."""
         ...
 
+    @abstractmethod
+    async def get_by_ids(self, achievement_ids: Sequence[UUID]) -> dict[UUID, Achievement]:
+        """Get achievements by ID in one query, keyed by ID."""
+        ...
+
+    async def get_or_raise(self, achievement_id: UUID) -> Achievement:
+        """Get achievement by ID, failing if it does not exist.
+
+        Raises:
+            AchievementNotFoundException: If no achievement has the ID.
+        """
+        achievement = await self.get_by_id(achievement_id)
+        if achievement is None:
+            raise AchievementNotFoundException(str(achievement_id))
+        return achievement
+
     @abstractmethod
     async def get_by_user(
         self,
@@ -86,6 +125,15 @@ class AchievementRepository(ABC):
         """Check if user has earned a specific badge."""
         ...
 
+    @abstractmethod
+    async def has_badges(self, user_id: UUID, badge_ids: Sequence[UUID]) -> set[UUID]:
+        """Get which of the given badges a user has earned, in one query.
+
+        Returns:
+            The subset of ``badge_ids`` the user holds.
+        """
+        ...
+
     @abstractmethod
     async def update(self, achievement: Achievement) -> Achievement:
         """Update an achievement."""
@@ -112,5 +160,9 @@ class AchievementRepository(ABC):
         modality_id: UUID | None = None,
         limit: int = 50,
     ) -> list[UserPoints]:
-        """Get gamification leaderboard."""
+        """Get gamification leaderboard.
+
+        Reads the running ``total_points`` kept per user, ordered descending
+        on its index, so no aggregation over achievements is needed.
+        """
         ...
@@ -1,11 +1,14 @@
 """Event and Schedule repository interfaces."""
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Sequence
 from datetime import datetime
 from uuid import UUID
 
 from src.domain.extras.entities.event import Event, Schedule
+from src.domain.extras.exceptions import EventNotFoundException, ScheduleNotFoundException
 from src.shared.constants.enums import EventStatus
+from src.shared.domain.pagination import Page
 
 
 class EventRepository(ABC):
@@ -21,6 +24,22 @@ class EventRepository(ABC):
         """Get event by ID."""
         ...
 
+    @abstractmethod
+    async def get_by_ids(self, event_ids: Sequence[UUID]) -> dict[UUID, Event]:
+        """Get events by ID in one query, keyed by ID."""
+        ...
+
+    async def get_or_raise(self, event_id: UUID) -> Event:
+        """Get event by ID, failing if it does not exist.
+
+        Raises:
+            EventNotFoundException: If no event has the ID.
+        """
+        event = await self.get_by_id(event_id)
+        if event is None:
+            raise EventNotFoundException(str(event_id))
+        return event
+
     @abstractmethod
     async def get_by_date_range(
         self,
@@ -47,9 +66,9 @@ class EventRepository(ABC):
         self,
         user_id: UUID,
         status: EventStatus | None = None,
-        skip: int = 0,
+        cursor: str | None = None,
         limit: int = 50,
-    ) -> list[Event]:
+    ) -> Page[Event]:
         """Get events where user is a participant."""
         ...
 
@@ -58,6 +77,15 @@ class EventRepository(ABC):
         """Get events that need reminders sent."""
         ...
 
+    @abstractmethod
+    def iter_needing_reminder(self, batch_size: int = 500) -> AsyncIterator[Event]:
+        """Iterate over events that need reminders sent.
+
+        Rows are streamed through a server-side cursor ``batch_size`` at a
+        time, so memory stays bounded however many rows match.
+        """
+        ...
+
     @abstractmethod
     async def update(self, event: Event) -> Event:
         """Update an event."""
@@ -69,13 +97,24 @@ class EventRepository(ABC):
         ...
 
     @abstractmethod
-    async def add_participant(self, event_id: UUID, user_id: UUID) -> bool:
-        """Add participant to event."""
+    async def add_participants(self, event_id: UUID, user_ids: Sequence[UUID]) -> int:
+        """Add participants to event.
+
+        Users who already participate are skipped (``INSERT ... ON CONFLICT
+        DO NOTHING``), all in one statement.
+
+        Returns:
+            Number of participants actually added.
+        """
         ...
 
     @abstractmethod
-    async def remove_participant(self, event_id: UUID, user_id: UUID) -> bool:
-        """Remove participant from event."""
+    async def remove_participants(self, event_id: UUID, user_ids: Sequence[UUID]) -> int:
+        """Remove participants from event with one DELETE.
+
+        Returns:
+            Number of participants actually removed.
+        """
         ...
 
 
@@ -92,6 +131,22 @@ class ScheduleRepository(ABC):
         """Get schedule by ID."""
         ...
 
+    @abstractmethod
+    async def get_by_ids(self, schedule_ids: Sequence[UUID]) -> dict[UUID, Schedule]:
+        """Get schedules by ID in one query, keyed by ID."""
+        ...
+
+    async def get_or_raise(self, schedule_id: UUID) -> Schedule:
+        """Get schedule by ID, failing if it does not exist.
+
+        Raises:
+            ScheduleNotFoundException: If no schedule has the ID.
+        """
+        schedule = await self.get_by_id(schedule_id)
+        if schedule is None:
+            raise ScheduleNotFoundException(str(schedule_id))
+        return schedule
+
     @abstractmethod
     async def get_by_user(
         self,
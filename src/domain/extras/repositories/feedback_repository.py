@@ -1,10 +1,13 @@
 """Feedback repository interface."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from uuid import UUID
 
 from src.domain.extras.entities.feedback import Feedback
+from src.domain.extras.exceptions import FeedbackNotFoundException
 from src.shared.constants.enums import FeedbackType
+from src.shared.domain.pagination import Page
 
 
 class FeedbackRepository(ABC):
@@ -20,15 +23,31 @@ class FeedbackRepository(ABC):
         """Get feedback by ID."""
         ...
 
+    @abstractmethod
+    async def get_by_ids(self, feedback_ids: Sequence[UUID]) -> dict[UUID, Feedback]:
+        """Get feedback by ID in one query, keyed by ID."""
+        ...
+
+    async def get_or_raise(self, feedback_id: UUID) -> Feedback:
+        """Get feedback by ID, failing if it does not exist.
+
+        Raises:
+            FeedbackNotFoundException: If no feedback has the ID.
+        """
+        feedback = await self.get_by_id(feedback_id)
+        if feedback is None:
+            raise FeedbackNotFoundException(str(feedback_id))
+        return feedback
+
     @abstractmethod
     async def get_by_competitor(
         self,
         competitor_id: UUID,
         feedback_type: FeedbackType | None = None,
         is_read: bool | None = None,
-        skip: int = 0,
+        cursor: str | None = None,
         limit: int = 50,
-    ) -> list[Feedback]:
+    ) -> Page[Feedback]:
         """Get feedback for a competitor."""
         ...
 
@@ -37,9 +56,9 @@ class FeedbackRepository(ABC):
         self,
         evaluator_id: UUID,
         competitor_id: UUID | None = None,
-        skip: int = 0,
+        cursor: str | None = None,
         limit: int = 50,
-    ) -> list[Feedback]:
+    ) -> Page[Feedback]:
         """Get feedback given by an evaluator."""
         ...
 
@@ -64,13 +83,25 @@ class FeedbackRepository(ABC):
     async def get_unread_count(
         self,
         competitor_id: UUID,
+        cap: int | None = None,
     ) -> int:
-        """Get unread feedback count for a competitor."""
+        """Get unread feedback count for a competitor.
+
+        Args:
+            cap: Stop counting after this many rows, so the cost is bounded for
+                large backlogs; the result is ``min(actual, cap)``.
+        """
         ...
 
     @abstractmethod
     async def mark_as_read(self, feedback_id: UUID) -> bool:
-        """Mark feedback as read."""
+        """Mark feedback as read.
+
+        Implemented as a single UPDATE by ID, without loading the entity.
+
+        Returns:
+            False if no feedback has the ID.
+        """
         ...
 
     @abstractmethod
@@ -1,10 +1,13 @@
 """Goal repository interface."""
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Sequence
 from uuid import UUID
 
 from src.domain.extras.entities.goal import Goal, Milestone
+from src.domain.extras.exceptions import GoalNotFoundException
 from src.shared.constants.enums import GoalStatus
+from src.shared.domain.pagination import Page
 
 
 class GoalRepository(ABC):
@@ -20,16 +23,39 @@ class GoalRepository(ABC):
         """Get goal by ID."""
         ...
 
+    @abstractmethod
+    async def get_by_ids(self, goal_ids: Sequence[UUID]) -> dict[UUID, Goal]:
+        """Get goals by ID in one query, keyed by ID."""
+        ...
+
+    async def get_or_raise(self, goal_id: UUID) -> Goal:
+        """Get goal by ID, failing if it does not exist.
+
+        Raises:
+            GoalNotFoundException: If no goal has the ID.
+        """
+        goal = await self.get_by_id(goal_id)
+        if goal is None:
+            raise GoalNotFoundException(str(goal_id))
+        return goal
+
     @abstractmethod
     async def get_by_competitor(
         self,
         competitor_id: UUID,
         status: GoalStatus | None = None,
         modality_id: UUID | None = None,
-        skip: int = 0,
+        cursor: str | None = None,
         limit: int = 50,
-    ) -> list[Goal]:
-        """Get goals for a competitor."""
+        include: frozenset[str] = frozenset(),
+    ) -> Page[Goal]:
+        """Get goals for a competitor.
+
+        Args:
+            include: Child collections to eager-load with the page in one extra
+                query (``"milestones"``). Entities are returned without the
+                collections that are not listed.
+        """
         ...
 
     @abstractmethod
@@ -50,6 +76,20 @@ class GoalRepository(ABC):
         """Get overdue goals (RN10)."""
         ...
 
+    @abstractmethod
+    def iter_overdue(
+        self,
+        competitor_id: UUID | None = None,
+        modality_id: UUID | None = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[Goal]:
+        """Iterate over overdue goals (RN10).
+
+        Rows are streamed through a server-side cursor ``batch_size`` at a
+        time, so memory stays bounded however many rows match.
+        """
+        ...
+
     @abstractmethod
     async def get_needing_alert(
         self,
@@ -58,6 +98,19 @@ class GoalRepository(ABC):
         """Get goals needing alerts (RN10)."""
         ...
 
+    @abstractmethod
+    def iter_needing_alert(
+        self,
+        days_threshold: int = 7,
+        batch_size: int = 500,
+    ) -> AsyncIterator[Goal]:
+        """Iterate over goals needing alerts (RN10).
+
+        Rows are streamed through a server-side cursor ``batch_size`` at a
+        time, so memory stays bounded however many rows match.
+        """
+        ...
+
     @abstractmethod
     async def update(self, goal: Goal) -> Goal:
         """Update a goal."""
@@ -73,6 +126,11 @@ class GoalRepository(ABC):
         """Save a milestone."""
         ...
 
+    @abstractmethod
+    async def save_milestones(self, milestones: Sequence[Milestone]) -> list[Milestone]:
+        """Save several milestones with a single multi-row insert."""
+        ...
+
     @abstractmethod
     async def get_milestone(self, milestone_id: UUID) -> Milestone | None:
         """Get milestone by ID."""
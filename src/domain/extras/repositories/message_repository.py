@@ -1,9 +1,12 @@
 """Message and Conversation repository interfaces."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from uuid import UUID
 
 from src.domain.extras.entities.message import Conversation, Message
+from src.domain.extras.exceptions import ConversationNotFoundException, MessageNotFoundException
+from src.shared.domain.pagination import Page
 
 
 class ConversationRepository(ABC):
@@ -19,6 +22,22 @@ class ConversationRepository(ABC):
         """Get conversation by ID."""
         ...
 
+    @abstractmethod
+    async def get_by_ids(self, conversation_ids: Sequence[UUID]) -> dict[UUID, Conversation]:
+        """Get conversations by ID in one query, keyed by ID."""
+        ...
+
+    async def get_or_raise(self, conversation_id: UUID) -> Conversation:
+        """Get conversation by ID, failing if it does not exist.
+
+        Raises:
+            ConversationNotFoundException: If no conversation has the ID.
+        """
+        conversation = await self.get_by_id(conversation_id)
+        if conversation is None:
+            raise ConversationNotFoundException(str(conversation_id))
+        return conversation
+
     @abstractmethod
     async def get_by_participants(
         self,
@@ -33,18 +52,20 @@ class ConversationRepository(ABC):
         self,
         user_id: UUID,
         is_active: bool | None = None,
-        skip: int = 0,
+        unread_only: bool = False,
+        cursor: str | None = None,
         limit: int = 50,
-    ) -> list[Conversation]:
-        """Get conversations for a user."""
-        ...
+    ) -> Page[Conversation]:
+        """Get conversations for a user, most recently active first.
 
-    @abstractmethod
-    async def get_with_unread(
-        self,
-        user_id: UUID,
-    ) -> list[Conversation]:
-        """Get conversations with unread messages."""
+        Pages are keyed on ``(updated_at, id)`` rather than ``created_at``.
+        Each conversation carries its per-participant unread counters, so an
+        inbox with unread badges is a single query.
+
+        Args:
+            unread_only: Only return conversations with messages the user has
+                not read.
+        """
         ...
 
     @abstractmethod
@@ -66,20 +87,40 @@ class MessageRepository(ABC):
         """Save a message."""
         ...
 
+    @abstractmethod
+    async def save_many(self, messages: Sequence[Message]) -> list[Message]:
+        """Save several messages with a single multi-row insert."""
+        ...
+
     @abstractmethod
     async def get_by_id(self, message_id: UUID) -> Message | None:
         """Get message by ID."""
         ...
 
+    @abstractmethod
+    async def get_by_ids(self, message_ids: Sequence[UUID]) -> dict[UUID, Message]:
+        """Get messages by ID in one query, keyed by ID."""
+        ...
+
+    async def get_or_raise(self, message_id: UUID) -> Message:
+        """Get message by ID, failing if it does not exist.
+
+        Raises:
+            MessageNotFoundException: If no message has the ID.
+        """
+        message = await self.get_by_id(message_id)
+        if message is None:
+            raise MessageNotFoundException(str(message_id))
+        return message
+
     @abstractmethod
     async def get_by_conversation(
         self,
         conversation_id: UUID,
-        skip: int = 0,
+        cursor: str | None = None,
         limit: int = 50,
-        before_id: UUID | None = None,
-    ) -> list[Message]:
-        """Get messages for a conversation."""
+    ) -> Page[Message]:
+        """Get messages for a conversation, newest first."""
         ...
 
     @abstractmethod
@@ -87,8 +128,14 @@ class MessageRepository(ABC):
         self,
         conversation_id: UUID,
         user_id: UUID,
+        cap: int | None = None,
     ) -> int:
-        """Get unread message count for a user in a conversation."""
+        """Get unread message count for a user in a conversation.
+
+        Args:
+            cap: Stop counting after this many rows, so the cost is bounded for
+                large backlogs; the result is ``min(actual, cap)``.
+        """
         ...
 
     @abstractmethod
@@ -105,7 +152,12 @@ class MessageRepository(ABC):
         conversation_id: UUID,
         user_id: UUID,
     ) -> int:
-        """Mark all messages in conversation as read. Returns count."""
+        """Mark all messages in conversation as read. Returns count.
+
+        Must be a single set-based UPDATE over the unread messages the other
+        participant sent; loading and saving the messages one by one is not an
+        acceptable implementation.
+        """
         ...
 
     @abstractmethod
@@ -118,8 +170,12 @@ class MessageRepository(ABC):
         self,
         conversation_id: UUID,
         query: str,
-        skip: int = 0,
+        cursor: str | None = None,
         limit: int = 50,
-    ) -> list[Message]:
-        """Search messages in a conversation."""
+    ) -> Page[Message]:
+        """Search messages in a conversation, newest first.
+
+        ``query`` is web-search syntax matched as full text against the message
+        content (``websearch_to_tsquery``), not a substring.
+        """
         ...
@@ -1,10 +1,13 @@
 """Notification repository interface."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from uuid import UUID
 
 from src.domain.extras.entities.notification import Notification
+from src.domain.extras.exceptions import NotificationNotFoundException
 from src.shared.constants.enums import NotificationStatus, NotificationType
+from src.shared.domain.pagination import Page
 
 
 class NotificationRepository(ABC):
@@ -15,36 +18,73 @@ class NotificationRepository(ABC):
         """Save a notification."""
         ...
 
+    @abstractmethod
+    async def save_many(self, notifications: Sequence[Notification]) -> list[Notification]:
+        """Save several notifications with a single multi-row insert."""
+        ...
+
     @abstractmethod
     async def get_by_id(self, notification_id: UUID) -> Notification | None:
         """Get notification by ID."""
         ...
 
+    @abstractmethod
+    async def get_by_ids(self, notification_ids: Sequence[UUID]) -> dict[UUID, Notification]:
+        """Get notifications by ID in one query, keyed by ID."""
+        ...
+
+    async def get_or_raise(self, notification_id: UUID) -> Notification:
+        """Get notification by ID, failing if it does not exist.
+
+        Raises:
+            NotificationNotFoundException: If no notification has the ID.
+        """
+        notification = await self.get_by_id(notification_id)
+        if notification is None:
+            raise NotificationNotFoundException(str(notification_id))
+        return notification
+
     @abstractmethod
     async def get_by_user(
         self,
         user_id: UUID,
         status: NotificationStatus | None = None,
         notification_type: NotificationType | None = None,
-        skip: int = 0,
+        cursor: str | None = None,
         limit: int = 50,
-    ) -> list[Notification]:
+    ) -> Page[Notification]:
         """Get notifications for a user."""
         ...
 
     @abstractmethod
-    async def count_unread(self, user_id: UUID) -> int:
-        """Count unread notifications for a user."""
+    async def count_unread(self, user_id: UUID, cap: int | None = None) -> int:
+        """Count unread notifications for a user.
+
+        Args:
+            cap: Stop counting after this many rows, so the cost is bounded for
+                large backlogs; the result is ``min(actual, cap)``.
+        """
         ...
 
     @abstractmethod
     async def mark_as_read(self, notification_id: UUID) -> bool:
-        """Mark notification as read."""
+        """Mark notification as read.
+
+        Implemented as a single UPDATE by ID, without loading the entity.
+
+        Returns:
+            False if no notification has the ID.
+        """
         ...
 
     @abstractmethod
     async def mark_all_as_read(self, user_id: UUID) -> int:
-        """Mark all notifications as read for a user. Returns count."""
+        """Mark all notifications as read for a user. Returns count.
+
+        Must be a single set-based UPDATE over the user's unread rows; loading
+        and saving the notifications one by one is not an acceptable
+        implementation.
+        """
         ...
 
     @abstractmethod
@@ -54,5 +94,8 @@ class NotificationRepository(ABC):
 
     @abstractmethod
     async def delete_old(self, days: int = 30) -> int:
-        """Delete notifications older than specified days. Returns count."""
+        """Delete notifications older than specified days. Returns count.
+
+        Must be a single DELETE on ``created_at``, not a per-row loop.
+        """
         ...
@@ -1,10 +1,13 @@
 """Resource repository interface."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Mapping, Sequence
 from uuid import UUID
 
 from src.domain.extras.entities.resource import Resource
+from src.domain.extras.exceptions import ResourceNotFoundException
 from src.shared.constants.enums import ResourceType
+from src.shared.domain.pagination import Page
 
 
 class ResourceRepository(ABC):
@@ -20,15 +23,31 @@ class ResourceRepository(ABC):
         """Get resource by ID."""
         ...
 
+    @abstractmethod
+    async def get_by_ids(self, resource_ids: Sequence[UUID]) -> dict[UUID, Resource]:
+        """Get resources by ID in one query, keyed by ID."""
+        ...
+
+    async def get_or_raise(self, resource_id: UUID) -> Resource:
+        """Get resource by ID, failing if it does not exist.
+
+        Raises:
+            ResourceNotFoundException: If no resource has the ID.
+        """
+        resource = await self.get_by_id(resource_id)
+        if resource is None:
+            raise ResourceNotFoundException(str(resource_id))
+        return resource
+
     @abstractmethod
     async def get_by_modality(
         self,
         modality_id: UUID,
         resource_type: ResourceType | None = None,
         is_active: bool = True,
-        skip: int = 0,
+        cursor: str | None = None,
         limit: int = 50,
-    ) -> list[Resource]:
+    ) -> Page[Resource]:
         """Get resources for a modality."""
         ...
 
@@ -36,9 +55,9 @@ class ResourceRepository(ABC):
     async def get_public(
         self,
         resource_type: ResourceType | None = None,
-        skip: int = 0,
+        cursor: str | None = None,
         limit: int = 50,
-    ) -> list[Resource]:
+    ) -> Page[Resource]:
         """Get public resources."""
         ...
 
@@ -49,10 +68,14 @@ class ResourceRepository(ABC):
         modality_id: UUID | None = None,
         resource_type: ResourceType | None = None,
         tags: list[str] | None = None,
-        skip: int = 0,
+        cursor: str | None = None,
         limit: int = 50,
-    ) -> list[Resource]:
-        """Search resources."""
+    ) -> Page[Resource]:
+        """Search resources, newest first.
+
+        ``query`` is web-search syntax matched as full text against the title
+        and description (``websearch_to_tsquery``), not a substring.
+        """
         ...
 
     @abstractmethod
@@ -60,10 +83,14 @@ class ResourceRepository(ABC):
         self,
         tags: list[str],
         modality_id: UUID | None = None,
-        skip: int = 0,
+        cursor: str | None = None,
         limit: int = 50,
-    ) -> list[Resource]:
-        """Get resources by tags."""
+    ) -> Page[Resource]:
+        """Get resources having any of the tags, newest first.
+
+        Tags are matched with the JSONB any-element operator
+        (``tags ?| :tags``), which the GIN index on active resources serves.
+        """
         ...
 
     @abstractmethod
@@ -78,12 +105,35 @@ class ResourceRepository(ABC):
 
     @abstractmethod
     async def increment_view_count(self, resource_id: UUID) -> bool:
-        """Increment view count."""
+        """Increment view count.
+
+        Returns:
+            True if the increment was recorded. Implementations that defer the
+            write, such as ``BufferedResourceRepository``, return True without
+            checking that the resource exists.
+        """
         ...
 
     @abstractmethod
     async def increment_download_count(self, resource_id: UUID) -> bool:
-        """Increment download count."""
+        """Increment download count.
+
+        Returns:
+            True if the increment was recorded. Implementations that defer the
+            write, such as ``BufferedResourceRepository``, return True without
+            checking that the resource exists.
+        """
+        ...
+
+    @abstractmethod
+    async def add_counts(self, deltas: Mapping[UUID, tuple[int, int]]) -> None:
+        """Add buffered view and download counts to several resources.
+
+        Applied with one ``UPDATE ... FROM (VALUES ...)`` statement.
+
+        Args:
+            deltas: ``(views, downloads)`` to add, keyed by resource ID.
+        """
         ...
 
     @abstractmethod
@@ -92,5 +142,10 @@ class ResourceRepository(ABC):
         modality_id: UUID | None = None,
         limit: int = 10,
     ) -> list[Resource]:
-        """Get popular resources by view/download count."""
+        """Get popular resources by view/download count.
+
+        Ordered by ``view_count + download_count`` descending, the expression
+        the popularity index is built on, so the top ``limit`` rows are read
+        straight from the index.
+        """
         ...
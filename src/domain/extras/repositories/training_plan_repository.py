@@ -1,10 +1,13 @@
 """Training plan repository interface."""
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Sequence
 from uuid import UUID
 
 from src.domain.extras.entities.training_plan import PlanItem, TrainingPlan
+from src.domain.extras.exceptions import TrainingPlanNotFoundException
 from src.shared.constants.enums import TrainingPlanStatus
+from src.shared.domain.pagination import Page
 
 
 class TrainingPlanRepository(ABC):
@@ -20,16 +23,39 @@ class TrainingPlanRepository(ABC):
         """Get training plan by ID."""
         ...
 
+    @abstractmethod
+    async def get_by_ids(self, plan_ids: Sequence[UUID]) -> dict[UUID, TrainingPlan]:
+        """Get training plans by ID in one query, keyed by ID."""
+        ...
+
+    async def get_or_raise(self, plan_id: UUID) -> TrainingPlan:
+        """Get training plan by ID, failing if it does not exist.
+
+        Raises:
+            TrainingPlanNotFoundException: If no training plan has the ID.
+        """
+        plan = await self.get_by_id(plan_id)
+        if plan is None:
+            raise TrainingPlanNotFoundException(str(plan_id))
+        return plan
+
     @abstractmethod
     async def get_by_competitor(
         self,
         competitor_id: UUID,
         status: TrainingPlanStatus | None = None,
         modality_id: UUID | None = None,
-        skip: int = 0,
+        cursor: str | None = None,
         limit: int = 50,
-    ) -> list[TrainingPlan]:
-        """Get training plans for a competitor."""
+        include: frozenset[str] = frozenset(),
+    ) -> Page[TrainingPlan]:
+        """Get training plans for a competitor.
+
+        Args:
+            include: Child collections to eager-load with the page in one extra
+                query (``"items"``). Entities are returned without the
+                collections that are not listed.
+        """
         ...
 
     @abstractmethod
@@ -58,6 +84,19 @@ class TrainingPlanRepository(ABC):
         """Get overdue training plans."""
         ...
 
+    @abstractmethod
+    def iter_overdue(
+        self,
+        competitor_id: UUID | None = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[TrainingPlan]:
+        """Iterate over overdue training plans.
+
+        Rows are streamed through a server-side cursor ``batch_size`` at a
+        time, so memory stays bounded however many rows match.
+        """
+        ...
+
     @abstractmethod
     async def update(self, plan: TrainingPlan) -> TrainingPlan:
         """Update a training plan."""
@@ -73,6 +112,11 @@ class TrainingPlanRepository(ABC):
         """Save a plan item."""
         ...
 
+    @abstractmethod
+    async def save_items(self, items: Sequence[PlanItem]) -> list[PlanItem]:
+        """Save several plan items with a single multi-row insert."""
+        ...
+
     @abstractmethod
     async def get_item(self, item_id: UUID) -> PlanItem | None:
         """Get plan item by ID."""
@@ -95,5 +139,9 @@ class TrainingPlanRepository(ABC):
 
     @abstractmethod
     async def reorder_items(self, plan_id: UUID, item_ids: list[UUID]) -> bool:
-        """Reorder plan items."""
+        """Reorder plan items.
+
+        Positions follow ``item_ids`` and are written with one statement
+        (``UPDATE ... FROM (VALUES ...)``) rather than one per item.
+        """
         ...
@@ -12,6 +12,8 @@ class Permission(Entity[UUID]):
     Permissions are granular access rights that can be assigned to roles.
     """
 
+    __slots__ = ("_name", "_description", "_resource", "_action", "_code")
+
     def __init__(
         self,
         name: str,
@@ -27,6 +29,7 @@ class Permission(Entity[UUID]):
         self._description = description
         self._resource = resource
         self._action = action
+        self._code = f"{resource}:{action}"
 
     @property
     def name(self) -> str:
@@ -51,7 +54,7 @@ class Permission(Entity[UUID]):
     @property
     def code(self) -> str:
         """Get permission code (resource:action format)."""
-        return f"{self._resource}:{self._action}"
+        return self._code
 
     def __repr__(self) -> str:
         return f"Permission(id={self._id}, code={self.code})"
@@ -13,6 +13,8 @@ class RefreshToken(Entity[UUID]):
     Stores refresh tokens in database to allow revocation and tracking.
     """
 
+    __slots__ = ("_user_id", "_token", "_expires_at", "_user_agent", "_ip_address", "_is_revoked")
+
     def __init__(
         self,
         user_id: UUID,
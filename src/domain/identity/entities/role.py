@@ -14,6 +14,8 @@ class Role(Entity[UUID]):
     Roles group permissions together for easier assignment to users.
     """
 
+    __slots__ = ("_name", "_description", "_permissions", "_permission_codes")
+
     def __init__(
         self,
         name: UserRole,
@@ -27,6 +29,7 @@ class Role(Entity[UUID]):
         self._name = name
         self._description = description
         self._permissions: list[Permission] = permissions or []
+        self._permission_codes: set[str] = {p.code for p in self._permissions}
 
     @property
     def name(self) -> UserRole:
@@ -52,7 +55,7 @@ class Role(Entity[UUID]):
         Returns:
             True if role has the permission.
         """
-        return any(p.code == permission_code for p in self._permissions)
+        return permission_code in self._permission_codes
 
     def add_permission(self, permission: Permission) -> None:
         """Add a permission to this role.
@@ -62,6 +65,7 @@ class Role(Entity[UUID]):
         """
         if not self.has_permission(permission.code):
             self._permissions.append(permission)
+            self._permission_codes.add(permission.code)
             self._touch()
 
     def remove_permission(self, permission_code: str) -> bool:
@@ -73,12 +77,12 @@ class Role(Entity[UUID]):
         Returns:
             True if permission was removed.
         """
-        for i, p in enumerate(self._permissions):
-            if p.code == permission_code:
-                self._permissions.pop(i)
-                self._touch()
-                return True
-        return False
+        if permission_code not in self._permission_codes:
+            return False
+        self._permissions = [p for p in self._permissions if p.code != permission_code]
+        self._permission_codes.discard(permission_code)
+        self._touch()
+        return True
 
     def __repr__(self) -> str:
         return f"Role(id={self._id}, name={self._name.value})"
@@ -20,6 +20,18 @@ class User(AggregateRoot[UUID]):
     and role-based access control.
     """
 
+    __slots__ = (
+        "_email",
+        "_password",
+        "_full_name",
+        "_role",
+        "_status",
+        "_is_active",
+        "_role_entity",
+        "_last_login_at",
+        "_must_change_password",
+    )
+
     def __init__(
         self,
         email: Email,
@@ -40,6 +52,7 @@ class User(AggregateRoot[UUID]):
         self._full_name = full_name
         self._role = role
         self._status = status
+        self._is_active = status is UserStatus.ACTIVE
         self._role_entity = role_entity
         self._last_login_at = last_login_at
         self._must_change_password = must_change_password
@@ -87,22 +100,22 @@ class User(AggregateRoot[UUID]):
     @property
     def is_active(self) -> bool:
         """Check if user is active."""
-        return self._status == UserStatus.ACTIVE
+        return self._is_active
 
     @property
     def is_super_admin(self) -> bool:
         """Check if user is super admin."""
-        return self._role == UserRole.SUPER_ADMIN
+        return self._role is UserRole.SUPER_ADMIN
 
     @property
     def is_evaluator(self) -> bool:
         """Check if user is evaluator."""
-        return self._role == UserRole.EVALUATOR
+        return self._role is UserRole.EVALUATOR
 
     @property
     def is_competitor(self) -> bool:
         """Check if user is competitor."""
-        return self._role == UserRole.COMPETITOR
+        return self._role is UserRole.COMPETITOR
 
     def update_email(self, new_email: Email) -> None:
         """Update user email.
@@ -149,16 +162,19 @@ class User(AggregateRoot[UUID]):
     def activate(self) -> None:
         """Activate user account."""
         self._status = UserStatus.ACTIVE
+        self._is_active = True
         self._touch()
 
     def deactivate(self) -> None:
         """Deactivate user account."""
         self._status = UserStatus.INACTIVE
+        self._is_active = False
         self._touch()
 
     def suspend(self) -> None:
         """Suspend user account."""
         self._status = UserStatus.SUSPENDED
+        self._is_active = False
         self._touch()
 
     def record_login(self, login_time: datetime) -> None:
@@ -176,7 +192,7 @@ class User(AggregateRoot[UUID]):
         Raises:
             UserInactiveException: If user is not active.
         """
-        if not self.is_active:
+        if not self._is_active:
             raise UserInactiveException(
                 user_id=str(self._id),
                 status=self._status.value,
@@ -1,6 +1,7 @@
 """Refresh token repository interface."""
 
 from abc import abstractmethod
+from collections.abc import Sequence
 from uuid import UUID
 
 from src.domain.identity.entities.refresh_token import RefreshToken
@@ -22,6 +23,18 @@ class RefreshTokenRepository(Repository[RefreshToken, UUID]):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_by_tokens(self, tokens: Sequence[str]) -> dict[str, RefreshToken]:
+        """Get refresh tokens by token string in one query.
+
+        Args:
+            tokens: Token strings. Unknown tokens are left out of the result.
+
+        Returns:
+            Found refresh tokens keyed by token string.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def get_by_user_id(self, user_id: UUID) -> list[RefreshToken]:
         """Get all refresh tokens for a user.
@@ -1,6 +1,7 @@
 """User repository interface."""
 
 from abc import abstractmethod
+from collections.abc import Sequence
 from uuid import UUID
 
 from src.domain.identity.entities.user import User
@@ -26,6 +27,30 @@ class UserRepository(Repository[User, UUID]):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_by_ids(self, user_ids: Sequence[UUID]) -> dict[UUID, User]:
+        """Get users by ID in one query, keyed by ID.
+
+        Args:
+            user_ids: User identifiers. Unknown IDs are left out of the result.
+
+        Returns:
+            Found users keyed by ID.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_by_emails(self, emails: Sequence[str]) -> dict[str, User]:
+        """Get users by email address in one query.
+
+        Args:
+            emails: Email addresses, matched case-insensitively.
+
+        Returns:
+            Found users keyed by normalized (lowercase) email.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def get_by_role(
         self,
@@ -71,6 +96,18 @@ class UserRepository(Repository[User, UUID]):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def count_by_role(self, role: UserRole) -> int:
+        """Count users with a specific role.
+
+        Args:
+            role: User role to filter by.
+
+        Returns:
+            Number of users with the role.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def email_exists(self, email: str) -> bool:
         """Check if email is already registered.
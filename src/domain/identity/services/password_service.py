@@ -1,6 +1,8 @@
 """Password domain service interface."""
 
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 
 
 class PasswordService(ABC):
@@ -34,3 +36,21 @@ class PasswordService(ABC):
             True if password matches, False otherwise.
         """
         raise NotImplementedError
+
+    async def verify_password_batch(self, pairs: Sequence[tuple[str, str]]) -> list[bool]:
+        """Verify several passwords against their hashes in parallel.
+
+        Key derivation in bcrypt and Argon2 runs in C with the GIL released,
+        so each check runs in a worker thread, off the event loop.
+
+        Args:
+            pairs: ``(plain_password, hashed_password)`` pairs to verify.
+
+        Returns:
+            Whether each password matches, in the order of ``pairs``.
+        """
+        return list(
+            await asyncio.gather(
+                *(asyncio.to_thread(self.verify_password, plain, hashed) for plain, hashed in pairs)
+            )
+        )
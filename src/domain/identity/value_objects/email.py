@@ -13,6 +13,8 @@ class Email(ValueObject):
     Ensures email format is valid and normalizes the value.
     """
 
+    __slots__ = ("_value", "_at")
+
     def __init__(self, value: str) -> None:
         normalized = value.strip().lower()
 
@@ -31,6 +33,7 @@ class Email(ValueObject):
             )
 
         self._value = normalized
+        self._at = normalized.rindex("@")
 
     @property
     def value(self) -> str:
@@ -40,12 +43,12 @@ class Email(ValueObject):
     @property
     def domain(self) -> str:
         """Get email domain."""
-        return self._value.split("@")[1]
+        return self._value[self._at + 1 :]
 
     @property
     def local_part(self) -> str:
         """Get local part of email (before @)."""
-        return self._value.split("@")[0]
+        return self._value[: self._at]
 
     def _get_equality_components(self) -> tuple[Any, ...]:
         return (self._value,)
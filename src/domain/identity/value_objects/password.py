@@ -15,6 +15,8 @@ class Password(ValueObject):
     Use Password.create() for creating from a raw password.
     """
 
+    __slots__ = ("_hashed_value",)
+
     def __init__(self, hashed_value: str) -> None:
         if not hashed_value:
             raise InvalidValueException(
@@ -13,6 +13,8 @@ class UserId(ValueObject):
     Wraps a UUID to provide type safety and validation.
     """
 
+    __slots__ = ("_value",)
+
     def __init__(self, value: UUID | str | None = None) -> None:
         if value is None:
             self._value = uuid4()
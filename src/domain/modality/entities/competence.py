@@ -13,6 +13,8 @@ class Competence(Entity[UUID]):
     are evaluated on during training and competitions.
     """
 
+    __slots__ = ("_name", "_description", "_modality_id", "_weight", "_max_score", "_is_active")
+
     def __init__(
         self,
         name: str,
@@ -13,6 +13,18 @@ class Competitor(AggregateRoot[UUID]):
     information like birth date, document numbers, and modality enrollments.
     """
 
+    __slots__ = (
+        "_user_id",
+        "_full_name",
+        "_birth_date",
+        "_document_number",
+        "_phone",
+        "_emergency_contact",
+        "_emergency_phone",
+        "_notes",
+        "_is_active",
+    )
+
     def __init__(
         self,
         user_id: UUID,
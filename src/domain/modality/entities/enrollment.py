@@ -23,6 +23,15 @@ class Enrollment(Entity[UUID]):
     enrollment-specific data.
     """
 
+    __slots__ = (
+        "_competitor_id",
+        "_modality_id",
+        "_evaluator_id",
+        "_enrolled_at",
+        "_status",
+        "_notes",
+    )
+
     def __init__(
         self,
         competitor_id: UUID,
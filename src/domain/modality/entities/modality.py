@@ -15,6 +15,15 @@ class Modality(AggregateRoot[UUID]):
     Industrial Mechanics) with its competences.
     """
 
+    __slots__ = (
+        "_code",
+        "_name",
+        "_description",
+        "_is_active",
+        "_min_training_hours",
+        "_competences",
+    )
+
     def __init__(
         self,
         code: ModalityCode,
@@ -15,6 +15,8 @@ class ModalityCode(ValueObject):
     Examples: WS17, IT, MECH01, AUTO
     """
 
+    __slots__ = ("_value",)
+
     PATTERN = re.compile(r"^[A-Z]{2,4}(\d{2,3})?$")
 
     def __init__(self, value: str) -> None:
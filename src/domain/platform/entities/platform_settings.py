@@ -14,6 +14,16 @@ class PlatformSettings(Entity[UUID]):
     logos, and visual customization options.
     """
 
+    __slots__ = (
+        "_platform_name",
+        "_platform_subtitle",
+        "_browser_title",
+        "_logo_url",
+        "_logo_collapsed_url",
+        "_favicon_url",
+        "_primary_color",
+    )
+
     # Allowed image types for logos
     ALLOWED_LOGO_TYPES = ["image/jpeg", "image/png", "image/svg+xml", "image/webp"]
     ALLOWED_FAVICON_TYPES = [
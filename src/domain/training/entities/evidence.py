@@ -24,6 +24,17 @@ class Evidence(Entity[UUID]):
     prove the training activity occurred.
     """
 
+    __slots__ = (
+        "_training_session_id",
+        "_file_name",
+        "_file_path",
+        "_file_size",
+        "_mime_type",
+        "_evidence_type",
+        "_description",
+        "_uploaded_by",
+    )
+
     # Maximum file size in bytes (10MB)
     MAX_FILE_SIZE = 10 * 1024 * 1024
     # Allowed MIME types
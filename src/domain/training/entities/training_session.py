@@ -21,6 +21,22 @@ class TrainingSession(Entity[UUID]):
     - RN11: Training must be validated by evaluator to count in statistics
     """
 
+    __slots__ = (
+        "_competitor_id",
+        "_modality_id",
+        "_enrollment_id",
+        "_training_date",
+        "_hours",
+        "_training_type",
+        "_location",
+        "_description",
+        "_status",
+        "_validated_by",
+        "_validated_at",
+        "_rejection_reason",
+        "_evidences",
+    )
+
     def __init__(
         self,
         competitor_id: UUID,
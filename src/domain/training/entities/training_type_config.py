@@ -13,6 +13,8 @@ class TrainingTypeConfig(AggregateRoot[UUID]):
     in the system (e.g., SENAI, FORA/External).
     """
 
+    __slots__ = ("_code", "_name", "_description", "_is_active", "_display_order")
+
     def __init__(
         self,
         code: str,
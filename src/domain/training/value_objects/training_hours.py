@@ -12,6 +12,8 @@ class TrainingHours(ValueObject):
     - Minimum is 0.5 hours (30 minutes)
     """
 
+    __slots__ = ("_value",)
+
     MIN_HOURS = 0.5
     MAX_HOURS_PER_DAY = 12.0
 
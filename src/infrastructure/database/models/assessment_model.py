@@ -219,8 +219,19 @@ class GradeModel(Base):
             "sub_competence_id",
             name="uq_grades_exam_competitor_competence_sub",
         ),
-        Index("ix_grades_exam_competitor", "exam_id", "competitor_id"),
-        Index("ix_grades_exam_competence", "exam_id", "competence_id"),
+        # Covering indexes (migration 0012): statistics reads are index-only scans.
+        Index(
+            "ix_grades_exam_competitor",
+            "exam_id",
+            "competitor_id",
+            postgresql_include=["score", "competence_id"],
+        ),
+        Index(
+            "ix_grades_exam_competence",
+            "exam_id",
+            "competence_id",
+            postgresql_include=["score", "competitor_id"],
+        ),
         Index("ix_grades_competitor_competence", "competitor_id", "competence_id"),
     )
 
@@ -16,11 +16,36 @@ from sqlalchemy import (
     Table,
     Text,
     Time,
+    func,
+    literal_column,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql.elements import ColumnElement, Grouping
 
 from src.infrastructure.database.base import GUID, Base
 
+
+def search_vector(*columns: Column[str]) -> ColumnElement:
+    """Build the full-text search document for the given text columns.
+
+    The GIN indexes below are built on this expression, so searches must filter
+    with the same one to be served by them, e.g.
+    ``search_vector(MessageModel.content).bool_op("@@")(
+    func.websearch_to_tsquery("simple", query))``.
+
+    Args:
+        columns: Text columns to index, concatenated in order.
+
+    Returns:
+        ``to_tsvector('simple', ...)`` expression over the columns.
+    """
+    document: ColumnElement[str] = func.coalesce(columns[0], "")
+    for column in columns[1:]:
+        document = document + " " + func.coalesce(column, "")
+    return func.to_tsvector(literal_column("'simple'::regconfig"), document)
+
+
 # =============================================================================
 # Association Tables
 # =============================================================================
@@ -30,6 +55,7 @@ event_participants = Table(
     Base.metadata,
     Column("event_id", GUID, ForeignKey("events.id"), primary_key=True),
     Column("user_id", GUID, ForeignKey("users.id"), primary_key=True),
+    Index("ix_event_participants_user", "user_id", "event_id"),
 )
 
 plan_item_resources = Table(
@@ -69,7 +95,9 @@ class NotificationModel(Base):
 
     __table_args__ = (
         Index("ix_notifications_user_status", "user_id", "status"),
-        Index("ix_notifications_user_created", "user_id", "created_at"),
+        Index("ix_notifications_user_created", "user_id", "created_at", "id"),
+        Index("ix_notifications_created", "created_at"),
+        Index("ix_notifications_user_unread", "user_id", postgresql_where=read_at.is_(None)),
     )
 
 
@@ -151,7 +179,8 @@ class ResourceModel(Base):
     mime_type = Column(String(100), nullable=True)
     modality_id = Column(GUID, ForeignKey("modalities.id", ondelete="SET NULL"), nullable=True)
     access_level = Column(String(20), nullable=False, default="modality")
-    tags = Column(JSON, nullable=True, default=list)
+    # JSONB on PostgreSQL so the tag array can carry a GIN index.
+    tags = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=True, default=list)
     is_active = Column(Boolean, default=True)
     view_count = Column(Integer, default=0)
     download_count = Column(Integer, default=0)
@@ -166,6 +195,25 @@ class ResourceModel(Base):
     __table_args__ = (
         Index("ix_resources_modality_type", "modality_id", "resource_type"),
         Index("ix_resources_access_level", "access_level"),
+        Index("ix_resources_modality_created", "modality_id", "created_at", "id"),
+        Index(
+            "ix_resources_modality_popularity",
+            "modality_id",
+            # PostgreSQL requires non-function index expressions in parentheses.
+            Grouping(view_count + download_count).desc(),
+            postgresql_where=is_active.is_(True),
+        ),
+        Index(
+            "ix_resources_tags",
+            "tags",
+            postgresql_using="gin",
+            postgresql_where=is_active.is_(True),
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_resources_search",
+            search_vector(title, description),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
     )
 
 
@@ -206,6 +254,7 @@ class GoalModel(Base):
     __table_args__ = (
         Index("ix_goals_competitor_status", "competitor_id", "status"),
         Index("ix_goals_due_date", "due_date"),
+        Index("ix_goals_competitor_created", "competitor_id", "created_at", "id"),
     )
 
 
@@ -226,6 +275,8 @@ class MilestoneModel(Base):
     # Relationships
     goal = relationship("GoalModel", back_populates="milestones")
 
+    __table_args__ = (Index("ix_milestones_goal", "goal_id"),)
+
 
 # =============================================================================
 # Badge and Achievement Models
@@ -251,6 +302,15 @@ class BadgeModel(Base):
     # Relationships
     achievements = relationship("AchievementModel", back_populates="badge")
 
+    __table_args__ = (
+        Index(
+            "ix_badges_category_rarity",
+            "category",
+            "rarity",
+            postgresql_where=is_active.is_(True),
+        ),
+    )
+
 
 class AchievementModel(Base):
     """SQLAlchemy model for achievements."""
@@ -270,7 +330,10 @@ class AchievementModel(Base):
     user = relationship("UserModel")
     competitor = relationship("CompetitorModel")
 
-    __table_args__ = (Index("ix_achievements_user_badge", "user_id", "badge_id", unique=True),)
+    __table_args__ = (
+        Index("ix_achievements_user_badge", "user_id", "badge_id", unique=True),
+        Index("ix_achievements_badge", "badge_id"),
+    )
 
 
 class UserPointsModel(Base):
@@ -322,6 +385,7 @@ class ConversationModel(Base):
 
     __table_args__ = (
         Index("ix_conversations_participants", "participant_1", "participant_2", unique=True),
+        Index("ix_conversations_participant_2", "participant_2"),
         Index("ix_conversations_updated", "updated_at"),
     )
 
@@ -346,7 +410,20 @@ class MessageModel(Base):
     conversation = relationship("ConversationModel", back_populates="messages")
     sender = relationship("UserModel")
 
-    __table_args__ = (Index("ix_messages_conversation_created", "conversation_id", "created_at"),)
+    __table_args__ = (
+        Index("ix_messages_conversation_created", "conversation_id", "created_at", "id"),
+        Index(
+            "ix_messages_conversation_unread",
+            "conversation_id",
+            "sender_id",
+            postgresql_where=is_read.is_(False),
+        ),
+        Index(
+            "ix_messages_search",
+            search_vector(content),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+    )
 
 
 # =============================================================================
@@ -385,6 +462,12 @@ class FeedbackModel(Base):
     __table_args__ = (
         Index("ix_feedbacks_competitor_type", "competitor_id", "feedback_type"),
         Index("ix_feedbacks_evaluator", "evaluator_id"),
+        Index("ix_feedbacks_competitor_created", "competitor_id", "created_at", "id"),
+        Index(
+            "ix_feedbacks_competitor_unread",
+            "competitor_id",
+            postgresql_where=is_read.is_(False),
+        ),
     )
 
 
@@ -419,7 +502,10 @@ class TrainingPlanModel(Base):
     creator = relationship("UserModel")
     items = relationship("PlanItemModel", back_populates="plan", cascade="all, delete-orphan")
 
-    __table_args__ = (Index("ix_training_plans_competitor_status", "competitor_id", "status"),)
+    __table_args__ = (
+        Index("ix_training_plans_competitor_status", "competitor_id", "status"),
+        Index("ix_training_plans_competitor_created", "competitor_id", "created_at", "id"),
+    )
 
 
 class PlanItemModel(Base):
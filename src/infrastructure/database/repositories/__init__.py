@@ -3,6 +3,14 @@
 from src.infrastructure.database.repositories.analytics_repository_impl import (
     SQLAlchemyAnalyticsRepository,
 )
+from src.infrastructure.database.repositories.buffered_resource_repository import (
+    BufferedResourceRepository,
+    ResourceCounterBuffer,
+)
+from src.infrastructure.database.repositories.cached_badge_repository import (
+    CachedAchievementRepository,
+    CachedBadgeRepository,
+)
 from src.infrastructure.database.repositories.competence_repository_impl import (
     SQLAlchemyCompetenceRepository,
 )
@@ -58,4 +66,8 @@ __all__ = [
     "SQLAlchemyAnalyticsRepository",
     "SQLAlchemyTrainingTypeConfigRepository",
     "SQLAlchemyPlatformSettingsRepository",
+    "CachedBadgeRepository",
+    "CachedAchievementRepository",
+    "BufferedResourceRepository",
+    "ResourceCounterBuffer",
 ]
@@ -0,0 +1,202 @@
+"""Write-coalescing decorator for resource view and download counters.
+
+Counting every view with its own ``UPDATE resources SET view_count = ...``
+turns popular resources into hot rows that each request has to lock. The
+wrapper below only records the increment in process memory; ``flush`` later
+writes the accumulated deltas of all resources with a single statement.
+Whoever composes the wrapper over a concrete repository is responsible for
+calling ``flush`` periodically and at shutdown; counts read back from the
+database do not include increments still in the buffer.
+"""
+
+from collections.abc import Mapping, Sequence
+from uuid import UUID
+
+from src.domain.extras.entities.resource import Resource
+from src.domain.extras.repositories.resource_repository import ResourceRepository
+from src.shared.constants.enums import ResourceType
+from src.shared.domain.pagination import Page
+
+
+class ResourceCounterBuffer:
+    """Pending view and download increments, keyed by resource ID."""
+
+    def __init__(self) -> None:
+        """Initialize an empty buffer."""
+        self._deltas: dict[UUID, list[int]] = {}
+
+    def record_view(self, resource_id: UUID) -> None:
+        """Count one view of a resource."""
+        delta = self._deltas.get(resource_id)
+        if delta is None:
+            self._deltas[resource_id] = [1, 0]
+        else:
+            delta[0] += 1
+
+    def record_download(self, resource_id: UUID) -> None:
+        """Count one download of a resource."""
+        delta = self._deltas.get(resource_id)
+        if delta is None:
+            self._deltas[resource_id] = [0, 1]
+        else:
+            delta[1] += 1
+
+    def drain(self) -> dict[UUID, tuple[int, int]]:
+        """Take all pending increments, leaving the buffer empty.
+
+        Returns:
+            ``(views, downloads)`` to add, keyed by resource ID.
+        """
+        deltas, self._deltas = self._deltas, {}
+        return {resource_id: (delta[0], delta[1]) for resource_id, delta in deltas.items()}
+
+    def merge(self, deltas: Mapping[UUID, tuple[int, int]]) -> None:
+        """Add drained increments back, e.g. after a failed write.
+
+        Args:
+            deltas: ``(views, downloads)`` to add, keyed by resource ID.
+        """
+        for resource_id, (views, downloads) in deltas.items():
+            delta = self._deltas.get(resource_id)
+            if delta is None:
+                self._deltas[resource_id] = [views, downloads]
+            else:
+                delta[0] += views
+                delta[1] += downloads
+
+    def __len__(self) -> int:
+        """Get the number of resources with pending increments."""
+        return len(self._deltas)
+
+
+# Shared across requests so that increments from every request are coalesced.
+resource_counter_buffer = ResourceCounterBuffer()
+
+
+class BufferedResourceRepository(ResourceRepository):
+    """Resource repository that coalesces counter increments."""
+
+    def __init__(
+        self,
+        inner: ResourceRepository,
+        buffer: ResourceCounterBuffer = resource_counter_buffer,
+    ) -> None:
+        """Initialize the repository.
+
+        Args:
+            inner: Repository that owns the data.
+            buffer: Buffer collecting pending increments.
+        """
+        self._inner = inner
+        self._buffer = buffer
+
+    async def flush(self) -> int:
+        """Write all pending increments through the inner repository.
+
+        Meant to be called periodically, e.g. every 30 seconds, and at shutdown.
+        If the write fails, the increments are put back into the buffer.
+
+        Returns:
+            Number of resources updated.
+        """
+        deltas = self._buffer.drain()
+        if deltas:
+            try:
+                await self._inner.add_counts(deltas)
+            except BaseException:
+                # Also on cancellation, so a flush interrupted at shutdown loses nothing
+                self._buffer.merge(deltas)
+                raise
+        return len(deltas)
+
+    async def save(self, resource: Resource) -> Resource:
+        """Save a resource."""
+        return await self._inner.save(resource)
+
+    async def get_by_id(self, resource_id: UUID) -> Resource | None:
+        """Get resource by ID."""
+        return await self._inner.get_by_id(resource_id)
+
+    async def get_by_ids(self, resource_ids: Sequence[UUID]) -> dict[UUID, Resource]:
+        """Get resources by ID in one query, keyed by ID."""
+        return await self._inner.get_by_ids(resource_ids)
+
+    async def get_by_modality(
+        self,
+        modality_id: UUID,
+        resource_type: ResourceType | None = None,
+        is_active: bool = True,
+        cursor: str | None = None,
+        limit: int = 50,
+    ) -> Page[Resource]:
+        """Get resources for a modality."""
+        return await self._inner.get_by_modality(
+            modality_id, resource_type, is_active, cursor, limit
+        )
+
+    async def get_public(
+        self,
+        resource_type: ResourceType | None = None,
+        cursor: str | None = None,
+        limit: int = 50,
+    ) -> Page[Resource]:
+        """Get public resources."""
+        return await self._inner.get_public(resource_type, cursor, limit)
+
+    async def search(
+        self,
+        query: str,
+        modality_id: UUID | None = None,
+        resource_type: ResourceType | None = None,
+        tags: list[str] | None = None,
+        cursor: str | None = None,
+        limit: int = 50,
+    ) -> Page[Resource]:
+        """Search resources, newest first."""
+        return await self._inner.search(query, modality_id, resource_type, tags, cursor, limit)
+
+    async def get_by_tags(
+        self,
+        tags: list[str],
+        modality_id: UUID | None = None,
+        cursor: str | None = None,
+        limit: int = 50,
+    ) -> Page[Resource]:
+        """Get resources by tags."""
+        return await self._inner.get_by_tags(tags, modality_id, cursor, limit)
+
+    async def update(self, resource: Resource) -> Resource:
+        """Update a resource."""
+        return await self._inner.update(resource)
+
+    async def delete(self, resource_id: UUID) -> bool:
+        """Delete a resource."""
+        return await self._inner.delete(resource_id)
+
+    async def increment_view_count(self, resource_id: UUID) -> bool:
+        """Count a view; it is written on the next flush.
+
+        Returns True without checking that the resource exists.
+        """
+        self._buffer.record_view(resource_id)
+        return True
+
+    async def increment_download_count(self, resource_id: UUID) -> bool:
+        """Count a download; it is written on the next flush.
+
+        Returns True without checking that the resource exists.
+        """
+        self._buffer.record_download(resource_id)
+        return True
+
+    async def add_counts(self, deltas: Mapping[UUID, tuple[int, int]]) -> None:
+        """Add buffered view and download counts to several resources."""
+        await self._inner.add_counts(deltas)
+
+    async def get_popular(
+        self,
+        modality_id: UUID | None = None,
+        limit: int = 10,
+    ) -> list[Resource]:
+        """Get popular resources by view/download count."""
+        return await self._inner.get_popular(modality_id, limit)
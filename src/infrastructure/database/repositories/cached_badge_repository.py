@@ -0,0 +1,241 @@
+"""Caching decorators for badge and achievement repositories.
+
+Badges are reference data that change rarely but are listed on every
+gamification update, and the leaderboard is read far more often than points
+change. These wrappers keep both in a process-wide TTL cache in front of any
+repository implementation, clearing it on the writes that affect them; the TTL
+bounds staleness when the write happened in another worker.
+
+Entities are mutable and a cached entry is shared by every request in the
+process, so the caches hold tuples of field values and each caller gets
+freshly built entities.
+"""
+
+import copy
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from src.domain.extras.entities.badge import Achievement, Badge, UserPoints
+from src.domain.extras.repositories.badge_repository import (
+    AchievementRepository,
+    BadgeRepository,
+)
+from src.shared.constants.enums import BadgeCategory, BadgeRarity
+from src.shared.utils.cache import TTLCache
+
+_BadgeQuery = tuple[BadgeCategory | None, BadgeRarity | None, bool]
+_LeaderboardQuery = tuple[UUID | None, int]
+_BadgeSnapshot = tuple[
+    UUID, str, str, BadgeCategory, BadgeRarity, str | None, int, dict[str, Any], bool, datetime
+]
+_UserPointsSnapshot = tuple[UUID, UUID, int, int, int]
+
+_badge_cache: TTLCache[_BadgeQuery, tuple[_BadgeSnapshot, ...]] = TTLCache(maxsize=256, ttl=300)
+_leaderboard_cache: TTLCache[_LeaderboardQuery, tuple[_UserPointsSnapshot, ...]] = TTLCache(
+    maxsize=256, ttl=60
+)
+
+
+def _snapshot_badge(badge: Badge) -> _BadgeSnapshot:
+    """Capture a badge's fields for caching."""
+    return (
+        badge.id,
+        badge.name,
+        badge.description,
+        badge.category,
+        badge.rarity,
+        badge.icon_url,
+        badge.points,
+        copy.deepcopy(dict(badge.criteria)),
+        badge.is_active,
+        badge.created_at,
+    )
+
+
+def _restore_badge(snapshot: _BadgeSnapshot) -> Badge:
+    """Build a new badge from cached fields."""
+    id, name, description, category, rarity, icon_url, points, criteria, is_active, created_at = (
+        snapshot
+    )
+    return Badge(
+        name=name,
+        description=description,
+        category=category,
+        rarity=rarity,
+        icon_url=icon_url,
+        points=points,
+        criteria=copy.deepcopy(criteria),
+        is_active=is_active,
+        id=id,
+        created_at=created_at,
+    )
+
+
+def _snapshot_user_points(user_points: UserPoints) -> _UserPointsSnapshot:
+    """Capture a user's points for caching."""
+    return (
+        user_points.id,
+        user_points.user_id,
+        user_points.total_points,
+        user_points.level,
+        user_points.badges_count,
+    )
+
+
+def _restore_user_points(snapshot: _UserPointsSnapshot) -> UserPoints:
+    """Build new user points from cached fields."""
+    id, user_id, total_points, level, badges_count = snapshot
+    return UserPoints(
+        user_id=user_id,
+        total_points=total_points,
+        level=level,
+        badges_count=badges_count,
+        id=id,
+    )
+
+
+class CachedBadgeRepository(BadgeRepository):
+    """Badge repository serving badge listings from cache."""
+
+    def __init__(self, inner: BadgeRepository) -> None:
+        """Initialize the repository.
+
+        Args:
+            inner: Repository that owns the data.
+        """
+        self._inner = inner
+
+    async def save(self, badge: Badge) -> Badge:
+        """Save a badge."""
+        saved = await self._inner.save(badge)
+        _badge_cache.clear()
+        return saved
+
+    async def get_by_id(self, badge_id: UUID) -> Badge | None:
+        """Get badge by ID."""
+        return await self._inner.get_by_id(badge_id)
+
+    async def get_by_ids(self, badge_ids: Sequence[UUID]) -> dict[UUID, Badge]:
+        """Get badges by ID in one query, keyed by ID."""
+        return await self._inner.get_by_ids(badge_ids)
+
+    async def get_all(
+        self,
+        category: BadgeCategory | None = None,
+        rarity: BadgeRarity | None = None,
+        is_active: bool = True,
+    ) -> list[Badge]:
+        """Get all badges with optional filters."""
+        key = (category, rarity, is_active)
+        snapshots = _badge_cache.get(key)
+        if snapshots is None:
+            badges = await self._inner.get_all(category, rarity, is_active)
+            _badge_cache.set(key, tuple(_snapshot_badge(badge) for badge in badges))
+            return badges
+        return [_restore_badge(snapshot) for snapshot in snapshots]
+
+    async def get_by_category(
+        self,
+        category: BadgeCategory,
+        is_active: bool = True,
+    ) -> list[Badge]:
+        """Get badges by category."""
+        return await self.get_all(category=category, is_active=is_active)
+
+    async def update(self, badge: Badge) -> Badge:
+        """Update a badge."""
+        updated = await self._inner.update(badge)
+        _badge_cache.clear()
+        return updated
+
+    async def delete(self, badge_id: UUID) -> bool:
+        """Delete a badge."""
+        deleted = await self._inner.delete(badge_id)
+        _badge_cache.clear()
+        return deleted
+
+
+class CachedAchievementRepository(AchievementRepository):
+    """Achievement repository serving the leaderboard from cache."""
+
+    def __init__(self, inner: AchievementRepository) -> None:
+        """Initialize the repository.
+
+        Args:
+            inner: Repository that owns the data.
+        """
+        self._inner = inner
+
+    async def save(self, achievement: Achievement) -> Achievement:
+        """Save an achievement."""
+        return await self._inner.save(achievement)
+
+    async def save_many(self, achievements: Sequence[Achievement]) -> list[Achievement]:
+        """Save several achievements with a single multi-row insert."""
+        return await self._inner.save_many(achievements)
+
+    async def get_by_id(self, achievement_id: UUID) -> Achievement | None:
+        """Get achievement by ID."""
+        return await self._inner.get_by_id(achievement_id)
+
+    async def get_by_ids(self, achievement_ids: Sequence[UUID]) -> dict[UUID, Achievement]:
+        """Get achievements by ID in one query, keyed by ID."""
+        return await self._inner.get_by_ids(achievement_ids)
+
+    async def get_by_user(
+        self,
+        user_id: UUID,
+        include_in_progress: bool = False,
+    ) -> list[Achievement]:
+        """Get achievements for a user."""
+        return await self._inner.get_by_user(user_id, include_in_progress)
+
+    async def get_by_badge(
+        self,
+        badge_id: UUID,
+        user_id: UUID | None = None,
+    ) -> list[Achievement]:
+        """Get achievements for a badge."""
+        return await self._inner.get_by_badge(badge_id, user_id)
+
+    async def has_badge(self, user_id: UUID, badge_id: UUID) -> bool:
+        """Check if user has earned a specific badge."""
+        return await self._inner.has_badge(user_id, badge_id)
+
+    async def has_badges(self, user_id: UUID, badge_ids: Sequence[UUID]) -> set[UUID]:
+        """Get which of the given badges a user has earned, in one query."""
+        return await self._inner.has_badges(user_id, badge_ids)
+
+    async def update(self, achievement: Achievement) -> Achievement:
+        """Update an achievement."""
+        return await self._inner.update(achievement)
+
+    async def delete(self, achievement_id: UUID) -> bool:
+        """Delete an achievement."""
+        return await self._inner.delete(achievement_id)
+
+    async def get_user_points(self, user_id: UUID) -> UserPoints | None:
+        """Get user points."""
+        return await self._inner.get_user_points(user_id)
+
+    async def save_user_points(self, user_points: UserPoints) -> UserPoints:
+        """Save user points."""
+        saved = await self._inner.save_user_points(user_points)
+        _leaderboard_cache.clear()
+        return saved
+
+    async def get_leaderboard(
+        self,
+        modality_id: UUID | None = None,
+        limit: int = 50,
+    ) -> list[UserPoints]:
+        """Get gamification leaderboard."""
+        key = (modality_id, limit)
+        snapshots = _leaderboard_cache.get(key)
+        if snapshots is None:
+            leaderboard = await self._inner.get_leaderboard(modality_id, limit)
+            _leaderboard_cache.set(key, tuple(_snapshot_user_points(p) for p in leaderboard))
+            return leaderboard
+        return [_restore_user_points(snapshot) for snapshot in snapshots]
@@ -1,12 +1,16 @@
 """SQLAlchemy Grade repository implementation."""
 
+import math
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import case, func, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.assessment.entities.grade import Grade
-from src.domain.assessment.repositories.grade_repository import GradeRepository
+from src.domain.assessment.repositories.grade_repository import (
+    ExamStatisticsBundle,
+    GradeRepository,
+)
 from src.domain.assessment.value_objects.score import Score
 from src.infrastructure.database.models.assessment_model import GradeModel
 
@@ -234,7 +238,31 @@ class SQLAlchemyGradeRepository(GradeRepository):
             stmt = stmt.where(GradeModel.competence_id == competence_id)
 
         result = await self._session.execute(stmt)
-        return [row[0] for row in result.all()]
+        return list(result.scalars().all())
+
+    async def get_exam_statistics_bundle(self, exam_id: UUID) -> ExamStatisticsBundle:
+        """Get everything needed to compute an exam's statistics."""
+        stmt = select(
+            GradeModel.competence_id,
+            GradeModel.competitor_id,
+            GradeModel.score,
+        ).where(GradeModel.exam_id == exam_id)
+
+        result = await self._session.execute(stmt)
+        scores_by_competence: dict[UUID, list[float]] = {}
+        competitor_ids: set[UUID] = set()
+        for competence_id, competitor_id, score in result.all():
+            scores_by_competence.setdefault(competence_id, []).append(score)
+            competitor_ids.add(competitor_id)
+
+        total_grades = sum(len(scores) for scores in scores_by_competence.values())
+        total = math.fsum(math.fsum(scores) for scores in scores_by_competence.values())
+        return ExamStatisticsBundle(
+            scores_by_competence=scores_by_competence,
+            total_competitors=len(competitor_ids),
+            total_grades=total_grades,
+            overall_average=round(total / total_grades, 2) if total_grades else None,
+        )
 
     async def count(
         self,
@@ -274,3 +302,28 @@ class SQLAlchemyGradeRepository(GradeRepository):
         result = await self._session.execute(stmt)
         avg = result.scalar()
         return round(float(avg), 2) if avg is not None else None
+
+    async def get_weighted_average(
+        self,
+        exam_id: UUID,
+        competitor_id: UUID,
+        competence_weights: dict[UUID, float],
+    ) -> float | None:
+        """Calculate a competitor's weighted average in a single aggregate query."""
+        # Weights equal to the 1.0 default need no CASE branch
+        weights = {cid: w for cid, w in competence_weights.items() if w != 1.0}
+        weight = (
+            case(weights, value=GradeModel.competence_id, else_=1.0)
+            if weights
+            else literal(1.0)
+        )
+        stmt = select(
+            func.sum(GradeModel.score * weight) / func.nullif(func.sum(weight), 0)
+        ).where(
+            GradeModel.exam_id == exam_id,
+            GradeModel.competitor_id == competitor_id,
+        )
+
+        result = await self._session.execute(stmt)
+        avg = result.scalar()
+        return round(float(avg), 2) if avg is not None else None
@@ -1,5 +1,6 @@
 """SQLAlchemy RefreshToken repository implementation."""
 
+from collections.abc import Sequence
 from uuid import UUID
 
 from sqlalchemy import delete, select, update
@@ -59,6 +60,14 @@ class SQLAlchemyRefreshTokenRepository(RefreshTokenRepository):
         model = result.scalar_one_or_none()
         return self._model_to_entity(model) if model else None
 
+    async def get_by_tokens(self, tokens: Sequence[str]) -> dict[str, RefreshToken]:
+        """Get refresh tokens by token string in one query."""
+        if not tokens:
+            return {}
+        stmt = select(RefreshTokenModel).where(RefreshTokenModel.token.in_(set(tokens)))
+        result = await self._session.execute(stmt)
+        return {model.token: self._model_to_entity(model) for model in result.scalars().all()}
+
     async def get_by_user_id(self, user_id: UUID) -> list[RefreshToken]:
         """Get all refresh tokens for a user."""
         stmt = (
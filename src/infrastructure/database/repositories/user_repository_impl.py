@@ -1,5 +1,6 @@
 """SQLAlchemy User repository implementation."""
 
+from collections.abc import Sequence
 from uuid import UUID
 
 from sqlalchemy import exists, func, select
@@ -101,6 +102,30 @@ class SQLAlchemyUserRepository(UserRepository):
         model = result.scalar_one_or_none()
         return self._model_to_entity(model) if model else None
 
+    async def get_by_ids(self, user_ids: Sequence[UUID]) -> dict[UUID, User]:
+        """Get users by ID in one query, keyed by ID."""
+        if not user_ids:
+            return {}
+        stmt = (
+            select(UserModel)
+            .where(UserModel.id.in_(set(user_ids)))
+            .options(selectinload(UserModel.role_entity).selectinload(RoleModel.permissions))
+        )
+        result = await self._session.execute(stmt)
+        return {model.id: self._model_to_entity(model) for model in result.scalars().all()}
+
+    async def get_by_emails(self, emails: Sequence[str]) -> dict[str, User]:
+        """Get users by email address in one query."""
+        if not emails:
+            return {}
+        stmt = (
+            select(UserModel)
+            .where(UserModel.email.in_({email.lower() for email in emails}))
+            .options(selectinload(UserModel.role_entity).selectinload(RoleModel.permissions))
+        )
+        result = await self._session.execute(stmt)
+        return {model.email: self._model_to_entity(model) for model in result.scalars().all()}
+
     async def get_by_role(
         self,
         role: UserRole,
@@ -190,6 +215,12 @@ class SQLAlchemyUserRepository(UserRepository):
         result = await self._session.execute(stmt)
         return result.scalar() or 0
 
+    async def count_by_role(self, role: UserRole) -> int:
+        """Count users with a specific role."""
+        stmt = select(func.count(UserModel.id)).where(UserModel.role == role.value)
+        result = await self._session.execute(stmt)
+        return result.scalar() or 0
+
     async def email_exists(self, email: str) -> bool:
         """Check if email is already registered."""
         stmt = select(exists().where(UserModel.email == email.lower()))
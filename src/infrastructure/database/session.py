@@ -13,13 +13,18 @@ from src.config.settings import get_settings
 
 settings = get_settings()
 
-# Create async engine
+# Create async engine. Pre-ping and recycling discard connections the server
+# or a proxy closed while they sat idle in the pool. Repositories add optional
+# filters with conditional .where() calls, so each filter combination is its
+# own compiled statement; the compiled cache is sized to hold all of them.
 engine = create_async_engine(
     settings.database_url,
     echo=settings.database_echo,
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    pool_size=settings.database_pool_size,
+    max_overflow=settings.database_max_overflow,
+    pool_recycle=settings.database_pool_recycle_seconds,
+    query_cache_size=settings.database_query_cache_size,
 )
 
 # Create async session factory
@@ -481,8 +481,11 @@ async def delete_competitor(
 ) -> None:
     """Delete a competitor and their associated user account."""
     from fastapi import HTTPException
+    from sqlalchemy import select
 
+    from src.application.assessment.use_cases import invalidate_exam_statistics
     from src.domain.modality.exceptions import CompetitorNotFoundException
+    from src.infrastructure.database.models.assessment_model import GradeModel
 
     repository = SQLAlchemyCompetitorRepository(db)
     competitor = await repository.get_by_id(competitor_id)
@@ -492,6 +495,13 @@ async def delete_competitor(
 
     user_id = competitor.user_id
 
+    # Grades cascade away with the competitor; their exams' cached statistics
+    # are dropped once the delete is committed
+    graded_exams = await db.execute(
+        select(GradeModel.exam_id).where(GradeModel.competitor_id == competitor_id).distinct()
+    )
+    graded_exam_ids = graded_exams.scalars().all()
+
     deleted = await repository.delete(competitor_id)
     if not deleted:
         raise HTTPException(
@@ -503,3 +513,6 @@ async def delete_competitor(
     await SQLAlchemyUserRepository(db).delete(user_id)
 
     await db.commit()
+
+    for exam_id in graded_exam_ids:
+        invalidate_exam_statistics(exam_id)
@@ -17,6 +17,7 @@ from src.application.assessment.use_cases import (
     GetExamUseCase,
     ListExamsUseCase,
     UpdateExamUseCase,
+    invalidate_exam_statistics,
 )
 from src.domain.identity.entities.user import User
 from sqlalchemy import select
@@ -192,6 +193,8 @@ async def update_exam(
 
     result = await use_case.execute(exam_id, dto)
     await db.commit()
+    if dto.competence_ids is not None:
+        invalidate_exam_statistics(exam_id)
 
     return exam_dto_to_response(result)
 
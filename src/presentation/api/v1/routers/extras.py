@@ -62,6 +62,7 @@ from src.shared.constants.enums import (
     ResourceType,
     TrainingPlanStatus,
 )
+from src.shared.constants.pagination import MAX_PAGE_SIZE
 
 router = APIRouter()
 
@@ -82,8 +83,8 @@ async def list_notifications(
     current_user: Annotated[User, Depends(get_current_active_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
     status: NotificationStatus | None = Query(default=None),
-    skip: int = Query(default=0, ge=0),
-    limit: int = Query(default=50, ge=1, le=100),
+    cursor: str | None = Query(default=None, description="Cursor from the previous page"),
+    limit: int = Query(default=50, ge=1, le=MAX_PAGE_SIZE),
 ) -> NotificationListResponse:
     """List notifications for the current user."""
     # Implementation would use ListNotificationsUseCase
@@ -248,8 +249,8 @@ async def list_resources(
     db: Annotated[AsyncSession, Depends(get_db)],
     modality_id: UUID | None = Query(default=None),
     resource_type: ResourceType | None = Query(default=None),
-    skip: int = Query(default=0, ge=0),
-    limit: int = Query(default=50, ge=1, le=100),
+    cursor: str | None = Query(default=None, description="Cursor from the previous page"),
+    limit: int = Query(default=50, ge=1, le=MAX_PAGE_SIZE),
 ) -> ResourceListResponse:
     """List resources."""
     # Implementation would use ListResourcesUseCase
@@ -268,8 +269,8 @@ async def search_resources(
     db: Annotated[AsyncSession, Depends(get_db)],
     modality_id: UUID | None = Query(default=None),
     resource_type: ResourceType | None = Query(default=None),
-    skip: int = Query(default=0, ge=0),
-    limit: int = Query(default=50, ge=1, le=100),
+    cursor: str | None = Query(default=None, description="Cursor from the previous page"),
+    limit: int = Query(default=50, ge=1, le=MAX_PAGE_SIZE),
 ) -> ResourceListResponse:
     """Search resources."""
     # Implementation would use ListResourcesUseCase.search
@@ -326,8 +327,8 @@ async def list_goals(
     db: Annotated[AsyncSession, Depends(get_db)],
     status: GoalStatus | None = Query(default=None),
     modality_id: UUID | None = Query(default=None),
-    skip: int = Query(default=0, ge=0),
-    limit: int = Query(default=50, ge=1, le=100),
+    cursor: str | None = Query(default=None, description="Cursor from the previous page"),
+    limit: int = Query(default=50, ge=1, le=MAX_PAGE_SIZE),
 ) -> GoalListResponse:
     """List goals for a competitor."""
     # Implementation would use ListGoalsUseCase
@@ -429,7 +430,7 @@ async def get_leaderboard(
     current_user: Annotated[User, Depends(get_current_active_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
     modality_id: UUID | None = Query(default=None),
-    limit: int = Query(default=50, ge=1, le=100),
+    limit: int = Query(default=50, ge=1, le=MAX_PAGE_SIZE),
 ) -> LeaderboardResponse:
     """Get gamification leaderboard."""
     # Implementation would use GetLeaderboardUseCase
@@ -467,8 +468,8 @@ async def create_conversation(
 async def list_conversations(
     current_user: Annotated[User, Depends(get_current_active_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
-    skip: int = Query(default=0, ge=0),
-    limit: int = Query(default=50, ge=1, le=100),
+    cursor: str | None = Query(default=None, description="Cursor from the previous page"),
+    limit: int = Query(default=50, ge=1, le=MAX_PAGE_SIZE),
 ) -> ConversationListResponse:
     """List conversations for the current user."""
     # Implementation would use ListConversationsUseCase
@@ -485,9 +486,8 @@ async def list_messages(
     conversation_id: UUID,
     current_user: Annotated[User, Depends(get_current_active_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
-    skip: int = Query(default=0, ge=0),
-    limit: int = Query(default=50, ge=1, le=100),
-    before_id: UUID | None = Query(default=None),
+    cursor: str | None = Query(default=None, description="Cursor from the previous page"),
+    limit: int = Query(default=50, ge=1, le=MAX_PAGE_SIZE),
 ) -> MessageListResponse:
     """List messages in a conversation."""
     # Implementation would use ListMessagesUseCase
@@ -546,8 +546,8 @@ async def list_feedback(
     db: Annotated[AsyncSession, Depends(get_db)],
     feedback_type: FeedbackType | None = Query(default=None),
     is_read: bool | None = Query(default=None),
-    skip: int = Query(default=0, ge=0),
-    limit: int = Query(default=50, ge=1, le=100),
+    cursor: str | None = Query(default=None, description="Cursor from the previous page"),
+    limit: int = Query(default=50, ge=1, le=MAX_PAGE_SIZE),
 ) -> FeedbackListResponse:
     """List feedback for a competitor."""
     # Implementation would use ListFeedbackUseCase
@@ -604,8 +604,8 @@ async def list_training_plans(
     db: Annotated[AsyncSession, Depends(get_db)],
     status: TrainingPlanStatus | None = Query(default=None),
     modality_id: UUID | None = Query(default=None),
-    skip: int = Query(default=0, ge=0),
-    limit: int = Query(default=50, ge=1, le=100),
+    cursor: str | None = Query(default=None, description="Cursor from the previous page"),
+    limit: int = Query(default=50, ge=1, le=MAX_PAGE_SIZE),
 ) -> TrainingPlanListResponse:
     """List training plans for a competitor."""
     # Implementation would use ListTrainingPlansUseCase
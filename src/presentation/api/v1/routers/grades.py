@@ -16,6 +16,7 @@ from src.application.assessment.use_cases import (
     GetGradeHistoryUseCase,
     RegisterGradeUseCase,
     UpdateGradeUseCase,
+    invalidate_exam_statistics,
 )
 from src.domain.identity.entities.user import User
 from src.infrastructure.database.repositories import (
@@ -107,6 +108,7 @@ async def register_grade(
         is_super_admin=(current_user.role == UserRole.SUPER_ADMIN),
     )
     await db.commit()
+    invalidate_exam_statistics(result.exam_id)
 
     return grade_dto_to_response(result)
 
@@ -256,6 +258,7 @@ async def update_grade(
         is_super_admin=(current_user.role == UserRole.SUPER_ADMIN),
     )
     await db.commit()
+    invalidate_exam_statistics(result.exam_id)
 
     return grade_dto_to_response(result)
 
@@ -290,6 +293,7 @@ async def delete_grade(
             detail=f"Grade with ID {grade_id} not found",
         )
     await db.commit()
+    invalidate_exam_statistics(grade.exam_id)
 
 
 @router.get(
@@ -365,6 +365,9 @@ async def delete_user(
 
     from sqlalchemy import inspect, text
 
+    from src.application.assessment.use_cases import invalidate_exam_statistics
+    from src.infrastructure.database.models.assessment_model import GradeModel
+    from src.infrastructure.database.models.modality_model import CompetitorModel
     from src.infrastructure.database.models.user_model import UserModel
 
     logger = logging.getLogger(__name__)
@@ -462,11 +465,24 @@ async def delete_user(
     if "events" in existing_tables:
         await db.execute(text("DELETE FROM events WHERE created_by = :uid"), {"uid": str(user_id)})
 
+    # Grades cascade away with the competitor profile; note their exams so the
+    # cached statistics can be dropped once the delete is committed
+    graded_exams = await db.execute(
+        select(GradeModel.exam_id)
+        .join(CompetitorModel, GradeModel.competitor_id == CompetitorModel.id)
+        .where(CompetitorModel.user_id == user_id)
+        .distinct()
+    )
+    graded_exam_ids = graded_exams.scalars().all()
+
     # Delete the user (CASCADE handles: refresh_tokens, competitors, evaluator_modalities)
     # SET NULL handles: exams.created_by, grades.created_by/updated_by, etc.
     await db.execute(delete(UserModel).where(UserModel.id == user_id))
     await db.commit()
 
+    for exam_id in graded_exam_ids:
+        invalidate_exam_statistics(exam_id)
+
 
 @router.get(
     "/{user_id}/modalities",
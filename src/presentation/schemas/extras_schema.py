@@ -61,6 +61,7 @@ class NotificationListResponse(BaseModel):
     notifications: list[NotificationResponse]
     total: int
     unread_count: int
+    next_cursor: str | None = None
 
 
 # =============================================================================
@@ -172,6 +173,7 @@ class ResourceListResponse(BaseModel):
 
     resources: list[ResourceResponse]
     total: int
+    next_cursor: str | None = None
 
 
 # =============================================================================
@@ -255,6 +257,7 @@ class GoalListResponse(BaseModel):
     goals: list[GoalResponse]
     total: int
     overdue_count: int
+    next_cursor: str | None = None
 
 
 class UpdateGoalProgressRequest(BaseModel):
@@ -395,6 +398,7 @@ class ConversationListResponse(BaseModel):
     conversations: list[ConversationResponse]
     total: int
     total_unread: int
+    next_cursor: str | None = None
 
 
 class MessageListResponse(BaseModel):
@@ -403,6 +407,7 @@ class MessageListResponse(BaseModel):
     messages: list[MessageResponse]
     total: int
     has_more: bool
+    next_cursor: str | None = None
 
 
 # =============================================================================
@@ -453,6 +458,7 @@ class FeedbackListResponse(BaseModel):
     feedbacks: list[FeedbackResponse]
     total: int
     unread_count: int
+    next_cursor: str | None = None
 
 
 # =============================================================================
@@ -542,6 +548,7 @@ class TrainingPlanListResponse(BaseModel):
     plans: list[TrainingPlanResponse]
     total: int
     active_count: int
+    next_cursor: str | None = None
 
 
 class AddPlanItemRequest(BaseModel):
@@ -1,5 +1,6 @@
 """Constants module."""
 
 from src.shared.constants.enums import TokenType, UserRole, UserStatus
+from src.shared.constants.pagination import MAX_PAGE_SIZE, UNREAD_COUNT_CAP
 
-__all__ = ["UserRole", "UserStatus", "TokenType"]
+__all__ = ["UserRole", "UserStatus", "TokenType", "MAX_PAGE_SIZE", "UNREAD_COUNT_CAP"]
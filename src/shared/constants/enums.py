@@ -1,6 +1,6 @@
 """Application enumerations."""
 
-from enum import Enum
+from enum import Enum, IntEnum
 
 
 class UserRole(str, Enum):
@@ -200,6 +200,20 @@ class FeedbackType(str, Enum):
     GENERAL = "general"
 
 
+class FeedbackContext(IntEnum):
+    """What a feedback is attached to, ordered from least to most specific.
+
+    Integer-valued so contexts compare and aggregate as small ints; the
+    lowercase member name is the label exposed by the API.
+    """
+
+    GENERAL = 0
+    COMPETENCE = 1
+    TRAINING = 2
+    EXAM = 3
+    GRADE = 4
+
+
 class TrainingPlanStatus(str, Enum):
     """Training plan status."""
 
@@ -0,0 +1,7 @@
+"""Pagination and counting limits."""
+
+MAX_PAGE_SIZE = 100
+"""Largest page any list query may return."""
+
+UNREAD_COUNT_CAP = 1000
+"""Unread badges stop counting here; clients show the cap as "1000+"."""
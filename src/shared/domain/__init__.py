@@ -2,6 +2,12 @@
 
 from src.shared.domain.aggregate_root import AggregateRoot
 from src.shared.domain.entity import Entity
+from src.shared.domain.pagination import (
+    Page,
+    decode_cursor,
+    encode_cursor,
+    paginated,
+)
 from src.shared.domain.repository import Repository
 from src.shared.domain.value_object import ValueObject
 
@@ -10,4 +16,8 @@ __all__ = [
     "ValueObject",
     "AggregateRoot",
     "Repository",
+    "Page",
+    "encode_cursor",
+    "decode_cursor",
+    "paginated",
 ]
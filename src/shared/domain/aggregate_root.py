@@ -25,6 +25,8 @@ class AggregateRoot(Entity[IdType]):
     parts of the system.
     """
 
+    __slots__ = ("_domain_events",)
+
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
         self._domain_events: list[DomainEvent] = []
@@ -18,6 +18,8 @@ class Entity(ABC, Generic[IdType]):
     not by their attributes.
     """
 
+    __slots__ = ("_id", "_created_at", "_updated_at")
+
     def __init__(
         self,
         id: IdType | None = None,
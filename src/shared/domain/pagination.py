@@ -0,0 +1,108 @@
+"""Keyset (cursor) pagination primitives.
+
+List queries are ordered newest first by ``(timestamp, id)``, where the
+timestamp is the listing's sort column (usually ``created_at``). A cursor is an
+opaque token for the last row of a page; the next page continues with rows that
+sort strictly after it, so an implementation translates it into
+``WHERE (sort_column, id) < (:timestamp, :id)`` backed by an index on the
+ordering columns instead of an ``OFFSET`` that scans and discards earlier rows.
+
+Page sizes are bounded by ``MAX_PAGE_SIZE`` so the work done per request does
+not grow with the size of the table; ``paginated`` enforces the bound.
+"""
+
+import base64
+import binascii
+import inspect
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import wraps
+from typing import Generic, ParamSpec, TypeVar
+from uuid import UUID
+
+from src.shared.constants.pagination import MAX_PAGE_SIZE
+from src.shared.exceptions.domain_exception import InvalidValueException
+
+T = TypeVar("T")
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+@dataclass(frozen=True, slots=True)
+class Page(Generic[T]):
+    """One page of a keyset-paginated listing.
+
+    Attributes:
+        items: Entities on this page, in listing order.
+        next_cursor: Cursor for the following page, or None on the last page.
+    """
+
+    items: list[T] = field(default_factory=list)
+    next_cursor: str | None = None
+
+
+def encode_cursor(timestamp: datetime, id: UUID) -> str:
+    """Encode the ordering key of the last row on a page.
+
+    Args:
+        timestamp: Sort timestamp of the row.
+        id: Row identifier, breaking ties between equal timestamps.
+
+    Returns:
+        URL-safe opaque cursor.
+    """
+    raw = f"{timestamp.isoformat()}|{id.hex}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Opaque cursor from a previous page.
+
+    Returns:
+        The ``(timestamp, id)`` ordering key it encodes.
+
+    Raises:
+        InvalidValueException: If the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        timestamp, _, id_hex = raw.partition("|")
+        return datetime.fromisoformat(timestamp), UUID(hex=id_hex)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InvalidValueException("cursor", cursor, "malformed pagination cursor") from None
+
+
+def paginated(
+    max_size: int = MAX_PAGE_SIZE,
+) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+    """Reject list calls whose ``limit`` falls outside ``1..max_size``.
+
+    Args:
+        max_size: Largest accepted page size.
+
+    Returns:
+        Decorator for async methods taking a ``limit`` argument.
+    """
+
+    def decorator(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        parameters = list(inspect.signature(func).parameters.values())
+        position = next(i for i, p in enumerate(parameters) if p.name == "limit")
+        default = parameters[position].default
+
+        @wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if len(args) > position:
+                limit = args[position]
+            else:
+                limit = kwargs.get("limit", default)
+            if not isinstance(limit, int) or not 0 < limit <= max_size:
+                raise InvalidValueException("limit", limit, f"must be between 1 and {max_size}")
+            return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -16,6 +16,12 @@ class Repository(ABC, Generic[EntityType, IdType]):
     Repositories provide a collection-like interface for accessing
     domain entities. They encapsulate the logic required to access
     data sources.
+
+    Implementations work on the session of the current request or unit of
+    work and never open their own. That session holds one pooled connection,
+    which is released when the request ends. Methods must not await anything
+    other than database calls while a transaction is open, because that keeps
+    the connection checked out of the pool.
     """
 
     @abstractmethod
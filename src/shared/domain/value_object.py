@@ -14,6 +14,8 @@ class ValueObject(ABC):
     Value objects should be immutable after creation.
     """
 
+    __slots__ = ()
+
     def __eq__(self, other: Any) -> bool:
         """Check equality based on all attributes."""
         if not isinstance(other, self.__class__):
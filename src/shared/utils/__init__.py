@@ -1,5 +1,6 @@
 """Utility functions."""
 
+from src.shared.utils.cache import TTLCache
 from src.shared.utils.date_utils import (
     format_datetime,
     parse_datetime,
@@ -20,4 +21,5 @@ __all__ = [
     "validate_email",
     "validate_password_strength",
     "PasswordStrengthResult",
+    "TTLCache",
 ]
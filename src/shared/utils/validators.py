@@ -3,6 +3,8 @@
 import re
 from dataclasses import dataclass
 
+_EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
 
 @dataclass
 class PasswordStrengthResult:
@@ -26,8 +28,7 @@ def validate_email(email: str) -> bool:
     Returns:
         True if email format is valid, False otherwise.
     """
-    pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    return bool(re.match(pattern, email))
+    return _EMAIL_PATTERN.match(email) is not None
 
 
 def validate_password_strength(
@@ -1,10 +1,13 @@
 """Integration tests for assessment endpoints."""
 
 from datetime import date, timedelta
+from uuid import UUID
 
 import pytest
 from httpx import AsyncClient
 
+from src.application.assessment.use_cases.get_exam_statistics import _exam_statistics_cache
+
 
 class TestExamEndpoints:
     """Tests for exam endpoints."""
@@ -634,3 +637,90 @@ class TestGradeEndpoints:
         )
 
         assert response.status_code == 403
+
+    @pytest.mark.asyncio
+    async def test_get_exam_statistics(
+        self,
+        client: AsyncClient,
+        evaluator_token: str,
+        setup_exam_with_competitor,
+    ):
+        """Test getting exam statistics after grading."""
+        exam = setup_exam_with_competitor["exam"]
+        competitor = setup_exam_with_competitor["competitor"]
+        competence = setup_exam_with_competitor["competence"]
+
+        create_response = await client.post(
+            "/api/v1/grades",
+            json={
+                "exam_id": exam["id"],
+                "competitor_id": competitor["id"],
+                "competence_id": competence["id"],
+                "score": 80.0,
+            },
+            headers={"Authorization": f"Bearer {evaluator_token}"},
+        )
+        grade = create_response.json()
+
+        response = await client.get(
+            f"/api/v1/exams/{exam['id']}/statistics",
+            headers={"Authorization": f"Bearer {evaluator_token}"},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_grades"] == 1
+        assert data["total_competitors"] == 1
+        assert data["overall_average"] == 80.0
+        assert len(data["competence_stats"]) == 1
+        assert data["competence_stats"][0]["competence_id"] == competence["id"]
+        assert data["competence_stats"][0]["count"] == 1
+
+        # Updating a grade invalidates the cached statistics
+        await client.put(
+            f"/api/v1/grades/{grade['id']}",
+            json={"score": 90.0},
+            headers={"Authorization": f"Bearer {evaluator_token}"},
+        )
+        response = await client.get(
+            f"/api/v1/exams/{exam['id']}/statistics",
+            headers={"Authorization": f"Bearer {evaluator_token}"},
+        )
+        assert response.json()["overall_average"] == 90.0
+
+    @pytest.mark.asyncio
+    async def test_deleting_graded_user_invalidates_exam_statistics(
+        self,
+        client: AsyncClient,
+        admin_token: str,
+        evaluator_token: str,
+        setup_exam_with_competitor,
+    ):
+        """Test deleting a user whose grades cascade away drops cached statistics."""
+        exam = setup_exam_with_competitor["exam"]
+        competitor = setup_exam_with_competitor["competitor"]
+        competence = setup_exam_with_competitor["competence"]
+
+        await client.post(
+            "/api/v1/grades",
+            json={
+                "exam_id": exam["id"],
+                "competitor_id": competitor["id"],
+                "competence_id": competence["id"],
+                "score": 80.0,
+            },
+            headers={"Authorization": f"Bearer {evaluator_token}"},
+        )
+        await client.get(
+            f"/api/v1/exams/{exam['id']}/statistics",
+            headers={"Authorization": f"Bearer {evaluator_token}"},
+        )
+        assert _exam_statistics_cache.get(UUID(exam["id"])) is not None
+
+        response = await client.delete(
+            f"/api/v1/users/{competitor['user_id']}",
+            headers={"Authorization": f"Bearer {admin_token}"},
+        )
+
+        assert response.status_code == 204
+        assert _exam_statistics_cache.get(UUID(exam["id"])) is None
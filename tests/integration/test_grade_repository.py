@@ -0,0 +1,115 @@
+"""Integration tests for the SQLAlchemy grade repository."""
+
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.assessment.entities.grade import Grade
+from src.domain.assessment.value_objects.score import Score
+from src.infrastructure.database.repositories.grade_repository_impl import (
+    SQLAlchemyGradeRepository,
+)
+
+
+def python_weighted_average(
+    scores: dict[UUID, float], competence_weights: dict[UUID, float]
+) -> float | None:
+    """Weighted average as computed in Python before it moved to SQL."""
+    if not scores:
+        return None
+    weighted_sum = 0.0
+    total_weight = 0.0
+    for competence_id, score in scores.items():
+        weight = competence_weights.get(competence_id, 1.0)
+        weighted_sum += score * weight
+        total_weight += weight
+    if total_weight == 0:
+        return None
+    return round(weighted_sum / total_weight, 2)
+
+
+class TestGetWeightedAverage:
+    """Tests for SQLAlchemyGradeRepository.get_weighted_average."""
+
+    @pytest.fixture
+    def exam_id(self) -> UUID:
+        """Exam the grades belong to."""
+        return uuid4()
+
+    @pytest.fixture
+    def competitor_id(self) -> UUID:
+        """Competitor the grades belong to."""
+        return uuid4()
+
+    async def _add_grades(
+        self,
+        repository: SQLAlchemyGradeRepository,
+        exam_id: UUID,
+        competitor_id: UUID,
+        scores: dict[UUID, float],
+    ) -> None:
+        for competence_id, score in scores.items():
+            await repository.add(
+                Grade(
+                    exam_id=exam_id,
+                    competitor_id=competitor_id,
+                    competence_id=competence_id,
+                    score=Score(score),
+                    created_by=uuid4(),
+                )
+            )
+
+    @pytest.mark.asyncio
+    async def test_matches_python_formula(
+        self, db_session: AsyncSession, exam_id: UUID, competitor_id: UUID
+    ) -> None:
+        """Test mixed weights, including competences without a weight."""
+        repository = SQLAlchemyGradeRepository(db_session)
+        weighted, light, unweighted = uuid4(), uuid4(), uuid4()
+        scores = {weighted: 83.5, light: 61.25, unweighted: 47.0}
+        weights = {weighted: 2.0, light: 0.5, uuid4(): 3.0}
+        await self._add_grades(repository, exam_id, competitor_id, scores)
+        # Grades of other competitors and exams must not count
+        await self._add_grades(repository, exam_id, uuid4(), {weighted: 10.0})
+        await self._add_grades(repository, uuid4(), competitor_id, {weighted: 10.0})
+
+        result = await repository.get_weighted_average(exam_id, competitor_id, weights)
+
+        assert result == python_weighted_average(scores, weights)
+        assert result is not None
+
+    @pytest.mark.asyncio
+    async def test_unweighted_is_plain_average(
+        self, db_session: AsyncSession, exam_id: UUID, competitor_id: UUID
+    ) -> None:
+        """Test that without weights every competence weighs 1.0."""
+        repository = SQLAlchemyGradeRepository(db_session)
+        scores = {uuid4(): 70.0, uuid4(): 85.0, uuid4(): 92.5}
+        await self._add_grades(repository, exam_id, competitor_id, scores)
+
+        result = await repository.get_weighted_average(exam_id, competitor_id, {})
+
+        assert result == python_weighted_average(scores, {})
+
+    @pytest.mark.asyncio
+    async def test_all_zero_weights_return_none(
+        self, db_session: AsyncSession, exam_id: UUID, competitor_id: UUID
+    ) -> None:
+        """Test a total weight of zero yields None instead of dividing by zero."""
+        repository = SQLAlchemyGradeRepository(db_session)
+        scores = {uuid4(): 70.0, uuid4(): 85.0}
+        await self._add_grades(repository, exam_id, competitor_id, scores)
+        weights = dict.fromkeys(scores, 0.0)
+
+        assert await repository.get_weighted_average(exam_id, competitor_id, weights) is None
+        assert python_weighted_average(scores, weights) is None
+
+    @pytest.mark.asyncio
+    async def test_no_grades_return_none(
+        self, db_session: AsyncSession, exam_id: UUID, competitor_id: UUID
+    ) -> None:
+        """Test a competitor without grades has no average."""
+        repository = SQLAlchemyGradeRepository(db_session)
+
+        assert await repository.get_weighted_average(exam_id, competitor_id, {}) is None
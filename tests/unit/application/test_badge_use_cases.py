@@ -0,0 +1,112 @@
+"""Unit tests for badge use cases."""
+
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from src.application.extras.use_cases.badge_use_cases import (
+    AwardBadgeUseCase,
+    ListBadgesUseCase,
+)
+from src.domain.extras.entities.badge import Achievement, Badge
+from src.domain.extras.exceptions import BadgeNotFoundException
+from src.domain.extras.repositories.badge_repository import (
+    AchievementRepository,
+    BadgeRepository,
+)
+from src.shared.constants.enums import BadgeCategory
+
+
+class TestGetUserAchievements:
+    """Tests for ListBadgesUseCase.get_user_achievements."""
+
+    @pytest.mark.asyncio
+    async def test_badges_loaded_in_one_batch(self) -> None:
+        """Test badges are fetched once for all achievements."""
+        user_id = uuid4()
+        badge = Badge(name="First", description="First step", category=BadgeCategory.TRAINING)
+        achievements = [
+            Achievement(badge_id=badge.id, user_id=user_id),
+            Achievement(badge_id=badge.id, user_id=user_id),
+            Achievement(badge_id=uuid4(), user_id=user_id),
+        ]
+        badge_repository = AsyncMock(spec=BadgeRepository)
+        badge_repository.get_by_ids.return_value = {badge.id: badge}
+        achievement_repository = AsyncMock(spec=AchievementRepository)
+        achievement_repository.get_by_user.return_value = achievements
+        use_case = ListBadgesUseCase(badge_repository, achievement_repository)
+
+        result = await use_case.get_user_achievements(user_id)
+
+        badge_repository.get_by_ids.assert_awaited_once_with(
+            [badge.id, achievements[2].badge_id]
+        )
+        badge_repository.get_by_id.assert_not_called()
+        assert [dto.badge.id if dto.badge else None for dto in result] == [
+            badge.id,
+            badge.id,
+            None,
+        ]
+
+
+class TestGetOrRaise:
+    """Tests for BadgeRepository.get_or_raise."""
+
+    @pytest.mark.asyncio
+    async def test_returns_found_badge(self) -> None:
+        """Test an existing badge is returned."""
+        badge = Badge(name="First", description="First step", category=BadgeCategory.TRAINING)
+        repository = AsyncMock(spec=BadgeRepository)
+        repository.get_by_id.return_value = badge
+
+        assert await BadgeRepository.get_or_raise(repository, badge.id) is badge
+
+    @pytest.mark.asyncio
+    async def test_missing_badge_raises(self) -> None:
+        """Test a missing badge raises the not-found exception."""
+        repository = AsyncMock(spec=BadgeRepository)
+        repository.get_by_id.return_value = None
+
+        with pytest.raises(BadgeNotFoundException):
+            await BadgeRepository.get_or_raise(repository, uuid4())
+
+
+class TestAwardMany:
+    """Tests for AwardBadgeUseCase.award_many."""
+
+    @pytest.mark.asyncio
+    async def test_awards_only_unearned_badges_in_batches(self) -> None:
+        """Test ownership is checked once and new achievements are saved together."""
+        user_id = uuid4()
+        owned = Badge(name="Owned", description="d", category=BadgeCategory.TRAINING, points=10)
+        new = Badge(name="New", description="d", category=BadgeCategory.TRAINING, points=25)
+        badge_repository = AsyncMock(spec=BadgeRepository)
+        badge_repository.get_by_ids.return_value = {owned.id: owned, new.id: new}
+        achievement_repository = AsyncMock(spec=AchievementRepository)
+        achievement_repository.has_badges.return_value = {owned.id}
+        achievement_repository.save_many.side_effect = lambda achievements: list(achievements)
+        achievement_repository.get_user_points.return_value = None
+        use_case = AwardBadgeUseCase(badge_repository, achievement_repository)
+
+        result = await use_case.award_many(user_id, [owned.id, new.id, new.id])
+
+        achievement_repository.has_badges.assert_awaited_once_with(user_id, [owned.id, new.id])
+        achievement_repository.has_badge.assert_not_called()
+        assert [dto.badge_id for dto in result] == [new.id]
+        points = achievement_repository.save_user_points.await_args.args[0]
+        assert points.total_points == 25
+        assert points.badges_count == 1
+
+    @pytest.mark.asyncio
+    async def test_unknown_badge_raises(self) -> None:
+        """Test a missing badge aborts before anything is written."""
+        badge_repository = AsyncMock(spec=BadgeRepository)
+        badge_repository.get_by_ids.return_value = {}
+        achievement_repository = AsyncMock(spec=AchievementRepository)
+        use_case = AwardBadgeUseCase(badge_repository, achievement_repository)
+
+        with pytest.raises(BadgeNotFoundException):
+            await use_case.award_many(uuid4(), [uuid4()])
+
+        achievement_repository.save_many.assert_not_called()
@@ -0,0 +1,40 @@
+"""Unit tests for ListUsersUseCase."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.application.identity.use_cases.list_users import ListUsersUseCase
+from src.domain.identity.repositories.user_repository import UserRepository
+from src.shared.constants.enums import UserRole
+
+
+class TestListUsersUseCase:
+    """Tests for ListUsersUseCase."""
+
+    @pytest.fixture
+    def mock_user_repository(self):
+        """Create mock user repository."""
+        repo = AsyncMock(spec=UserRepository)
+        repo.get_all.return_value = []
+        repo.get_by_role.return_value = []
+        repo.count.return_value = 10
+        repo.count_by_role.return_value = 3
+        return repo
+
+    @pytest.mark.asyncio
+    async def test_total_counts_only_the_filtered_role(self, mock_user_repository):
+        """Test the total of a role-filtered listing counts that role only."""
+        result = await ListUsersUseCase(mock_user_repository).execute(role=UserRole.EVALUATOR)
+
+        assert result.total == 3
+        mock_user_repository.count_by_role.assert_awaited_once_with(UserRole.EVALUATOR)
+        mock_user_repository.count.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_total_counts_all_users_without_filter(self, mock_user_repository):
+        """Test the total of an unfiltered listing counts every user."""
+        result = await ListUsersUseCase(mock_user_repository).execute()
+
+        assert result.total == 10
+        mock_user_repository.count_by_role.assert_not_called()
@@ -0,0 +1,33 @@
+"""Unit tests for notification use cases."""
+
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from src.application.extras.dtos.notification_dto import CreateNotificationDTO
+from src.application.extras.use_cases.notification_use_cases import SendNotificationUseCase
+from src.domain.extras.repositories.notification_repository import NotificationRepository
+from src.shared.constants.enums import NotificationStatus
+
+
+class TestSendNotificationUseCase:
+    """Tests for SendNotificationUseCase."""
+
+    @pytest.mark.asyncio
+    async def test_execute_many_saves_in_one_batch(self) -> None:
+        """Test a fan-out is written with a single save_many call."""
+        repository = AsyncMock(spec=NotificationRepository)
+        repository.save_many.side_effect = lambda notifications: list(notifications)
+        use_case = SendNotificationUseCase(repository)
+        dtos = [
+            CreateNotificationDTO(user_id=uuid4(), title="Event", message="Starts soon")
+            for _ in range(3)
+        ]
+
+        result = await use_case.execute_many(dtos)
+
+        repository.save_many.assert_awaited_once()
+        repository.save.assert_not_called()
+        assert [r.user_id for r in result] == [d.user_id for d in dtos]
+        assert all(r.status == NotificationStatus.SENT for r in result)
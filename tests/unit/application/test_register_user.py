@@ -121,3 +121,4 @@ class TestRegisterUserUseCase:
 
         with pytest.raises(InvalidValueException):
             await use_case.execute(dto)
+
@@ -1,5 +1,7 @@
 """Unit tests for Assessment entities and value objects."""
 
+import pickle
+import statistics
 from datetime import date
 from uuid import uuid4
 
@@ -8,6 +10,8 @@ import pytest
 from src.domain.assessment.entities.exam import Exam
 from src.domain.assessment.entities.grade import Grade
 from src.domain.assessment.entities.grade_audit_log import GradeAuditLog
+from src.domain.assessment.exceptions import InsufficientGradesForStatisticsException
+from src.domain.assessment.services.grade_calculation_service import GradeCalculationService
 from src.domain.assessment.value_objects.score import Score
 from src.shared.constants.enums import AssessmentType
 from src.shared.exceptions import InvalidValueException
@@ -52,6 +56,32 @@ class TestScore:
         score2 = Score(85.5)
         assert score1 == score2
 
+    def test_score_instances_are_interned(self):
+        """Test equal percentage scores share one instance."""
+        assert Score(85.5) is Score(85.499)
+        assert Score(250.0) is not Score(250.0)
+        assert Score(250.0) == Score(250.0)
+
+    def test_interned_score_still_validates(self):
+        """Test interning does not bypass range validation."""
+        Score(0.0)
+        with pytest.raises(InvalidValueException):
+            Score(-0.001)
+
+    def test_score_survives_pickle(self):
+        """Test Score can be pickled despite the custom constructor."""
+        assert pickle.loads(pickle.dumps(Score(42.0))) is Score(42.0)
+
+    def test_score_hash_matches_equality(self):
+        """Test equal scores hash alike and deduplicate in sets."""
+        assert hash(Score(250.0)) == hash(Score(250.0))
+        assert len({Score(250.0), Score(250.0), Score(80.0)}) == 2
+        assert Score(80.0) != 80.0
+
+    def test_score_is_slotted(self):
+        """Test Score carries no per-instance __dict__."""
+        assert not hasattr(Score(42.0), "__dict__")
+
     def test_score_to_absolute(self):
         """Test converting score to absolute value."""
         score = Score(85.0)  # 85%
@@ -167,6 +197,19 @@ class TestExam:
         valid_exam.activate()
         assert valid_exam.is_active is True
 
+    def test_exam_equality_by_id(self, valid_exam):
+        """Test exams with the same ID are equal and deduplicate in sets."""
+        copy = Exam(
+            id=valid_exam.id,
+            name="Other name",
+            modality_id=uuid4(),
+            assessment_type=AssessmentType.PRACTICAL,
+            exam_date=date(2024, 3, 1),
+            created_by=uuid4(),
+        )
+        assert copy == valid_exam
+        assert len({valid_exam, copy}) == 1
+
 
 class TestGrade:
     """Tests for Grade entity."""
@@ -213,6 +256,19 @@ class TestGrade:
         absolute = valid_grade.absolute_score(max_score=200.0)
         assert absolute == 171.0  # 85.5% of 200
 
+    def test_grade_not_equal_to_other_entity_with_same_id(self, valid_grade):
+        """Test grade equality is restricted to grades."""
+        exam = Exam(
+            id=valid_grade.id,
+            name="Exam",
+            modality_id=uuid4(),
+            assessment_type=AssessmentType.SIMULATION,
+            exam_date=date(2024, 2, 15),
+            created_by=uuid4(),
+        )
+        assert valid_grade != exam
+        assert hash(valid_grade) == hash(valid_grade.id)
+
 
 class TestGradeAuditLog:
     """Tests for GradeAuditLog entity."""
@@ -263,6 +319,60 @@ class TestGradeAuditLog:
         assert audit.new_notes == "Updated notes"
         assert audit.changed_by == updater_id
 
+    def test_audit_log_is_slotted(self):
+        """Test audit log records carry no per-instance __dict__."""
+        audit = GradeAuditLog.create_for_new_grade(
+            grade_id=uuid4(),
+            score=70.0,
+            notes=None,
+            created_by=uuid4(),
+        )
+
+        assert not hasattr(audit, "__dict__")
+        assert audit.created_at == audit.updated_at == audit.changed_at
+
+
+class TestGradeCalculationService:
+    """Tests for GradeCalculationService statistics."""
+
+    @pytest.fixture
+    def service(self):
+        """Create a service; statistics helpers need no repositories."""
+        return GradeCalculationService(grade_repository=None, exam_repository=None)
+
+    @pytest.mark.parametrize(
+        "scores",
+        [
+            [72.5],
+            [80.0, 60.0],
+            [55.25, 91.0, 78.5, 78.5, 64.75],
+            [100.0, 0.0, 33.33, 66.67, 50.0, 12.5],
+        ],
+    )
+    def test_statistics_match_statistics_module(self, service, scores):
+        """Test statistics agree with the standard library implementation."""
+        stats = service._calculate_statistics(scores)
+
+        assert stats.count == len(scores)
+        assert stats.average == round(statistics.mean(scores), 2)
+        assert stats.median == round(statistics.median(scores), 2)
+        expected_std = round(statistics.stdev(scores), 2) if len(scores) >= 2 else 0.0
+        assert stats.std_deviation == expected_std
+        assert stats.min_score == min(scores)
+        assert stats.max_score == max(scores)
+
+    def test_statistics_without_scores_raises(self, service):
+        """Test statistics on an empty score list raise."""
+        with pytest.raises(InsufficientGradesForStatisticsException):
+            service._calculate_statistics([])
+
+    def test_statistics_are_slotted(self, service):
+        """Test statistics results carry no per-instance __dict__."""
+        stats = service._calculate_statistics([80.0, 60.0])
+
+        assert not hasattr(stats, "__dict__")
+        assert stats.to_dict()["average"] == 70.0
+
 
 class TestAssessmentIntegration:
     """Integration tests for assessment entities working together."""
@@ -1,15 +1,15 @@
 """Unit tests for Extra features entities."""
 
-from datetime import date, datetime, timedelta
-from uuid import uuid4
+from datetime import UTC, date, datetime, time, timedelta
+from uuid import UUID, uuid4
 
 import pytest
 
 from src.domain.extras.entities.badge import Badge, UserPoints
-from src.domain.extras.entities.event import Event
+from src.domain.extras.entities.event import Event, Schedule
 from src.domain.extras.entities.feedback import Feedback
-from src.domain.extras.entities.goal import Goal, Milestone
-from src.domain.extras.entities.message import Conversation
+from src.domain.extras.entities.goal import Goal, Milestone, goals_needing_alert
+from src.domain.extras.entities.message import Conversation, Message
 from src.domain.extras.entities.notification import Notification
 from src.domain.extras.entities.resource import Resource
 from src.domain.extras.entities.training_plan import PlanItem, TrainingPlan
@@ -18,8 +18,10 @@ from src.shared.constants.enums import (
     BadgeRarity,
     EventStatus,
     EventType,
+    FeedbackContext,
     FeedbackType,
     GoalStatus,
+    MessageType,
     NotificationStatus,
     NotificationType,
     ResourceAccessLevel,
@@ -83,6 +85,12 @@ class TestNotification:
 
         assert notification.notification_type == NotificationType.ALERT
 
+    def test_notification_is_slotted(self):
+        """Test Notification carries no per-instance __dict__."""
+        notification = Notification(user_id=uuid4(), title="Test", message="Test")
+
+        assert not hasattr(notification, "__dict__")
+
 
 class TestEvent:
     """Tests for Event entity."""
@@ -108,6 +116,16 @@ class TestEvent:
         """Test event duration calculation."""
         assert valid_event.duration_minutes == 120  # 2 hours
 
+    def test_update_recomputes_duration_and_reminder(self, valid_event):
+        """Test rescheduling refreshes the derived duration and reminder."""
+        assert valid_event.needs_reminder() is False
+
+        start = datetime.utcnow() + timedelta(minutes=10)
+        valid_event.update(start_datetime=start, end_datetime=start + timedelta(minutes=45))
+
+        assert valid_event.duration_minutes == 45
+        assert valid_event.needs_reminder() is True
+
     def test_add_participant(self, valid_event):
         """Test adding participant."""
         user_id = uuid4()
@@ -124,6 +142,64 @@ class TestEvent:
 
         assert result is False
 
+    def test_remove_participant_keeps_join_order(self, valid_event):
+        """Test removing a participant preserves the order of the others."""
+        first, second, third = uuid4(), uuid4(), uuid4()
+        for user_id in (first, second, third):
+            valid_event.add_participant(user_id)
+
+        assert valid_event.remove_participant(second) is True
+        assert valid_event.remove_participant(second) is False
+        assert valid_event.participants == (first, third)
+
+    def test_event_without_participants(self, valid_event):
+        """Test an event with no participants behaves as an empty collection."""
+        assert valid_event.participants == ()
+        assert valid_event.remove_participant(uuid4()) is False
+
+    def test_event_overlaps(self, valid_event):
+        """Test overlap detection between event time spans."""
+        start = valid_event.start_datetime
+        overlapping = Event(
+            title="Overlapping",
+            start_datetime=start + timedelta(hours=1),
+            end_datetime=start + timedelta(hours=3),
+            created_by=uuid4(),
+        )
+        adjacent = Event(
+            title="Adjacent",
+            start_datetime=valid_event.end_datetime,
+            end_datetime=valid_event.end_datetime + timedelta(hours=1),
+            created_by=uuid4(),
+        )
+
+        assert valid_event.overlaps(overlapping) is True
+        assert overlapping.overlaps(valid_event) is True
+        assert valid_event.overlaps(adjacent) is False
+
+    def test_event_naive_times_are_read_as_utc(self, valid_event):
+        """Test naive and UTC-aware datetimes yield the same POSIX span."""
+        aware = Event(
+            title="Aware",
+            start_datetime=valid_event.start_datetime.replace(tzinfo=UTC),
+            end_datetime=valid_event.end_datetime.replace(tzinfo=UTC),
+            created_by=uuid4(),
+        )
+
+        assert aware.start_ts == valid_event.start_ts
+        assert aware.end_ts == valid_event.end_ts
+
+    def test_event_hour_buckets(self, valid_event):
+        """Test hour buckets cover the whole event span."""
+        buckets = valid_event.hour_buckets()
+
+        assert buckets[0] == int(valid_event.start_ts // 3600)
+        assert buckets[-1] == int(valid_event.end_ts // 3600)
+
+    def test_event_is_slotted(self, valid_event):
+        """Test Event carries no per-instance __dict__."""
+        assert not hasattr(valid_event, "__dict__")
+
     def test_event_cancel(self, valid_event):
         """Test canceling event."""
         valid_event.cancel()
@@ -135,6 +211,27 @@ class TestEvent:
         assert valid_event.is_upcoming() is True
 
 
+class TestSchedule:
+    """Tests for Schedule entity."""
+
+    def test_is_active_at(self):
+        """Test weekly window matching is half-open and respects activation."""
+        schedule = Schedule(
+            name="Morning Practice",
+            user_id=uuid4(),
+            day_of_week=0,
+            start_time=time(8, 0),
+            end_time=time(10, 30),
+        )
+
+        assert schedule.is_active_at(0, 8 * 60) is True
+        assert schedule.is_active_at(0, 10 * 60 + 30) is False
+        assert schedule.is_active_at(1, 9 * 60) is False
+
+        schedule.deactivate()
+        assert schedule.is_active_at(0, 9 * 60) is False
+
+
 class TestResource:
     """Tests for Resource entity."""
 
@@ -151,6 +248,28 @@ class TestResource:
         assert resource.resource_type == ResourceType.PDF
         assert resource.is_active
 
+    def test_noop_update_keeps_timestamp(self):
+        """Test an update that changes nothing leaves updated_at untouched."""
+        stamp = datetime(2024, 1, 1)
+        resource = Resource(
+            title="Test",
+            resource_type=ResourceType.LINK,
+            created_by=uuid4(),
+            updated_at=stamp,
+        )
+
+        resource.update(title="Test", access_level=resource.access_level)
+        assert resource.updated_at == stamp
+
+        resource.update(title="Renamed")
+        assert resource.updated_at > stamp
+
+    def test_resource_is_slotted(self):
+        """Test Resource carries no per-instance __dict__."""
+        resource = Resource(title="Test", resource_type=ResourceType.LINK, created_by=uuid4())
+
+        assert not hasattr(resource, "__dict__")
+
     def test_add_tag(self):
         """Test adding tags."""
         resource = Resource(
@@ -175,6 +294,35 @@ class TestResource:
         result = resource.add_tag("python")
         assert result is False
 
+    def test_tags_are_normalized(self):
+        """Test tags are trimmed and lower-cased on add and remove."""
+        resource = Resource(
+            title="Test",
+            resource_type=ResourceType.LINK,
+            created_by=uuid4(),
+        )
+
+        assert resource.add_tag("  Python ") is True
+        assert resource.add_tag("python") is False
+        assert resource.add_tag("   ") is False
+        assert resource.remove_tag("PYTHON") is True
+        assert resource.tags == ()
+
+    def test_remove_tag_keeps_order(self):
+        """Test tags keep insertion order and drop duplicates."""
+        resource = Resource(
+            title="Test",
+            resource_type=ResourceType.LINK,
+            created_by=uuid4(),
+            tags=["python", "sql", "python", "docker"],
+        )
+
+        assert resource.tags == ("python", "sql", "docker")
+        assert resource.tags is resource.tags
+        assert resource.remove_tag("sql") is True
+        assert resource.remove_tag("sql") is False
+        assert resource.tags == ("python", "docker")
+
     def test_can_access_public(self):
         """Test access to public resource."""
         resource = Resource(
@@ -252,6 +400,57 @@ class TestGoal:
         """Test days remaining calculation."""
         assert valid_goal.days_remaining == 30
 
+    def test_overdue_checks_accept_reference_date(self, valid_goal):
+        """Test overdue checks can be evaluated against a given date."""
+        later = date.today() + timedelta(days=31)
+
+        assert valid_goal.is_overdue_on(later) is True
+        assert valid_goal.days_remaining_on(later) == -1
+        assert valid_goal.needs_alert(today=later) is True
+
+    def test_goals_needing_alert(self, valid_goal):
+        """Test bulk alert selection matches the per-goal rules."""
+        today = date.today()
+        due_soon = Goal(
+            title="Due Soon",
+            competitor_id=uuid4(),
+            created_by=uuid4(),
+            due_date=today + timedelta(days=3),
+        )
+        behind = Goal(
+            title="Behind Schedule",
+            competitor_id=uuid4(),
+            created_by=uuid4(),
+            start_date=today - timedelta(days=30),
+            due_date=today + timedelta(days=10),
+        )
+        goals = [valid_goal, due_soon, behind]
+
+        assert goals_needing_alert(goals, today=today) == [due_soon, behind]
+        assert [g.needs_alert() for g in goals] == [False, True, True]
+
+    def test_progress_and_schedule_follow_updates(self):
+        """Test cached progress and schedule length track goal changes."""
+        today = date.today()
+        goal = Goal(
+            title="Behind Schedule",
+            competitor_id=uuid4(),
+            created_by=uuid4(),
+            target_value=0.0,
+            start_date=today - timedelta(days=30),
+            due_date=today + timedelta(days=10),
+        )
+        assert goal.progress_percentage == 0.0
+        assert goal.needs_alert(today=today) is True
+
+        goal.update(target_value=10.0, due_date=today + timedelta(days=60))
+        goal.update_progress(5.0)
+        assert goal.progress_percentage == 50.0
+        assert goal.needs_alert(today=today) is False
+
+        goal.complete()
+        assert goal.progress_percentage == 100.0
+
     def test_add_milestone(self, valid_goal):
         """Test adding milestone."""
         milestone = Milestone(
@@ -264,6 +463,46 @@ class TestGoal:
 
         assert len(valid_goal.milestones) == 1
 
+    def test_remove_milestone(self, valid_goal):
+        """Test removing milestones by id keeps the others in order."""
+        milestones = [
+            Milestone(goal_id=valid_goal.id, title=f"Milestone {i}", target_value=10.0)
+            for i in range(3)
+        ]
+        for milestone in milestones:
+            valid_goal.add_milestone(milestone)
+
+        assert valid_goal.remove_milestone(milestones[1].id) is True
+        assert valid_goal.remove_milestone(milestones[1].id) is False
+        assert valid_goal.milestones == (milestones[0], milestones[2])
+
+    def test_goal_without_milestones(self, valid_goal):
+        """Test a goal with no milestones behaves as an empty collection."""
+        assert valid_goal.milestones == ()
+        assert valid_goal.completed_milestones == 0
+        assert valid_goal.remove_milestone(uuid4()) is False
+
+    def test_completed_milestones_tracks_transitions(self, valid_goal):
+        """Test the completed count follows completion, re-adds and removal."""
+        done = Milestone(
+            goal_id=valid_goal.id, title="Done", target_value=10.0, is_completed=True
+        )
+        pending = Milestone(goal_id=valid_goal.id, title="Pending", target_value=10.0)
+        valid_goal.add_milestone(done)
+        valid_goal.add_milestone(pending)
+        assert valid_goal.completed_milestones == 1
+
+        valid_goal.milestones[1].update_progress(10.0)
+        pending.complete()  # Completing twice counts once
+        assert valid_goal.completed_milestones == 2
+
+        valid_goal.add_milestone(done)  # Re-adding replaces, not duplicates
+        assert valid_goal.completed_milestones == 2
+
+        valid_goal.remove_milestone(done.id)
+        done.complete()  # Detached milestones no longer affect the goal
+        assert valid_goal.completed_milestones == 1
+
 
 class TestBadge:
     """Tests for Badge entity."""
@@ -303,6 +542,30 @@ class TestBadge:
         assert badge.category == BadgeCategory.PERFORMANCE
         assert badge.criteria["score_required"] == 90.0
 
+    def test_badge_created_at_is_timezone_aware(self):
+        """Test default timestamps are aware UTC datetimes."""
+        badge = Badge(name="Badge", description="Desc", category=BadgeCategory.TRAINING)
+
+        assert badge.created_at.tzinfo is not None
+
+    def test_badge_criteria_is_read_only(self):
+        """Test criteria is exposed as a read-only view."""
+        badge = Badge.create_training_badge(
+            name="Trainee",
+            description="Desc",
+            hours_required=10,
+        )
+
+        assert badge.criteria is badge.criteria
+        with pytest.raises(TypeError):
+            badge.criteria["hours_required"] = 0
+
+    def test_badge_is_slotted(self):
+        """Test Badge carries no per-instance __dict__."""
+        badge = Badge(name="Badge", description="Desc", category=BadgeCategory.TRAINING)
+
+        assert not hasattr(badge, "__dict__")
+
 
 class TestUserPoints:
     """Tests for UserPoints entity."""
@@ -330,6 +593,20 @@ class TestUserPoints:
         assert leveled_up is True
         assert points.level == 2
 
+    def test_points_to_next_level(self):
+        """Test points to next level track the level thresholds."""
+        points = UserPoints(user_id=uuid4())
+        assert points.points_to_next_level == 100
+
+        points.add_points(150)
+
+        assert points.level == 2
+        assert points.points_to_next_level == 50
+
+    def test_user_points_is_slotted(self):
+        """Test UserPoints carries no per-instance __dict__."""
+        assert not hasattr(UserPoints(user_id=uuid4()), "__dict__")
+
 
 class TestConversation:
     """Tests for Conversation entity."""
@@ -376,6 +653,42 @@ class TestConversation:
         assert conv.get_unread_count(user2) == 1
         assert conv.get_unread_count(user1) == 0
 
+    def test_system_message_uses_nil_sender(self):
+        """Test system messages are sent by the nil UUID."""
+        message = Message.create_system_message(conversation_id=uuid4(), content="Joined")
+
+        assert message.sender_id == UUID(int=0)
+        assert message.message_type == MessageType.SYSTEM
+
+    def test_mark_as_read_resets_only_reader(self):
+        """Test marking as read clears the reader's count only."""
+        user1 = uuid4()
+        user2 = uuid4()
+        conv = Conversation(participant_1=user1, participant_2=user2)
+        conv.add_message(user1)
+        conv.add_message(user2)
+        conv.add_message(uuid4())  # Non-participant is ignored
+
+        conv.mark_as_read(user2)
+
+        assert conv.get_unread_count(user2) == 0
+        assert conv.get_unread_count(user1) == 1
+        assert conv.get_other_participant(uuid4()) is None
+
+    def test_conversation_is_slotted(self):
+        """Test Conversation carries no per-instance __dict__."""
+        conv = Conversation(participant_1=uuid4(), participant_2=uuid4())
+
+        assert not hasattr(conv, "__dict__")
+
+    def test_add_message_stamps_both_timestamps_alike(self):
+        """Test last message and update timestamps share one clock read."""
+        conv = Conversation(participant_1=uuid4(), participant_2=uuid4())
+
+        conv.add_message(conv.participant_1)
+
+        assert conv.last_message_at == conv.updated_at
+
 
 class TestFeedback:
     """Tests for Feedback entity."""
@@ -403,6 +716,20 @@ class TestFeedback:
         )
 
         assert feedback.related_context == "grade"
+        assert feedback.context is FeedbackContext.GRADE
+
+    def test_feedback_context_prefers_most_specific(self):
+        """Test the most specific attached id decides the context."""
+        feedback = Feedback(
+            competitor_id=uuid4(),
+            evaluator_id=uuid4(),
+            content="Keep practicing",
+            competence_id=uuid4(),
+            training_id=uuid4(),
+        )
+
+        assert feedback.context is FeedbackContext.TRAINING
+        assert feedback.related_context == "training"
 
     def test_mark_as_read(self):
         """Test marking feedback as read."""
@@ -428,6 +755,15 @@ class TestFeedback:
 
         assert feedback.rating == 5
 
+    @pytest.mark.parametrize(("rating", "expected"), [(0, 1), (3, 3), (None, None)])
+    def test_set_rating_clamps(self, rating, expected):
+        """Test ratings are clamped to 1-5 and may be cleared."""
+        feedback = Feedback(competitor_id=uuid4(), evaluator_id=uuid4(), content="Test")
+
+        feedback.set_rating(rating)
+
+        assert feedback.rating == expected
+
 
 class TestTrainingPlan:
     """Tests for TrainingPlan entity."""
@@ -461,6 +797,13 @@ class TestTrainingPlan:
         assert len(valid_plan.items) == 1
         assert valid_plan.total_hours == 2.0
 
+    def test_plan_and_items_are_slotted(self, valid_plan):
+        """Test TrainingPlan and PlanItem carry no per-instance __dict__."""
+        item = PlanItem(plan_id=valid_plan.id, title="Practice", duration_hours=1.0)
+
+        assert not hasattr(valid_plan, "__dict__")
+        assert not hasattr(item, "__dict__")
+
     def test_progress_percentage(self, valid_plan):
         """Test progress calculation."""
         item1 = PlanItem(
@@ -480,6 +823,97 @@ class TestTrainingPlan:
 
         assert valid_plan.progress_percentage == 50.0
 
+    def test_hour_totals_do_not_depend_on_history(self, valid_plan):
+        """Test removing and un-completing items leaves no float residue."""
+        short = PlanItem(plan_id=valid_plan.id, title="Short", duration_hours=0.1)
+        long = PlanItem(plan_id=valid_plan.id, title="Long", duration_hours=0.2)
+        valid_plan.add_item(short)
+        valid_plan.add_item(long)
+
+        short.complete()
+        long.complete()
+        short.uncomplete()
+        long.uncomplete()
+        assert valid_plan.completed_hours == 0
+
+        valid_plan.remove_item(short.id)
+        assert valid_plan.total_hours == 0.2
+
+    def test_aggregates_follow_item_changes(self, valid_plan):
+        """Test running totals track item completion, updates and removal."""
+        item1 = PlanItem(plan_id=valid_plan.id, title="Item 1", duration_hours=2.0)
+        item2 = PlanItem(
+            plan_id=valid_plan.id, title="Item 2", duration_hours=3.0, is_required=False
+        )
+        valid_plan.add_item(item1)
+        valid_plan.add_item(item2)
+        assert valid_plan.required_items_completed is False
+
+        item1.complete()
+        item1.update(duration_hours=4.0)
+        assert valid_plan.total_hours == 7.0
+        assert valid_plan.completed_hours == 4.0
+        assert valid_plan.required_items_completed is True
+
+        item1.uncomplete()
+        assert valid_plan.completed_hours == 0.0
+        assert valid_plan.remove_item(item1.id) is True
+        assert valid_plan.total_hours == 3.0
+        assert valid_plan.required_items_completed is True
+
+        item1.complete()
+        assert valid_plan.progress_percentage == 0.0
+
+    def test_reorder_and_remove_items(self, valid_plan):
+        """Test reordering drops unlisted items and removal is by id."""
+        items = [
+            PlanItem(plan_id=valid_plan.id, title=f"Item {i}", duration_hours=1.0)
+            for i in range(3)
+        ]
+        for item in items:
+            valid_plan.add_item(item)
+
+        valid_plan.reorder_items([items[2].id, items[0].id])
+        assert valid_plan.items == [items[2], items[0]]
+        assert valid_plan.total_hours == 2.0
+
+        assert valid_plan.remove_item(items[2].id) is True
+        assert valid_plan.remove_item(items[2].id) is False
+        assert valid_plan.items == [items[0]]
+
+    def test_items_stay_sorted_by_order(self, valid_plan):
+        """Test items added out of order are returned sorted by order."""
+        third = PlanItem(plan_id=valid_plan.id, title="Third", order=3)
+        first = PlanItem(plan_id=valid_plan.id, title="First", order=1)
+        second = PlanItem(plan_id=valid_plan.id, title="Second", order=2)
+        for item in (third, first, second):
+            valid_plan.add_item(item)
+
+        assert valid_plan.items == [first, second, third]
+        first.complete()
+        assert valid_plan.get_next_item() is second
+
+        tie = PlanItem(plan_id=valid_plan.id, title="Tie", order=2)
+        valid_plan.add_item(tie)
+        assert valid_plan.items == [first, second, tie, third]
+        assert valid_plan.remove_item(tie.id) is True
+        assert valid_plan.items == [first, second, third]
+
+    def test_overdue_items_accept_reference_date(self, valid_plan):
+        """Test overdue checks can be evaluated against a given date."""
+        due = date.today() + timedelta(days=5)
+        pending = PlanItem(plan_id=valid_plan.id, title="Pending", due_date=due)
+        done = PlanItem(plan_id=valid_plan.id, title="Done", due_date=due)
+        valid_plan.add_item(pending)
+        valid_plan.add_item(done)
+        done.complete()
+        later = due + timedelta(days=1)
+
+        assert valid_plan.get_overdue_items() == []
+        assert valid_plan.get_overdue_items(later) == [pending]
+        assert pending.is_overdue_on(later) is True
+        assert done.is_overdue_on(later) is False
+
     def test_activate_plan(self, valid_plan):
         """Test activating plan."""
         valid_plan.activate()
@@ -558,3 +992,14 @@ class TestPlanItem:
 
         assert result is True
         assert resource_id in item.resource_ids
+
+    def test_item_without_resources(self):
+        """Test an item with no resources behaves as an empty collection."""
+        item = PlanItem(plan_id=uuid4(), title="Test")
+        resource_id = uuid4()
+
+        assert item.resource_ids == ()
+        assert item.remove_resource(resource_id) is False
+        assert item.add_resource(resource_id) is True
+        assert item.add_resource(resource_id) is False
+        assert item.resource_ids == (resource_id,)
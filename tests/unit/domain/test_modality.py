@@ -192,6 +192,10 @@ class TestCompetitor:
         assert valid_competitor.full_name == "Jane Doe"
         assert valid_competitor.phone == "+55 11 99999-9999"
 
+    def test_competitor_is_slotted(self, valid_competitor):
+        """Test Competitor carries no per-instance __dict__."""
+        assert not hasattr(valid_competitor, "__dict__")
+
 
 class TestEnrollment:
     """Tests for Enrollment entity."""
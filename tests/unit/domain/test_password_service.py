@@ -0,0 +1,31 @@
+"""Unit tests for the PasswordService interface."""
+
+import pytest
+
+from src.domain.identity.services.password_service import PasswordService
+
+
+class PlainPasswordService(PasswordService):
+    """Password service storing a readable marker instead of a real hash."""
+
+    def hash_password(self, plain_password: str) -> str:
+        return f"hashed:{plain_password}"
+
+    def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+        return hashed_password == f"hashed:{plain_password}"
+
+
+class TestVerifyPasswordBatch:
+    """Tests for PasswordService.verify_password_batch."""
+
+    @pytest.mark.asyncio
+    async def test_results_follow_input_order(self):
+        """Test each pair is verified and results keep the input order."""
+        pairs = [("a", "hashed:a"), ("b", "hashed:x"), ("c", "hashed:c")]
+
+        assert await PlainPasswordService().verify_password_batch(pairs) == [True, False, True]
+
+    @pytest.mark.asyncio
+    async def test_empty_batch(self):
+        """Test an empty batch verifies nothing."""
+        assert await PlainPasswordService().verify_password_batch([]) == []
@@ -4,6 +4,8 @@ from uuid import uuid4
 
 import pytest
 
+from src.domain.identity.entities.permission import Permission
+from src.domain.identity.entities.role import Role
 from src.domain.identity.entities.user import User
 from src.domain.identity.exceptions import UserInactiveException
 from src.domain.identity.value_objects.email import Email
@@ -40,6 +42,10 @@ class TestEmail:
         email = Email("test@example.com")
         assert email.local_part == "test"
 
+    def test_email_is_slotted(self):
+        """Test Email carries no per-instance __dict__."""
+        assert not hasattr(Email("test@example.com"), "__dict__")
+
     def test_invalid_email_raises_exception(self):
         """Test that invalid email raises exception."""
         with pytest.raises(InvalidValueException) as exc_info:
@@ -150,6 +156,7 @@ class TestUser:
         """Test suspending user."""
         valid_user.suspend()
         assert valid_user.status == UserStatus.SUSPENDED
+        assert valid_user.is_active is False
 
     def test_user_change_role(self, valid_user):
         """Test changing user role."""
@@ -168,6 +175,18 @@ class TestUser:
         with pytest.raises(UserInactiveException):
             valid_user.ensure_active()
 
+    def test_user_created_inactive(self):
+        """Test a user loaded with a non-active status is not active."""
+        user = User(
+            email=Email("test@example.com"),
+            password=Password("$2b$12$hashedpassword"),
+            full_name="Test User",
+            status=UserStatus.SUSPENDED,
+        )
+        assert user.is_active is False
+        with pytest.raises(UserInactiveException):
+            user.ensure_active()
+
     def test_super_admin_has_all_permissions(self):
         """Test that super admin has all permissions."""
         admin = User(
@@ -178,6 +197,10 @@ class TestUser:
         )
         assert admin.has_permission("any:permission") is True
 
+    def test_user_is_slotted(self, valid_user):
+        """Test User carries no per-instance __dict__."""
+        assert not hasattr(valid_user, "__dict__")
+
     def test_user_equality_by_id(self):
         """Test that users are equal by ID."""
         user_id = uuid4()
@@ -205,3 +228,31 @@ class TestUser:
         )
         assert admin.can_manage_role(UserRole.EVALUATOR) is True
         assert admin.can_manage_role(UserRole.COMPETITOR) is True
+
+
+class TestRole:
+    """Tests for Role entity."""
+
+    @staticmethod
+    def _permission(resource: str, action: str) -> Permission:
+        return Permission(
+            name=f"{resource} {action}", description="", resource=resource, action=action
+        )
+
+    def test_has_permission(self):
+        """Test permission lookup by code."""
+        role = Role(UserRole.EVALUATOR, "", permissions=[self._permission("grades", "read")])
+        assert role.has_permission("grades:read")
+        assert not role.has_permission("grades:write")
+
+    def test_add_and_remove_permission(self):
+        """Test that adding and removing keeps the lookup in sync."""
+        role = Role(UserRole.EVALUATOR, "")
+        role.add_permission(self._permission("grades", "write"))
+        role.add_permission(self._permission("grades", "write"))
+        assert role.has_permission("grades:write")
+        assert len(role.permissions) == 1
+
+        assert role.remove_permission("grades:write") is True
+        assert not role.has_permission("grades:write")
+        assert role.remove_permission("grades:write") is False
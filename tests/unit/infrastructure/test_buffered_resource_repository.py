@@ -0,0 +1,60 @@
+"""Unit tests for the write-coalescing resource repository."""
+
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from src.domain.extras.repositories.resource_repository import ResourceRepository
+from src.infrastructure.database.repositories.buffered_resource_repository import (
+    BufferedResourceRepository,
+    ResourceCounterBuffer,
+)
+
+
+class TestBufferedResourceRepository:
+    """Tests for BufferedResourceRepository."""
+
+    @pytest.mark.asyncio
+    async def test_increments_are_flushed_in_one_call(self) -> None:
+        """Test counter increments are summed and written by a single add_counts."""
+        inner = AsyncMock(spec=ResourceRepository)
+        repository = BufferedResourceRepository(inner, ResourceCounterBuffer())
+        first, second = uuid4(), uuid4()
+
+        for _ in range(3):
+            await repository.increment_view_count(first)
+        await repository.increment_download_count(first)
+        await repository.increment_download_count(second)
+
+        inner.increment_view_count.assert_not_called()
+        inner.increment_download_count.assert_not_called()
+
+        assert await repository.flush() == 2
+        inner.add_counts.assert_awaited_once_with({first: (3, 1), second: (0, 1)})
+
+    @pytest.mark.asyncio
+    async def test_flush_without_increments_skips_write(self) -> None:
+        """Test an empty buffer does not touch the database."""
+        inner = AsyncMock(spec=ResourceRepository)
+        repository = BufferedResourceRepository(inner, ResourceCounterBuffer())
+
+        assert await repository.flush() == 0
+        inner.add_counts.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_increments(self) -> None:
+        """Test increments survive a failed write and merge with newer ones."""
+        inner = AsyncMock(spec=ResourceRepository)
+        inner.add_counts.side_effect = RuntimeError("connection lost")
+        repository = BufferedResourceRepository(inner, ResourceCounterBuffer())
+        resource_id = uuid4()
+
+        await repository.increment_view_count(resource_id)
+        with pytest.raises(RuntimeError):
+            await repository.flush()
+        await repository.increment_view_count(resource_id)
+
+        inner.add_counts.side_effect = None
+        assert await repository.flush() == 1
+        inner.add_counts.assert_awaited_with({resource_id: (2, 0)})
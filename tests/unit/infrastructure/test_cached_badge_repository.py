@@ -0,0 +1,111 @@
+"""Unit tests for the caching badge and achievement repositories."""
+
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from src.domain.extras.entities.badge import Badge, UserPoints
+from src.domain.extras.repositories.badge_repository import (
+    AchievementRepository,
+    BadgeRepository,
+)
+from src.infrastructure.database.repositories import cached_badge_repository
+from src.infrastructure.database.repositories.cached_badge_repository import (
+    CachedAchievementRepository,
+    CachedBadgeRepository,
+)
+from src.shared.constants.enums import BadgeCategory
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Start every test with empty caches."""
+    cached_badge_repository._badge_cache.clear()
+    cached_badge_repository._leaderboard_cache.clear()
+    yield
+
+
+class TestCachedBadgeRepository:
+    """Tests for CachedBadgeRepository."""
+
+    @pytest.mark.asyncio
+    async def test_get_all_served_from_cache_until_write(self) -> None:
+        """Test listings hit the inner repository once until a badge changes."""
+        badge = Badge(name="First", description="First step", category=BadgeCategory.TRAINING)
+        inner = AsyncMock(spec=BadgeRepository)
+        inner.get_all.return_value = [badge]
+        inner.update.return_value = badge
+        repository = CachedBadgeRepository(inner)
+
+        assert await repository.get_all() == [badge]
+        assert await repository.get_all() == [badge]
+        assert inner.get_all.await_count == 1
+
+        await repository.update(badge)
+        await repository.get_all()
+        assert inner.get_all.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_by_category_shares_get_all_entries(self) -> None:
+        """Test category listings are cached under the get_all key."""
+        inner = AsyncMock(spec=BadgeRepository)
+        inner.get_all.return_value = []
+        repository = CachedBadgeRepository(inner)
+
+        await repository.get_by_category(BadgeCategory.TRAINING)
+        await repository.get_all(category=BadgeCategory.TRAINING)
+
+        inner.get_all.assert_awaited_once_with(BadgeCategory.TRAINING, None, True)
+        inner.get_by_category.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_callers_get_independent_badges(self) -> None:
+        """Test a caller changing a cached badge does not affect other callers."""
+        badge = Badge(name="First", description="First step", category=BadgeCategory.TRAINING)
+        inner = AsyncMock(spec=BadgeRepository)
+        inner.get_all.return_value = [badge]
+        repository = CachedBadgeRepository(inner)
+
+        (first,) = await repository.get_all()
+        first.update(name="Renamed")
+        (second,) = await repository.get_all()
+
+        assert second == badge
+        assert second is not first
+        assert second.name == "First"
+
+
+class TestCachedAchievementRepository:
+    """Tests for CachedAchievementRepository."""
+
+    @pytest.mark.asyncio
+    async def test_leaderboard_invalidated_by_points_change(self) -> None:
+        """Test saving user points drops the cached leaderboard."""
+        points = UserPoints(user_id=uuid4())
+        inner = AsyncMock(spec=AchievementRepository)
+        inner.get_leaderboard.return_value = [points]
+        inner.save_user_points.return_value = points
+        repository = CachedAchievementRepository(inner)
+
+        await repository.get_leaderboard(limit=10)
+        await repository.get_leaderboard(limit=10)
+        assert inner.get_leaderboard.await_count == 1
+
+        await repository.save_user_points(points)
+        await repository.get_leaderboard(limit=10)
+        assert inner.get_leaderboard.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_callers_get_independent_user_points(self) -> None:
+        """Test points added by one caller do not leak into the cached leaderboard."""
+        inner = AsyncMock(spec=AchievementRepository)
+        inner.get_leaderboard.return_value = [UserPoints(user_id=uuid4(), total_points=50)]
+        repository = CachedAchievementRepository(inner)
+
+        (first,) = await repository.get_leaderboard()
+        first.add_points(100)
+        (second,) = await repository.get_leaderboard()
+
+        assert second.total_points == 50
+        assert second.level == 1
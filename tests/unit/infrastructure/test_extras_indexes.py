@@ -0,0 +1,58 @@
+"""Index coverage checks for the extras tables.
+
+Every filter shape the extras repositories query by must be the leading
+columns of some index, so a new filter cannot be added without one.
+"""
+
+import pytest
+
+from src.infrastructure.database.base import Base
+from src.infrastructure.database.models import extras_model  # noqa: F401
+
+# (table, columns an index must start with), one entry per query shape.
+QUERY_SHAPES = [
+    ("notifications", ("user_id", "created_at", "id")),
+    ("notifications", ("user_id", "status")),
+    ("notifications", ("created_at",)),
+    ("events", ("modality_id", "start_datetime")),
+    ("events", ("start_datetime",)),
+    ("event_participants", ("user_id",)),
+    ("schedules", ("user_id", "day_of_week")),
+    ("resources", ("modality_id", "created_at", "id")),
+    ("resources", ("modality_id", "resource_type")),
+    ("resources", ("access_level",)),
+    ("goals", ("competitor_id", "created_at", "id")),
+    ("goals", ("competitor_id", "status")),
+    ("goals", ("due_date",)),
+    ("milestones", ("goal_id",)),
+    ("badges", ("category", "rarity")),
+    ("achievements", ("user_id", "badge_id")),
+    ("achievements", ("badge_id",)),
+    ("user_points", ("total_points",)),
+    ("conversations", ("participant_1",)),
+    ("conversations", ("participant_2",)),
+    ("messages", ("conversation_id", "created_at", "id")),
+    ("feedbacks", ("competitor_id", "created_at", "id")),
+    ("feedbacks", ("evaluator_id",)),
+    ("training_plans", ("competitor_id", "created_at", "id")),
+    ("training_plans", ("competitor_id", "status")),
+    ("plan_items", ("plan_id", "order")),
+]
+
+
+def _leading_columns(table_name: str) -> list[tuple[str, ...]]:
+    table = Base.metadata.tables[table_name]
+    keys = [tuple(c.name for c in index.columns) for index in table.indexes]
+    keys.append(tuple(c.name for c in table.primary_key.columns))
+    return keys
+
+
+class TestExtrasIndexes:
+    """Tests that extras query shapes are index-backed."""
+
+    @pytest.mark.parametrize(("table_name", "columns"), QUERY_SHAPES)
+    def test_query_shape_has_index(self, table_name: str, columns: tuple[str, ...]) -> None:
+        """Test an index starts with the filter columns of the query."""
+        assert any(
+            key[: len(columns)] == columns for key in _leading_columns(table_name)
+        ), f"no index on {table_name} starts with {columns}"
@@ -2,10 +2,15 @@
 
 from datetime import datetime
 from typing import Any
+from uuid import uuid4
+
+import pytest
 
 from src.shared.domain.aggregate_root import AggregateRoot, DomainEvent
 from src.shared.domain.entity import Entity
+from src.shared.domain.pagination import decode_cursor, encode_cursor, paginated
 from src.shared.domain.value_object import ValueObject
+from src.shared.exceptions.domain_exception import InvalidValueException
 
 
 class SampleValueObject(ValueObject):
@@ -199,3 +204,50 @@ class TestDomainEvent:
         """Test sample domain event."""
         event = SampleDomainEvent("test_type")
         assert event.event_type == "test_type"
+
+
+class TestPaginationCursor:
+    """Tests for keyset pagination cursors."""
+
+    def test_round_trip(self) -> None:
+        """Test decoding returns the encoded ordering key."""
+        timestamp = datetime(2024, 5, 1, 12, 30, 15, 123456)
+        row_id = uuid4()
+
+        cursor = encode_cursor(timestamp, row_id)
+
+        assert "=" not in cursor
+        assert decode_cursor(cursor) == (timestamp, row_id)
+
+    def test_malformed_cursor_raises(self) -> None:
+        """Test garbage cursors are rejected."""
+        with pytest.raises(InvalidValueException):
+            decode_cursor("not-a-cursor")
+
+
+class TestPaginated:
+    """Tests for the page size bound."""
+
+    @paginated(max_size=10)
+    async def _list(self, cursor: str | None = None, limit: int = 5) -> int:
+        return limit
+
+    @pytest.mark.asyncio
+    async def test_accepts_limits_within_bound(self) -> None:
+        """Test default, keyword and positional limits up to the bound pass."""
+        assert await self._list() == 5
+        assert await self._list(limit=10) == 10
+        assert await self._list(None, 1) == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("limit", [0, -1, 11])
+    async def test_rejects_limits_outside_bound(self, limit: int) -> None:
+        """Test limits outside 1..max_size are rejected."""
+        with pytest.raises(InvalidValueException):
+            await self._list(limit=limit)
+
+    @pytest.mark.asyncio
+    async def test_rejects_non_integer_limit(self) -> None:
+        """Test a non-integer limit is rejected rather than raising TypeError."""
+        with pytest.raises(InvalidValueException):
+            await self._list(limit="10")
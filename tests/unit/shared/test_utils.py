@@ -2,6 +2,7 @@
 
 from datetime import UTC, datetime
 
+from src.shared.utils.cache import TTLCache
 from src.shared.utils.date_utils import (
     add_days,
     add_minutes,
@@ -227,3 +228,49 @@ class TestValidators:
         """Test trimming whitespace."""
         result = sanitize_string("   spaced   ")
         assert result == "spaced"
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    def test_get_returns_stored_value(self):
+        """Test stored values are returned until they expire."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=4, ttl=60)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("missing") is None
+
+    def test_expired_entry_is_dropped(self):
+        """Test entries expire after the TTL."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=4, ttl=0)
+        cache.set("a", 1)
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test the least recently used entry is evicted at maxsize."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_invalidate(self):
+        """Test invalidating a single key and clearing the cache."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=4, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.invalidate("a")
+        cache.invalidate("missing")
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+        cache.clear()
+        assert len(cache) == 0